@@ -16,6 +16,9 @@ WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # import maya modules
 from maya import cmds
 
+# import local modules
+from plugins.reflectionLocator import calculate_reflection_points, calculate_reflection_matrices
+
 # define global functions
 hide_channels = lambda x: [cmds.setAttr(x + '.' + a, k=False, lock=True) for a in [''.join((t, f,)) for t in 'trs' for f in 'xyz'] + ['v']]
 
@@ -68,6 +71,39 @@ def create_mirror_vector(transform_node=None, selection=False):
     hide_channels(mirror_loc)
     connect_attr(reflection_vector_node, "mirror_vector", mirror_loc, "translate")
 
+def mirror_transforms(transform_nodes, plane_node, mirror_nodes=None, scale=1.0, orient=True):
+    """mirrors many transform nodes across the plane node at once, reading all the source world matrices first,
+    reflecting them in one batched call and committing the results as one undoable xform chunk
+    :param transform_nodes: (list, ) transform nodes to use as the source vectors
+    :param plane_node: (str, ) the plane transform node to mirror across
+    :param mirror_nodes: (list, ) the destination transform nodes, locators are created when not given
+    :param scale: (float, ) the mirror vector scale
+    :param orient: (bool, ) mirror the orientation as well as the position
+    :return: (list, ) the mirrored transform nodes
+    """
+    if not transform_nodes:
+        raise ValueError("Please specify transform nodes to create the mirror transforms")
+    if mirror_nodes and len(mirror_nodes) != len(transform_nodes):
+        raise ValueError("The mirror nodes must match the transform nodes")
+    plane_matrix = cmds.xform(plane_node, q=True, m=True, ws=True)
+    source_matrices = [cmds.xform(n, q=True, m=True, ws=True) for n in transform_nodes]
+    if orient:
+        mirror_values = calculate_reflection_matrices(plane_matrix, source_matrices, scale)
+    else:
+        mirror_values = calculate_reflection_points(plane_matrix, [m[12:15] for m in source_matrices], scale)
+    cmds.undoInfo(openChunk=True, chunkName="mirror_transforms")
+    try:
+        if not mirror_nodes:
+            mirror_nodes = [create_locator_node(name="{}_mirrorLoc".format(n)) for n in transform_nodes]
+        for mirror_node, value in zip(mirror_nodes, mirror_values):
+            if orient:
+                cmds.xform(mirror_node, m=value, ws=True)
+            else:
+                cmds.xform(mirror_node, t=value, ws=True)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return mirror_nodes
+
 def connect_attr(source_node, source_attr, destination_node, destination_attr):
     """connect source attribute to the destination attribute
     :param source_node: (str, ) the source node name
@@ -1,6 +1,11 @@
 """
 module for dealing with deformers in Maya.
 """
+# import standard modules
+import array
+import json
+import struct
+
 # import maya modules
 from maya import mel
 from maya import cmds
@@ -11,6 +16,13 @@ from maya import OpenMayaAnim
 from maya_utils import object_utils
 from maya_utils import mesh_utils
 
+# define local variables
+WEIGHT_FILE_MAGIC = b'AGDW'
+WEIGHT_FILE_VERSION = 1
+WEIGHT_FILE_EXT = 'dwt'
+# weightGeometryFilter node types from object_utils.node_types supported by the weight I/O functions
+WEIGHT_DEFORMER_TYPES = ('wire', 'cluster', 'deltaMush', 'bend', 'squash', 'sculpt', 'wrap', 'shrinkWrap')
+
 
 def load_deformer_weights(file_name="", deformer_name=""):
     """
@@ -300,4 +312,258 @@ def get_sets(mesh_name=""):
     :return:
     """
     sets_array = get_connected_object_sets(mesh_name)
-    return object_utils.convert_obj_array_to_string_array(sets_array)
\ No newline at end of file
+    return object_utils.convert_obj_array_to_string_array(sets_array)
+
+
+def is_weight_deformer(deformer_name=""):
+    """
+    checks if the deformer is one of the supported weightGeometryFilter nodes.
+    :param deformer_name: <str> the deformer node name.
+    :return: <bool> True for yes. <bool> False for no.
+    """
+    m_object = object_utils.get_m_obj(deformer_name)
+    for node_type in WEIGHT_DEFORMER_TYPES:
+        if m_object.hasFn(object_utils.node_types[node_type]):
+            return True
+    return False
+
+
+def _get_member_indices(m_dag, m_component):
+    """
+    gets the component indices of the deformer set member.
+    :param m_dag: <OpenMaya.MDagPath> the geometry dag path.
+    :param m_component: <OpenMaya.MObject> the set member components, null for the whole geometry.
+    :return: <array.array> int component indices.
+    """
+    indices = array.array('i')
+    if not m_component.isNull() and m_component.hasFn(OpenMaya.MFn.kSingleIndexedComponent):
+        m_indices = OpenMaya.MIntArray()
+        OpenMaya.MFnSingleIndexedComponent(m_component).getElements(m_indices)
+        indices.extend(m_indices[i] for i in range(m_indices.length()))
+    else:
+        geo_iter = OpenMaya.MItGeometry(m_dag, m_component)
+        while not geo_iter.isDone():
+            indices.append(geo_iter.index())
+            geo_iter.next()
+    return indices
+
+
+def _get_geometry_positions(m_dag):
+    """
+    gets all the geometry point positions in world space as a flat array.
+    :param m_dag: <OpenMaya.MDagPath> the geometry dag path.
+    :return: <array.array> float XYZ positions.
+    """
+    m_points = OpenMaya.MPointArray()
+    OpenMaya.MItGeometry(m_dag).allPositions(m_points, OpenMaya.MSpace.kWorld)
+    positions = array.array('f')
+    for i in range(m_points.length()):
+        m_point = m_points[i]
+        positions.extend((m_point.x, m_point.y, m_point.z))
+    return positions
+
+
+def _iter_deformer_members(deformer_name=""):
+    """
+    yields each geometry of the deformer set with its member components.
+    :param deformer_name: <str> the deformer node name.
+    :return: <generator> (OpenMaya.MDagPath, OpenMaya.MObject)
+    """
+    deform_fn = OpenMayaAnim.MFnGeometryFilter(object_utils.get_m_obj(deformer_name))
+    set_fn = OpenMaya.MFnSet(deform_fn.deformerSet())
+    members = OpenMaya.MSelectionList()
+    set_fn.getMembers(members, False)
+
+    sel_iter = OpenMaya.MItSelectionList(members)
+    while not sel_iter.isDone():
+        m_dag = OpenMaya.MDagPath()
+        m_component = OpenMaya.MObject()
+        sel_iter.getDagPath(m_dag, m_component)
+        yield m_dag, m_component
+        sel_iter.next()
+
+
+def get_deformer_weights(deformer_name="", positions=True):
+    """
+    gets the weights of every geometry on the deformer in bulk.
+    :param deformer_name: <str> the weightGeometryFilter deformer node name.
+    :param positions: <bool> if True, also get the world space point positions used for remapping.
+    :return: <dict> {geometry name: {'indices': <array.array>, 'weights': <array.array>, 'positions': <array.array>}}
+    """
+    weight_fn = OpenMayaAnim.MFnWeightGeometryFilter(object_utils.get_m_obj(deformer_name))
+    data = {}
+    for m_dag, m_component in _iter_deformer_members(deformer_name):
+        m_weights = OpenMaya.MFloatArray()
+        weight_fn.getWeights(m_dag, m_component, m_weights)
+        geo_data = {
+            'indices': _get_member_indices(m_dag, m_component),
+            'weights': array.array('f', (m_weights[i] for i in range(m_weights.length()))),
+            'positions': _get_geometry_positions(m_dag) if positions else array.array('f'),
+        }
+        data[m_dag.partialPathName()] = geo_data
+    return data
+
+
+def set_deformer_weights(deformer_name="", data=None, remap=True):
+    """
+    sets the weights of every geometry on the deformer in bulk, one setWeight call per geometry.
+    when the geometry point count differs from the stored positions, the weights are remapped by
+    the closest stored position.
+    :param deformer_name: <str> the weightGeometryFilter deformer node name.
+    :param data: <dict> weight data as returned by get_deformer_weights.
+    :param remap: <bool> remap the weights by position when the topology differs.
+    :return: <bool> True for success.
+    """
+    weight_fn = OpenMayaAnim.MFnWeightGeometryFilter(object_utils.get_m_obj(deformer_name))
+    for m_dag, m_component in _iter_deformer_members(deformer_name):
+        geo_name = m_dag.partialPathName()
+        if geo_name not in data:
+            continue
+        geo_data = data[geo_name]
+        indices = _get_member_indices(m_dag, m_component)
+        weight_map = dict(zip(geo_data['indices'], geo_data['weights']))
+
+        if remap and geo_data['positions']:
+            positions = _get_geometry_positions(m_dag)
+            if len(positions) != len(geo_data['positions']):
+                closest = remap_indices_by_position(geo_data['positions'], positions, indices)
+                weight_map = dict((index, weight_map.get(closest[i], 0.0)) for i, index in enumerate(indices))
+
+        m_weights = OpenMaya.MFloatArray()
+        for index in indices:
+            m_weights.append(weight_map.get(index, 0.0))
+        weight_fn.setWeight(m_dag, m_component, m_weights)
+    return True
+
+
+def remap_indices_by_position(source_positions, target_positions, target_indices=None, cell_size=None):
+    """
+    finds the closest source point index for each target point, using a uniform grid over the source points.
+    :param source_positions: <array.array> flat XYZ source positions.
+    :param target_positions: <array.array> flat XYZ target positions.
+    :param target_indices: <list> target point indices to remap, all target points when not given.
+    :param cell_size: <float> grid cell size, estimated from the source bounding box when not given.
+    :return: <list> closest source index for each target index.
+    """
+    source_count = len(source_positions) // 3
+    if target_indices is None:
+        target_indices = range(len(target_positions) // 3)
+    if not source_count:
+        return [0] * len(target_indices)
+
+    xs, ys, zs = source_positions[0::3], source_positions[1::3], source_positions[2::3]
+    if not cell_size:
+        extent = max(max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs))
+        # aim for a handful of points per cell
+        cell_size = (extent / max(source_count ** (1.0 / 3.0), 1.0)) or 1.0
+
+    grid = {}
+    for i in range(source_count):
+        key = (int(xs[i] // cell_size), int(ys[i] // cell_size), int(zs[i] // cell_size))
+        grid.setdefault(key, []).append(i)
+    min_cell = [min(k[a] for k in grid) for a in range(3)]
+    max_cell = [max(k[a] for k in grid) for a in range(3)]
+
+    closest = []
+    for index in target_indices:
+        x, y, z = target_positions[index * 3:index * 3 + 3]
+        cell = (int(x // cell_size), int(y // cell_size), int(z // cell_size))
+        max_ring = max(max(abs(cell[a] - min_cell[a]), abs(cell[a] - max_cell[a])) for a in range(3))
+        best_index, best_distance = 0, None
+        for ring in range(max_ring + 1):
+            # points in this ring and beyond are at least (ring - 1) * cell_size away
+            if best_distance is not None and best_distance <= ((ring - 1) * cell_size) ** 2:
+                break
+            for gx in range(cell[0] - ring, cell[0] + ring + 1):
+                for gy in range(cell[1] - ring, cell[1] + ring + 1):
+                    for gz in range(cell[2] - ring, cell[2] + ring + 1):
+                        if max(abs(gx - cell[0]), abs(gy - cell[1]), abs(gz - cell[2])) != ring:
+                            continue
+                        for i in grid.get((gx, gy, gz), ()):
+                            distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2 + (zs[i] - z) ** 2
+                            if best_distance is None or distance < best_distance:
+                                best_index, best_distance = i, distance
+        closest.append(best_index)
+    return closest
+
+
+def write_deformer_weights(file_name="", data=None, header=None):
+    """
+    writes the deformer weight data to a compact binary file.
+    the file holds a json header with the array lengths followed by the raw int and float arrays.
+    :param file_name: <str> the file path to write to.
+    :param data: <dict> weight data as returned by get_deformer_weights.
+    :param header: <dict> extra information to store in the header.
+    :return: <str> file name.
+    """
+    geometries = []
+    for geo_name in sorted(data):
+        geo_data = data[geo_name]
+        geometries.append({'name': geo_name,
+                           'indices': len(geo_data['indices']),
+                           'weights': len(geo_data['weights']),
+                           'positions': len(geo_data['positions'])})
+    header_data = dict(header or {})
+    header_data['geometries'] = geometries
+    header_bytes = json.dumps(header_data).encode('utf-8')
+
+    with open(file_name, 'wb') as f:
+        f.write(WEIGHT_FILE_MAGIC)
+        f.write(struct.pack('<II', WEIGHT_FILE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for geo_name in sorted(data):
+            geo_data = data[geo_name]
+            array.array('i', geo_data['indices']).tofile(f)
+            array.array('f', geo_data['weights']).tofile(f)
+            array.array('f', geo_data['positions']).tofile(f)
+    return file_name
+
+
+def read_deformer_weights(file_name=""):
+    """
+    reads the deformer weight data from a binary file written by write_deformer_weights.
+    :param file_name: <str> the file path to read from.
+    :return: <tuple> (header dictionary, weight data dictionary)
+    """
+    data = {}
+    with open(file_name, 'rb') as f:
+        if f.read(4) != WEIGHT_FILE_MAGIC:
+            raise IOError("[ReadDeformerWeights] :: Invalid deformer weights file: {}".format(file_name))
+        version, header_size = struct.unpack('<II', f.read(8))
+        if version > WEIGHT_FILE_VERSION:
+            raise IOError("[ReadDeformerWeights] :: Unsupported version {}: {}".format(version, file_name))
+        header = json.loads(f.read(header_size).decode('utf-8'))
+        for geo_header in header['geometries']:
+            geo_data = {'indices': array.array('i'), 'weights': array.array('f'), 'positions': array.array('f')}
+            for key in ('indices', 'weights', 'positions'):
+                geo_data[key].fromfile(f, geo_header[key])
+            data[geo_header['name']] = geo_data
+    return header, data
+
+
+def export_deformer_weights(deformer_name="", file_name="", header=None):
+    """
+    exports the weights of a weightGeometryFilter deformer to a binary file.
+    :param deformer_name: <str> the deformer node name.
+    :param file_name: <str> the file path to write to.
+    :param header: <dict> extra information to store in the header.
+    :return: <str> file name.
+    """
+    if not is_weight_deformer(deformer_name):
+        raise ValueError("[ExportDeformerWeights] :: Unsupported deformer: {}".format(deformer_name))
+    header_data = {'deformer': deformer_name, 'type': cmds.nodeType(deformer_name)}
+    header_data.update(header or {})
+    return write_deformer_weights(file_name, get_deformer_weights(deformer_name), header_data)
+
+
+def import_deformer_weights(deformer_name="", file_name="", remap=True):
+    """
+    imports the weights of a weightGeometryFilter deformer from a binary file.
+    :param deformer_name: <str> the deformer node name, the deformer stored in the file when not given.
+    :param file_name: <str> the file path to read from.
+    :param remap: <bool> remap the weights by position when the topology differs.
+    :return: <dict> the file header.
+    """
+    header, data = read_deformer_weights(file_name)
+    set_deformer_weights(deformer_name or header['deformer'], data, remap=remap)
+    return header
@@ -4,12 +4,14 @@ wire_utils for managing and manipulating wire deformers in Maya.
 """
 
 # import maya modules
+from maya import cmds
 from maya import OpenMaya
 from maya import OpenMayaAnim
 
 # import local modules
 from maya_utils import object_utils
 from maya_utils import mesh_utils
+from deformers import deform_utils
 
 
 def is_wire(object_name):
@@ -83,3 +85,86 @@ def get_deformer_fn(object_name=""):
         m_wire_obj = object_utils.get_m_obj(object_name)
     return OpenMayaAnim.MFnWireDeformer(m_wire_obj)
 
+
+def get_wire_curve_data(wire_name=""):
+    """
+    gets the influence curve data of the wire deformer.
+    :param wire_name: <str> wire deformer node name.
+    :return: <list> of dictionaries with the curve name, world space CVs, dropoff distance and scale.
+    """
+    wire_fn = get_deformer_fn(wire_name)
+    curves = []
+    for i in range(wire_fn.numWires()):
+        curve_path = OpenMaya.MDagPath()
+        OpenMaya.MDagPath.getAPathTo(wire_fn.wire(i), curve_path)
+        m_points = OpenMaya.MPointArray()
+        OpenMaya.MFnNurbsCurve(curve_path).getCVs(m_points, OpenMaya.MSpace.kWorld)
+        curves.append({
+            'name': curve_path.partialPathName(),
+            'cvs': [(m_points[c].x, m_points[c].y, m_points[c].z) for c in range(m_points.length())],
+            'dropoffDistance': wire_fn.wireDropOffDistance(i),
+            'scale': wire_fn.wireScale(i),
+        })
+    return curves
+
+
+def set_wire_curve_data(wire_name="", curves=(), set_cvs=False):
+    """
+    sets the influence curve settings of the wire deformer.
+    :param wire_name: <str> wire deformer node name.
+    :param curves: <list> curve data as returned by get_wire_curve_data.
+    :param set_cvs: <bool> if True, also moves the influence curve CVs to the stored positions.
+    :return: <bool> True for success.
+    """
+    wire_fn = get_deformer_fn(wire_name)
+    for i, curve_data in enumerate(curves[:wire_fn.numWires()]):
+        wire_fn.setWireDropOffDistance(i, curve_data['dropoffDistance'])
+        wire_fn.setWireScale(i, curve_data['scale'])
+        if set_cvs:
+            curve_path = OpenMaya.MDagPath()
+            OpenMaya.MDagPath.getAPathTo(wire_fn.wire(i), curve_path)
+            m_points = OpenMaya.MPointArray()
+            for cv in curve_data['cvs']:
+                m_points.append(OpenMaya.MPoint(*cv))
+            curve_fn = OpenMaya.MFnNurbsCurve(curve_path)
+            curve_fn.setCVs(m_points, OpenMaya.MSpace.kWorld)
+            curve_fn.updateCurve()
+    return True
+
+
+def export_wire_weights(wire_name="", file_name=""):
+    """
+    exports the wire deformer weights and influence curve data to a binary weights file.
+    :param wire_name: <str> wire deformer node name.
+    :param file_name: <str> the file path to write to.
+    :return: <str> file name.
+    """
+    return deform_utils.export_deformer_weights(wire_name, file_name,
+                                                header={'curves': get_wire_curve_data(wire_name)})
+
+
+def import_wire_weights(file_name="", wire_name="", set_cvs=False, remap=True):
+    """
+    imports the wire deformer weights and influence curve data from a binary weights file.
+    :param file_name: <str> the file path to read from.
+    :param wire_name: <str> wire deformer node name, the wire stored in the file when not given.
+    :param set_cvs: <bool> if True, also moves the influence curve CVs to the stored positions.
+    :param remap: <bool> remap the weights by position when the topology differs.
+    :return: <bool> True for success.
+    """
+    header = deform_utils.import_deformer_weights(wire_name, file_name, remap=remap)
+    set_wire_curve_data(wire_name or header['deformer'], header.get('curves', ()), set_cvs=set_cvs)
+    return True
+
+
+def export_scene_wire_weights(directory_name=""):
+    """
+    exports the weights of every wire deformer in the scene, one binary file per wire.
+    :param directory_name: <str> the directory to write the files to.
+    :return: <list> file names.
+    """
+    file_names = []
+    for wire_name in cmds.ls(type='wire'):
+        file_name = '{}/{}.{}'.format(directory_name, wire_name, deform_utils.WEIGHT_FILE_EXT)
+        file_names.append(export_wire_weights(wire_name, file_name))
+    return file_names
@@ -0,0 +1,151 @@
+"""
+Batched pole vector, aim and look-at solvers.
+Pole vector positions and aim matrices of many chains are solved from (N, 3) position arrays in one call,
+so finger, toe and tentacle chains are placed without a scene lookup per chain.
+Aim matrices follow the matrix_kernels Maya convention, the rows are the x, y, z axes and the translation.
+This module does not import Maya.
+"""
+# import local modules
+from . import matrix_kernels
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[AimKernels] :: numpy is required for the batched aim and pole vector solvers.")
+
+
+def _normalize(vectors):
+    lengths = numpy.linalg.norm(vectors, axis=-1)
+    return vectors / numpy.where(lengths > EPSILON, lengths, 1.0)[..., None]
+
+
+def _signed_axis(axis):
+    """
+    the axis index and sign of an axis name such as x or -z.
+    """
+    sign = -1.0 if axis.startswith('-') else 1.0
+    return matrix_kernels.get_axis_index(axis.lstrip('+-')), sign
+
+
+def pole_vector_positions(starts, mids, ends, distance=None):
+    """
+    the pole vector positions of the three joint chains.
+    :param starts: <list> (N, 3) start positions.
+    :param mids: <list> (N, 3) mid positions.
+    :param ends: <list> (N, 3) end positions.
+    :param distance: <float> the distance of the pole from the mid position, along the bend direction.
+        When not given, the offset of the mid position from the chain center is scaled by the chain length.
+    :return: <numpy.ndarray> (N, 3) pole positions.
+    """
+    _require_numpy()
+    starts, mids, ends = numpy.broadcast_arrays(matrix_kernels.as_vectors(starts), matrix_kernels.as_vectors(mids),
+                                                matrix_kernels.as_vectors(ends))
+    chains = ends - starts
+    if distance is None:
+        centers = (starts + ends) * 0.5
+        return centers + (mids - centers) * numpy.linalg.norm(chains, axis=1)[:, None]
+    # the bend direction is perpendicular to the chain, straight chains keep their mid position
+    lengths = numpy.einsum('ij,ij->i', chains, chains)
+    t = numpy.einsum('ij,ij->i', mids - starts, chains) / numpy.where(lengths > EPSILON, lengths, 1.0)
+    bends = _normalize(mids - (starts + chains * t[:, None]))
+    return mids + bends * distance
+
+
+def aim_matrices(sources, targets, ups=(0.0, 1.0, 0.0), aim_axis='x', up_axis='y', up_is_position=False):
+    """
+    the world matrices at the sources with the aim axis pointing at the targets.
+    :param sources: <list> (N, 3) source positions.
+    :param targets: <list> (N, 3) target positions.
+    :param ups: <list> (N, 3) up vectors, or up positions.
+    :param aim_axis: <str> the axis aimed at the target, x, y, z, -x, -y or -z.
+    :param up_axis: <str> the axis turned towards the up vector.
+    :param up_is_position: <bool> the ups are positions, the up vectors point from the sources to them.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    _require_numpy()
+    sources, targets, ups = numpy.broadcast_arrays(matrix_kernels.as_vectors(sources),
+                                                   matrix_kernels.as_vectors(targets), matrix_kernels.as_vectors(ups))
+    aim_index, aim_sign = _signed_axis(aim_axis)
+    up_index, up_sign = _signed_axis(up_axis)
+    if aim_index == up_index:
+        raise ValueError("[AimMatrices] :: The aim and up axes must differ: {}, {}".format(aim_axis, up_axis))
+    side_index = 3 - aim_index - up_index
+    aims = _normalize(targets - sources) * aim_sign
+    ups = (ups - sources if up_is_position else ups) * up_sign
+    # an up vector parallel to the aim is replaced by the world axis furthest from the aim
+    parallel = numpy.linalg.norm(numpy.cross(aims, ups), axis=1) < EPSILON
+    if parallel.any():
+        fallback = numpy.eye(3)[numpy.argmin(numpy.abs(aims[parallel]), axis=1)]
+        ups = ups.copy()
+        ups[parallel] = fallback
+    # keep the axes right handed, x ^ y = z for the cyclic axis orders
+    if (up_index - aim_index) % 3 == 1:
+        sides = _normalize(numpy.cross(aims, ups))
+        ups = numpy.cross(sides, aims)
+    else:
+        sides = _normalize(numpy.cross(ups, aims))
+        ups = numpy.cross(aims, sides)
+    axes = [None, None, None]
+    axes[aim_index], axes[up_index], axes[side_index] = aims, ups, sides
+    return matrix_kernels.from_axes(axes[0], axes[1], axes[2], sources)
+
+
+def chain_aim_matrices(chains, ups=(0.0, 1.0, 0.0), aim_axis='x', up_axis='y', up_is_position=False):
+    """
+    the world matrices of every joint of the chains, each joint aims at the next one
+    and the last joint keeps the orientation of its parent.
+    :param chains: <list> (N, M, 3) joint positions of N chains with M joints each, or a single (M, 3) chain.
+    :param ups: <list> (N, 3) up vectors of each chain, or up positions.
+    :param aim_axis: <str> the axis aimed down the chain.
+    :param up_axis: <str> the axis turned towards the up vector.
+    :param up_is_position: <bool> the ups are positions.
+    :return: <numpy.ndarray> (N, M, 4, 4) matrices.
+    """
+    _require_numpy()
+    chains = numpy.asarray(chains, dtype=float)
+    chains = chains.reshape((-1,) + chains.shape[-2:])
+    count, joints = chains.shape[:2]
+    if joints < 2:
+        raise ValueError("[ChainAimMatrices] :: A chain needs at least two joints.")
+    ups = numpy.broadcast_to(matrix_kernels.as_vectors(ups), (count, 3))
+    if up_is_position:
+        # every joint of the chain turns towards the same up position
+        ups = numpy.repeat(ups[:, None, :], joints - 1, axis=1).reshape(-1, 3)
+    else:
+        ups = numpy.repeat(ups, joints - 1, axis=0)
+    matrices = aim_matrices(chains[:, :-1].reshape(-1, 3), chains[:, 1:].reshape(-1, 3), ups,
+                            aim_axis, up_axis, up_is_position).reshape(count, joints - 1, 4, 4)
+    last = matrices[:, -1:].copy()
+    last[:, :, 3, :3] = chains[:, -1:]
+    return numpy.concatenate((matrices, last), axis=1)
+
+
+def look_at_rotations(sources, targets, ups=(0.0, 1.0, 0.0), parent_matrices=None, aim_axis='x', up_axis='y',
+                      rotate_order='xyz', as_degrees=True):
+    """
+    the local euler rotations that aim the sources at the targets.
+    :param sources: <list> (N, 3) source world positions.
+    :param targets: <list> (N, 3) target world positions.
+    :param ups: <list> (N, 3) up vectors.
+    :param parent_matrices: <list> (N, 4, 4) parent world matrices, world space rotations when not given.
+    :param aim_axis: <str> the axis aimed at the target.
+    :param up_axis: <str> the axis turned towards the up vector.
+    :param rotate_order: <int>, <str> Maya rotate order.
+    :param as_degrees: <bool> return degrees, otherwise radians.
+    :return: <numpy.ndarray> (N, 3) rotations.
+    """
+    _require_numpy()
+    matrices = aim_matrices(sources, targets, ups, aim_axis, up_axis)
+    if parent_matrices is not None:
+        matrices = matrix_kernels.multiply(matrices, matrix_kernels.inverse(parent_matrices))
+    rotations = matrix_kernels.split_rotation_scale(matrices)[0]
+    return matrix_kernels.rotation_to_euler(rotations, rotate_order, as_degrees)
@@ -0,0 +1,270 @@
+"""
+Columnar binary animation cache.
+Each curve is stored as parallel typed arrays (inputs, values, tangent types, angles, weights and key flags)
+in its own block, followed by a curve index table keyed by "node.attribute". Readers only parse the index
+and seek straight to the curves they need, so single curves can be loaded without reading the whole file.
+This module does not import Maya so caches can be read on machines without it.
+
+File layout:
+    magic (4 bytes) | version (uint32) | index offset (uint64) | index size (uint64)
+    curve blocks ...
+    index table (json)
+"""
+# import standard modules
+import array
+import json
+import struct
+import sys
+import zlib
+
+# define local variables
+CACHE_MAGIC = b'AGAC'
+CACHE_VERSION = 1
+CACHE_EXT = 'anc'
+HEADER_FORMAT = '<4sIQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# the typed columns stored for every curve, in block order
+CURVE_COLUMNS = (
+    ('inputs', 'd'),
+    ('values', 'd'),
+    ('inTangentTypes', 'h'),
+    ('outTangentTypes', 'h'),
+    ('inAngles', 'd'),
+    ('outAngles', 'd'),
+    ('inWeights', 'd'),
+    ('outWeights', 'd'),
+    ('flags', 'B'),
+)
+
+# per key flags packed into the flags column
+FLAG_TANGENTS_LOCKED = 1
+FLAG_WEIGHTS_LOCKED = 2
+FLAG_BREAKDOWN = 4
+
+# per curve values stored in the index table
+CURVE_INFO_KEYS = ('curveType', 'isUnitless', 'isWeighted', 'preInfinityType', 'postInfinityType')
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def pack_key_flags(curve_data):
+    """
+    packs the per key lock and breakdown booleans into a flags array.
+    :param curve_data: <dict> curve arrays as returned by animation_utils.get_anim_curve_arrays.
+    :return: <array.array> unsigned char flags.
+    """
+    flags = array.array('B')
+    for tangents_locked, weights_locked, breakdown in zip(curve_data.get('tangentsLocked', ()),
+                                                          curve_data.get('weightsLocked', ()),
+                                                          curve_data.get('isBreakdown', ())):
+        flags.append((FLAG_TANGENTS_LOCKED if tangents_locked else 0) |
+                     (FLAG_WEIGHTS_LOCKED if weights_locked else 0) |
+                     (FLAG_BREAKDOWN if breakdown else 0))
+    return flags
+
+
+def unpack_key_flags(flags):
+    """
+    unpacks the flags array back into the per key lock and breakdown booleans.
+    :param flags: <array.array> unsigned char flags.
+    :return: <dict> tangentsLocked, weightsLocked, isBreakdown lists.
+    """
+    return {
+        'tangentsLocked': [bool(f & FLAG_TANGENTS_LOCKED) for f in flags],
+        'weightsLocked': [bool(f & FLAG_WEIGHTS_LOCKED) for f in flags],
+        'isBreakdown': [bool(f & FLAG_BREAKDOWN) for f in flags],
+    }
+
+
+def _to_bytes(data):
+    """
+    little endian bytes of the array.
+    :param data: <array.array>
+    :return: <bytes>
+    """
+    if _BIG_ENDIAN:
+        data = array.array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def _from_bytes(type_code, data):
+    """
+    array from little endian bytes.
+    :param type_code: <str> array type code.
+    :param data: <bytes>
+    :return: <array.array>
+    """
+    column = array.array(type_code)
+    column.frombytes(data)
+    if _BIG_ENDIAN:
+        column.byteswap()
+    return column
+
+
+def curve_name(node_name, attribute_name):
+    """
+    the index table key of the curve.
+    :param node_name: <str> the animated node name.
+    :param attribute_name: <str> the animated attribute name.
+    :return: <str> node.attribute
+    """
+    return '{}.{}'.format(node_name, attribute_name)
+
+
+class AnimCacheWriter(object):
+    """
+    writes curves one block at a time, then the index table on close.
+    Usage:
+        with AnimCacheWriter(file_name, compress=True) as writer:
+            writer.add_curve('arm_ctrl', 'rotateX', curve_data)
+    """
+
+    def __init__(self, file_name="", compress=True, compress_level=6):
+        self.file_name = file_name
+        self.compress = compress
+        self.compress_level = compress_level
+        self.index = {}
+        self._file = open(file_name, 'wb')
+        # the header is rewritten on close once the index offset is known
+        self._file.write(struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, 0, 0))
+
+    def add_curve(self, node_name="", attribute_name="", curve_data=None, curve_node=""):
+        """
+        writes a curve block.
+        :param node_name: <str> the animated node name.
+        :param attribute_name: <str> the animated attribute name.
+        :param curve_data: <dict> curve arrays as returned by animation_utils.get_anim_curve_arrays.
+        :param curve_node: <str> the anim curve node name, stored for reference.
+        :return: <str> the curve index key.
+        """
+        num_keys = len(curve_data['inputs'])
+        columns = dict(curve_data)
+        if 'flags' not in columns:
+            columns['flags'] = pack_key_flags(curve_data)
+
+        block = b''.join(_to_bytes(array.array(type_code, columns[name])) for name, type_code in CURVE_COLUMNS)
+        if self.compress:
+            block = zlib.compress(block, self.compress_level)
+
+        key = curve_name(node_name, attribute_name)
+        info = {
+            'node': node_name,
+            'attribute': attribute_name,
+            'curveNode': curve_node,
+            'offset': self._file.tell(),
+            'size': len(block),
+            'numKeys': num_keys,
+            'compressed': bool(self.compress),
+        }
+        for info_key in CURVE_INFO_KEYS:
+            info[info_key] = curve_data.get(info_key)
+        self._file.write(block)
+        self.index[key] = info
+        return key
+
+    def close(self):
+        """
+        writes the index table and the final header.
+        :return: <str> file name.
+        """
+        if self._file is None:
+            return self.file_name
+        index_bytes = json.dumps(self.index, sort_keys=True).encode('utf-8')
+        index_offset = self._file.tell()
+        self._file.write(index_bytes)
+        self._file.seek(0)
+        self._file.write(struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, index_offset, len(index_bytes)))
+        self._file.close()
+        self._file = None
+        return self.file_name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AnimCacheReader(object):
+    """
+    reads the index table on open and single curves on demand.
+    Usage:
+        with AnimCacheReader(file_name) as reader:
+            curve_data = reader.read_curve('arm_ctrl.rotateX')
+    """
+
+    def __init__(self, file_name=""):
+        self.file_name = file_name
+        self._file = open(file_name, 'rb')
+        magic, version, index_offset, index_size = struct.unpack(HEADER_FORMAT, self._file.read(HEADER_SIZE))
+        if magic != CACHE_MAGIC:
+            self.close()
+            raise IOError("[AnimCacheReader] :: Invalid animation cache file: {}".format(file_name))
+        if version > CACHE_VERSION:
+            self.close()
+            raise IOError("[AnimCacheReader] :: Unsupported cache version {}: {}".format(version, file_name))
+        self._file.seek(index_offset)
+        self.index = json.loads(self._file.read(index_size).decode('utf-8'))
+
+    def curve_names(self, node_name=""):
+        """
+        the curve index keys in the cache.
+        :param node_name: <str> only return the curves of this node.
+        :return: <list> node.attribute names.
+        """
+        if node_name:
+            return sorted(k for k, v in self.index.items() if v['node'] == node_name)
+        return sorted(self.index)
+
+    def node_names(self):
+        """
+        the animated node names in the cache.
+        :return: <list> node names.
+        """
+        return sorted(set(v['node'] for v in self.index.values()))
+
+    def read_curve(self, name=""):
+        """
+        reads a single curve block.
+        :param name: <str> node.attribute curve index key.
+        :return: <dict> curve arrays with the index information.
+        """
+        info = self.index[name]
+        self._file.seek(info['offset'])
+        block = self._file.read(info['size'])
+        if info['compressed']:
+            block = zlib.decompress(block)
+
+        curve_data = dict(info)
+        num_keys = info['numKeys']
+        position = 0
+        for column_name, type_code in CURVE_COLUMNS:
+            size = array.array(type_code).itemsize * num_keys
+            curve_data[column_name] = _from_bytes(type_code, block[position:position + size])
+            position += size
+        curve_data.update(unpack_key_flags(curve_data['flags']))
+        return curve_data
+
+    def read_curves(self, names=None):
+        """
+        yields the curves, in file order for sequential reads.
+        :param names: <list> node.attribute curve index keys, all curves when not given.
+        :return: <generator> (name, curve data)
+        """
+        if names is None:
+            names = self.index
+        for name in sorted(names, key=lambda n: self.index[n]['offset']):
+            yield name, self.read_curve(name)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,618 @@
+"""
+Offline animation curve evaluation.
+Evaluates and resamples curves captured by animation_utils.get_anim_curve_arrays or
+keytools.get_anim_curve_data_arrays without Maya, so curves can be baked on the farm.
+Each curve segment is stored as a cubic Bezier between two keys, the same way Maya builds its curves:
+non-weighted curves place the control points a third of the segment along the key tangents,
+weighted curves place them the tangent weight along the tangent, as the stored weights already
+hold a third of the segment length (animation_utils stores weight = dx / (3 * cos(angle))).
+Numpy is used to evaluate all the frames of a curve at once when it is available.
+
+Units:
+    inputs and values are taken as they are stored, tangent angles are in degrees measured in those same units.
+"""
+# import standard modules
+import bisect
+import math
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+# MFnAnimCurve.TangentType
+TANGENT_TYPE_NAMES = {
+    0: 'global',
+    1: 'fixed',
+    2: 'linear',
+    3: 'flat',
+    4: 'spline',
+    5: 'step',
+    6: 'slow',
+    7: 'fast',
+    8: 'clamped',
+    9: 'plateau',
+    10: 'stepnext',
+    11: 'auto',
+}
+
+# MFnAnimCurve.InfinityType
+INFINITY_TYPE_NAMES = {
+    0: 'constant',
+    1: 'linear',
+    3: 'cycle',
+    4: 'cyclerelative',
+    5: 'oscillate',
+}
+
+# tangent types whose angles can be rebuilt from the key values alone
+COMPUTED_TANGENT_TYPES = ('linear', 'flat', 'spline', 'smooth', 'clamped', 'plateau', 'step', 'stepnext')
+
+# segment interpolation modes
+SEGMENT_CURVE = 0
+SEGMENT_STEP = 1
+SEGMENT_STEP_NEXT = 2
+
+# bisection steps used to solve the time of weighted segments
+WEIGHTED_SOLVE_STEPS = 40
+
+
+def tangent_type_name(tangent_type):
+    """
+    the keyTangent name of the tangent type.
+    :param tangent_type: <int>, <str> MFnAnimCurve.TangentType or its name.
+    :return: <str> tangent type name.
+    """
+    if isinstance(tangent_type, str):
+        name = tangent_type.lower()
+        return 'spline' if name == 'smooth' else name
+    return TANGENT_TYPE_NAMES.get(tangent_type, 'auto')
+
+
+def infinity_type_name(infinity_type):
+    """
+    the name of the infinity type, the MFnAnimCurve enum names are accepted.
+    :param infinity_type: <int>, <str> MFnAnimCurve.InfinityType, its name or the enum name such as 'kCycle'.
+    :return: <str> infinity type name.
+    """
+    if isinstance(infinity_type, str):
+        name = infinity_type.lower()
+        if name.startswith('k') and name[1:] in INFINITY_TYPE_NAMES.values():
+            name = name[1:]
+        return name
+    return INFINITY_TYPE_NAMES.get(infinity_type, 'constant')
+
+
+def curve_from_keytools_arrays(curve_arrays, value_scale=1.0, pre_infinity='constant', post_infinity='constant'):
+    """
+    converts the tuple returned by keytools.get_anim_curve_data_arrays into curve data.
+    those arrays only hold the out tangent types, so they are used for both sides of the key.
+    :param curve_arrays: <tuple> in_angles, out_angles, out_tangent_names, key_values, key_times.
+    :param value_scale: <float> scale applied to the values, e.g. radians to degrees for angular curves.
+    :param pre_infinity: <int>, <str> pre infinity type.
+    :param post_infinity: <int>, <str> post infinity type.
+    :return: <dict> curve data.
+    """
+    in_angles, out_angles, out_tangent_names, key_values, key_times = curve_arrays
+    return {
+        'inputs': list(key_times),
+        'values': [v * value_scale for v in key_values],
+        'inTangentTypes': list(out_tangent_names),
+        'outTangentTypes': list(out_tangent_names),
+        'inAngles': list(in_angles),
+        'outAngles': list(out_angles),
+        'isWeighted': False,
+        'preInfinityType': pre_infinity,
+        'postInfinityType': post_infinity,
+    }
+
+
+def _segment_slope(inputs, values, i, j):
+    """
+    the straight line slope between two keys.
+    """
+    dt = inputs[j] - inputs[i]
+    if not dt:
+        return 0.0
+    return (values[j] - values[i]) / dt
+
+
+def compute_tangent_slope(inputs, values, tangent_type, index):
+    """
+    the slope Maya builds for the key with the tangent type, the same slope is used for both sides.
+    linear returns None, as the two sides have different slopes.
+    :param inputs: <list> key inputs.
+    :param values: <list> key values.
+    :param tangent_type: <str> tangent type name.
+    :param index: <int> key index.
+    :return: <float>, <None> slope.
+    """
+    last = len(inputs) - 1
+    if tangent_type in ('flat', 'step', 'stepnext') or not last:
+        return 0.0
+    if tangent_type == 'linear':
+        return None
+
+    prev_index = max(index - 1, 0)
+    next_index = min(index + 1, last)
+    slope = _segment_slope(inputs, values, prev_index, next_index)
+    if tangent_type in ('spline', 'smooth'):
+        return slope
+
+    value = values[index]
+    prev_value = values[prev_index]
+    next_value = values[next_index]
+    is_extreme = (value - prev_value) * (next_value - value) <= 0.0
+    if tangent_type == 'clamped':
+        # flat where the key matches or turns around from a neighbor
+        return 0.0 if is_extreme and index not in (0, last) else slope
+    if tangent_type == 'plateau':
+        if is_extreme or index in (0, last):
+            return 0.0
+        # limit the slope so the segments do not overshoot the neighboring keys
+        limit = 3.0 * min(abs(_segment_slope(inputs, values, prev_index, index)),
+                          abs(_segment_slope(inputs, values, index, next_index)))
+        return max(-limit, min(limit, slope))
+    return slope
+
+
+def _degrees_to_slope(angle):
+    """
+    the slope of the tangent angle, in degrees.
+    """
+    return math.tan(math.radians(angle))
+
+
+def prepare_curve(curve_data, recompute_tangents=False):
+    """
+    builds the Bezier segments of the curve.
+    :param curve_data: <dict> curve data as returned by animation_utils.get_anim_curve_arrays.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values,
+                               instead of using the captured tangent angles.
+    :return: <dict> prepared curve segments.
+    """
+    inputs = [float(x) for x in curve_data['inputs']]
+    values = [float(v) for v in curve_data['values']]
+    num_keys = len(inputs)
+    is_weighted = bool(curve_data.get('isWeighted', False))
+    in_types = [tangent_type_name(t) for t in curve_data.get('inTangentTypes', ['auto'] * num_keys)]
+    out_types = [tangent_type_name(t) for t in curve_data.get('outTangentTypes', ['auto'] * num_keys)]
+    in_angles = curve_data.get('inAngles')
+    out_angles = curve_data.get('outAngles')
+    in_weights = curve_data.get('inWeights') or [None] * num_keys
+    out_weights = curve_data.get('outWeights') or [None] * num_keys
+
+    # the per key tangent slopes, in curve units
+    in_slopes = []
+    out_slopes = []
+    for i in range(num_keys):
+        for types, angles, slopes, is_in in ((in_types, in_angles, in_slopes, True),
+                                             (out_types, out_angles, out_slopes, False)):
+            tangent_type = types[i]
+            if angles is None or (recompute_tangents and tangent_type in COMPUTED_TANGENT_TYPES):
+                slope = compute_tangent_slope(inputs, values, tangent_type, i)
+                if slope is None:
+                    # linear tangents follow their own segment, the end keys follow their only segment
+                    if is_in and i or not is_in and i == num_keys - 1:
+                        slope = _segment_slope(inputs, values, max(i - 1, 0), i)
+                    else:
+                        slope = _segment_slope(inputs, values, i, min(i + 1, num_keys - 1))
+            else:
+                slope = _degrees_to_slope(angles[i])
+            slopes.append(slope)
+
+    segments = {'x0': [], 'x1': [], 'x2': [], 'x3': [], 'y0': [], 'y1': [], 'y2': [], 'y3': [], 'mode': []}
+    for i in range(num_keys - 1):
+        x0, x3 = inputs[i], inputs[i + 1]
+        y0, y3 = values[i], values[i + 1]
+        dt = x3 - x0
+        if is_weighted and out_weights[i] is not None and in_weights[i + 1] is not None:
+            out_angle = math.atan(out_slopes[i])
+            in_angle = math.atan(in_slopes[i + 1])
+            x1 = x0 + out_weights[i] * math.cos(out_angle)
+            y1 = y0 + out_weights[i] * math.sin(out_angle)
+            x2 = x3 - in_weights[i + 1] * math.cos(in_angle)
+            y2 = y3 - in_weights[i + 1] * math.sin(in_angle)
+            # keep the time of the segment monotonic
+            x1 = min(max(x1, x0), x3)
+            x2 = min(max(x2, x0), x3)
+        else:
+            x1 = x0 + dt / 3.0
+            x2 = x3 - dt / 3.0
+            y1 = y0 + out_slopes[i] * dt / 3.0
+            y2 = y3 - in_slopes[i + 1] * dt / 3.0
+
+        if out_types[i] == 'step':
+            mode = SEGMENT_STEP
+        elif out_types[i] == 'stepnext':
+            mode = SEGMENT_STEP_NEXT
+        else:
+            mode = SEGMENT_CURVE
+        for key, value in zip(('x0', 'x1', 'x2', 'x3', 'y0', 'y1', 'y2', 'y3', 'mode'),
+                              (x0, x1, x2, x3, y0, y1, y2, y3, mode)):
+            segments[key].append(value)
+
+    return {
+        'inputs': inputs,
+        'values': values,
+        'isWeighted': is_weighted,
+        'inSlope': in_slopes[0] if num_keys else 0.0,
+        'outSlope': out_slopes[-1] if num_keys else 0.0,
+        'preInfinityType': infinity_type_name(curve_data.get('preInfinityType', 'constant')),
+        'postInfinityType': infinity_type_name(curve_data.get('postInfinityType', 'constant')),
+        'segments': segments,
+    }
+
+
+def _bezier(p0, p1, p2, p3, s):
+    """
+    cubic Bezier value at the parameter.
+    """
+    u = 1.0 - s
+    return u * u * u * p0 + 3.0 * u * u * s * p1 + 3.0 * u * s * s * p2 + s * s * s * p3
+
+
+def _solve_bezier_parameter(x0, x1, x2, x3, x):
+    """
+    the Bezier parameter at the time, by bisection, time is monotonic across the segment.
+    """
+    low, high = 0.0, 1.0
+    for _ in range(WEIGHTED_SOLVE_STEPS):
+        mid = (low + high) * 0.5
+        if _bezier(x0, x1, x2, x3, mid) < x:
+            low = mid
+        else:
+            high = mid
+    return (low + high) * 0.5
+
+
+def _infinity_input(curve, x):
+    """
+    maps the input outside of the key range back into it.
+    :return: <tuple> local input, value offset, or None, value for constant and linear infinity.
+    """
+    inputs = curve['inputs']
+    values = curve['values']
+    first, last = inputs[0], inputs[-1]
+    if first <= x <= last:
+        return x, 0.0
+    if x < first:
+        infinity_type, end_input, end_value, slope = curve['preInfinityType'], first, values[0], curve['inSlope']
+    else:
+        infinity_type, end_input, end_value, slope = curve['postInfinityType'], last, values[-1], curve['outSlope']
+
+    curve_range = last - first
+    if infinity_type == 'linear':
+        return None, end_value + slope * (x - end_input)
+    if infinity_type not in ('cycle', 'cyclerelative', 'oscillate') or not curve_range:
+        return None, end_value
+
+    cycles = math.floor((x - first) / curve_range)
+    local_x = x - cycles * curve_range
+    if infinity_type == 'cyclerelative':
+        return local_x, cycles * (values[-1] - values[0])
+    if infinity_type == 'oscillate' and cycles % 2:
+        local_x = last - (local_x - first)
+    return local_x, 0.0
+
+
+def _evaluate_python(curve, frames):
+    """
+    evaluates the prepared curve at every frame, one frame at a time.
+    """
+    inputs = curve['inputs']
+    values = curve['values']
+    if not inputs:
+        return [0.0] * len(frames)
+    segments = curve['segments']
+    last_segment = len(inputs) - 2
+
+    result = []
+    for frame in frames:
+        x, offset = _infinity_input(curve, float(frame))
+        if x is None:
+            result.append(offset)
+            continue
+        if last_segment < 0:
+            result.append(values[0] + offset)
+            continue
+        i = min(max(bisect.bisect_right(inputs, x) - 1, 0), last_segment)
+        mode = segments['mode'][i]
+        x0, x3 = segments['x0'][i], segments['x3'][i]
+        if x >= x3:
+            value = segments['y3'][i]
+        elif mode == SEGMENT_STEP:
+            value = segments['y0'][i]
+        elif mode == SEGMENT_STEP_NEXT:
+            value = segments['y3'][i] if x > x0 else segments['y0'][i]
+        else:
+            if curve['isWeighted']:
+                s = _solve_bezier_parameter(x0, segments['x1'][i], segments['x2'][i], x3, x)
+            else:
+                s = (x - x0) / (x3 - x0)
+            value = _bezier(segments['y0'][i], segments['y1'][i], segments['y2'][i], segments['y3'][i], s)
+        result.append(value + offset)
+    return result
+
+
+def _infinity_input_numpy(curve, x):
+    """
+    maps the input array outside of the key range back into it.
+    :return: <tuple> local inputs, value offsets, extrapolated mask, extrapolated values.
+    """
+    inputs = curve['inputs']
+    values = curve['values']
+    first, last = inputs[0], inputs[-1]
+    curve_range = last - first
+    local_x = x.copy()
+    offset = numpy.zeros_like(x)
+    extrapolated = numpy.zeros(x.shape, dtype=bool)
+    extrapolated_values = numpy.zeros_like(x)
+
+    for mask, infinity_type, end_input, end_value, slope in (
+            (x < first, curve['preInfinityType'], first, values[0], curve['inSlope']),
+            (x > last, curve['postInfinityType'], last, values[-1], curve['outSlope'])):
+        if not mask.any():
+            continue
+        if infinity_type == 'linear':
+            extrapolated |= mask
+            extrapolated_values[mask] = end_value + slope * (x[mask] - end_input)
+        elif infinity_type not in ('cycle', 'cyclerelative', 'oscillate') or not curve_range:
+            extrapolated |= mask
+            extrapolated_values[mask] = end_value
+        else:
+            cycles = numpy.floor((x[mask] - first) / curve_range)
+            cycle_x = x[mask] - cycles * curve_range
+            if infinity_type == 'cyclerelative':
+                offset[mask] = cycles * (values[-1] - values[0])
+            elif infinity_type == 'oscillate':
+                odd = numpy.mod(cycles, 2) == 1
+                cycle_x[odd] = last - (cycle_x[odd] - first)
+            local_x[mask] = cycle_x
+    return local_x, offset, extrapolated, extrapolated_values
+
+
+def _evaluate_numpy(curve, frames):
+    """
+    evaluates the prepared curve at all the frames at once.
+    """
+    x = numpy.asarray(frames, dtype=float)
+    inputs = curve['inputs']
+    values = curve['values']
+    if not inputs:
+        return numpy.zeros_like(x)
+    local_x, offset, extrapolated, extrapolated_values = _infinity_input_numpy(curve, x)
+    if len(inputs) == 1:
+        return numpy.where(extrapolated, extrapolated_values, values[0] + offset)
+
+    segments = dict((k, numpy.asarray(v, dtype=float)) for k, v in curve['segments'].items())
+    key_inputs = numpy.asarray(inputs, dtype=float)
+    i = numpy.clip(numpy.searchsorted(key_inputs, local_x, side='right') - 1, 0, len(inputs) - 2)
+    x0, x1, x2, x3 = segments['x0'][i], segments['x1'][i], segments['x2'][i], segments['x3'][i]
+    y0, y1, y2, y3 = segments['y0'][i], segments['y1'][i], segments['y2'][i], segments['y3'][i]
+    mode = segments['mode'][i]
+
+    if curve['isWeighted']:
+        low = numpy.zeros_like(local_x)
+        high = numpy.ones_like(local_x)
+        for _ in range(WEIGHTED_SOLVE_STEPS):
+            mid = (low + high) * 0.5
+            below = _bezier(x0, x1, x2, x3, mid) < local_x
+            low = numpy.where(below, mid, low)
+            high = numpy.where(below, high, mid)
+        s = (low + high) * 0.5
+    else:
+        s = (local_x - x0) / (x3 - x0)
+    value = _bezier(y0, y1, y2, y3, s)
+    value = numpy.where(mode == SEGMENT_STEP, y0, value)
+    value = numpy.where(mode == SEGMENT_STEP_NEXT, numpy.where(local_x > x0, y3, y0), value)
+    value = numpy.where(local_x >= x3, y3, value)
+    return numpy.where(extrapolated, extrapolated_values, value + offset)
+
+
+def evaluate_curve(curve_data, frames, recompute_tangents=False):
+    """
+    evaluates the curve at the frames.
+    :param curve_data: <dict> curve data, or a curve prepared by prepare_curve.
+    :param frames: <list> inputs to evaluate at.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values.
+    :return: <list>, <numpy.ndarray> the curve values.
+    """
+    curve = curve_data if 'segments' in curve_data else prepare_curve(curve_data, recompute_tangents)
+    if numpy is not None:
+        return _evaluate_numpy(curve, frames)
+    return _evaluate_python(curve, frames)
+
+
+# infinity type codes of the stacked curves
+_INFINITY_CODES = dict((name, code) for code, name in INFINITY_TYPE_NAMES.items())
+
+
+def stack_curves(curves, recompute_tangents=False):
+    """
+    prepares the curves once and stacks their segments into padded (curves, segments) arrays,
+    so every curve is evaluated together. The stack can be kept and passed to evaluate_curves again.
+    :param curves: <dict> {name: curve data, or a curve prepared by prepare_curve}.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values.
+    :return: <dict> stacked curves.
+    """
+    names = list(curves)
+    prepared = [curves[n] if 'segments' in curves[n] else prepare_curve(curves[n], recompute_tangents)
+                for n in names]
+    num_curves = len(prepared)
+    num_keys = numpy.array([len(c['inputs']) for c in prepared], dtype=int)
+    max_keys = max(int(num_keys.max()) if num_curves else 0, 2)
+
+    # key inputs normalized to 0.0 - 1.0 over each curve and offset by two per curve, so one sorted
+    # search finds the segment of every curve at once, padding keys sort between the curves
+    first = numpy.zeros(num_curves)
+    last = numpy.zeros(num_curves)
+    keys = numpy.zeros((num_curves, max_keys))
+    stacked = dict((k, numpy.zeros((num_curves, max_keys - 1)))
+                   for k in ('x0', 'x1', 'x2', 'x3', 'y0', 'y1', 'y2', 'y3', 'mode'))
+    for row, curve in enumerate(prepared):
+        inputs = curve['inputs']
+        count = len(inputs)
+        if count:
+            first[row], last[row] = inputs[0], inputs[-1]
+        curve_range = last[row] - first[row] or 1.0
+        keys[row, :count] = [(x - first[row]) / curve_range + 2.0 * row for x in inputs]
+        keys[row, count:] = 2.0 * row + 1.5
+        for k in stacked:
+            stacked[k][row, :max(count - 1, 0)] = curve['segments'][k]
+    return {
+        'names': names,
+        'numKeys': num_keys,
+        'first': first,
+        'last': last,
+        'keys': keys.reshape(-1),
+        'firstValue': numpy.array([c['values'][0] if c['values'] else 0.0 for c in prepared]),
+        'lastValue': numpy.array([c['values'][-1] if c['values'] else 0.0 for c in prepared]),
+        'inSlope': numpy.array([c['inSlope'] for c in prepared]),
+        'outSlope': numpy.array([c['outSlope'] for c in prepared]),
+        'preInfinity': numpy.array([_INFINITY_CODES.get(c['preInfinityType'], 0) for c in prepared]),
+        'postInfinity': numpy.array([_INFINITY_CODES.get(c['postInfinityType'], 0) for c in prepared]),
+        'isWeighted': numpy.array([c['isWeighted'] for c in prepared], dtype=bool),
+        'segments': stacked,
+    }
+
+
+def _evaluate_stacked(stack, frames):
+    """
+    evaluates every stacked curve at all the frames at once.
+    :return: <numpy.ndarray> (curves, frames) values.
+    """
+    num_curves = len(stack['names'])
+    x = numpy.broadcast_to(numpy.asarray(frames, dtype=float)[None, :], (num_curves, len(frames)))
+    first = stack['first'][:, None]
+    last = stack['last'][:, None]
+    curve_range = last - first
+    safe_range = numpy.where(curve_range > 0.0, curve_range, 1.0)
+
+    # infinity, the same as _infinity_input_numpy for every curve
+    before = x < first
+    after = x > last
+    infinity = numpy.where(before, stack['preInfinity'][:, None], stack['postInfinity'][:, None])
+    outside = before | after
+    cyclic = outside & numpy.isin(infinity, (3, 4, 5)) & (curve_range > 0.0)
+    cycles = numpy.floor((x - first) / safe_range)
+    cycle_x = x - cycles * safe_range
+    odd = (infinity == 5) & (numpy.mod(cycles, 2) == 1)
+    cycle_x = numpy.where(odd, last - (cycle_x - first), cycle_x)
+    local_x = numpy.where(cyclic, cycle_x, x)
+    offset = numpy.where(cyclic & (infinity == 4),
+                         cycles * (stack['lastValue'] - stack['firstValue'])[:, None], 0.0)
+    end_input = numpy.where(before, first, last)
+    end_value = numpy.where(before, stack['firstValue'][:, None], stack['lastValue'][:, None])
+    slope = numpy.where(before, stack['inSlope'][:, None], stack['outSlope'][:, None])
+    extrapolated = outside & ~cyclic
+    extrapolated_values = numpy.where(infinity == 1, end_value + slope * (x - end_input), end_value)
+
+    # one sorted search over the normalized keys of every curve
+    rows = numpy.arange(num_curves)[:, None]
+    max_keys = len(stack['keys']) // max(num_curves, 1)
+    search_x = (local_x - first) / safe_range + 2.0 * rows
+    counts = numpy.searchsorted(stack['keys'], search_x, side='right') - rows * max_keys
+    last_segment = numpy.maximum(stack['numKeys'] - 2, 0)[:, None]
+    i = numpy.clip(counts - 1, 0, last_segment)
+
+    segments = dict((k, numpy.take_along_axis(v, i, axis=1)) for k, v in stack['segments'].items())
+    x0, x1, x2, x3 = segments['x0'], segments['x1'], segments['x2'], segments['x3']
+    y0, y1, y2, y3 = segments['y0'], segments['y1'], segments['y2'], segments['y3']
+    mode = segments['mode']
+
+    s = (local_x - x0) / numpy.where(x3 > x0, x3 - x0, 1.0)
+    weighted = stack['isWeighted']
+    if weighted.any():
+        low = numpy.zeros_like(local_x[weighted])
+        high = numpy.ones_like(low)
+        for _ in range(WEIGHTED_SOLVE_STEPS):
+            mid = (low + high) * 0.5
+            below = _bezier(x0[weighted], x1[weighted], x2[weighted], x3[weighted], mid) < local_x[weighted]
+            low = numpy.where(below, mid, low)
+            high = numpy.where(below, high, mid)
+        s[weighted] = (low + high) * 0.5
+    value = _bezier(y0, y1, y2, y3, s)
+    value = numpy.where(mode == SEGMENT_STEP, y0, value)
+    value = numpy.where(mode == SEGMENT_STEP_NEXT, numpy.where(local_x > x0, y3, y0), value)
+    value = numpy.where(local_x >= x3, y3, value)
+    # single key curves hold their value, curves without keys are zero
+    num_keys = stack['numKeys'][:, None]
+    value = numpy.where(num_keys == 1, stack['firstValue'][:, None], value)
+    value = numpy.where(extrapolated, extrapolated_values, value + offset)
+    return numpy.where(num_keys == 0, 0.0, value)
+
+
+def evaluate_curves(curves, frames, recompute_tangents=False):
+    """
+    evaluates many curves at the same frames in one call.
+    With numpy the curves are stacked and evaluated together, see stack_curves.
+    :param curves: <dict> {name: curve data}, or a stack returned by stack_curves.
+    :param frames: <list> inputs to evaluate at.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values.
+    :return: <dict> {name: curve values}.
+    """
+    if numpy is None:
+        frames = [float(f) for f in frames]
+        return dict((name, evaluate_curve(curve_data, frames, recompute_tangents))
+                    for name, curve_data in curves.items())
+    stack = curves if 'names' in curves and 'segments' in curves else stack_curves(curves, recompute_tangents)
+    values = _evaluate_stacked(stack, frames)
+    return dict(zip(stack['names'], values))
+
+
+def get_frame_range(start_frame, end_frame, step=1.0):
+    """
+    the frames from start to end, inclusive.
+    :param start_frame: <float> first frame.
+    :param end_frame: <float> last frame.
+    :param step: <float> frame step.
+    :return: <list> frames.
+    """
+    if step <= 0:
+        raise ValueError("[GetFrameRange] :: Step must be above zero: {}".format(step))
+    count = int(math.floor((end_frame - start_frame) / step + 1e-9)) + 1
+    return [start_frame + i * step for i in range(max(count, 0))]
+
+
+def resample_curve(curve_data, start_frame, end_frame, step=1.0, recompute_tangents=False):
+    """
+    bakes the curve into evenly spaced keys.
+    :param curve_data: <dict> curve data.
+    :param start_frame: <float> first frame.
+    :param end_frame: <float> last frame.
+    :param step: <float> frame step.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values.
+    :return: <dict> linear curve data with the baked keys.
+    """
+    frames = get_frame_range(start_frame, end_frame, step)
+    values = [float(v) for v in evaluate_curve(curve_data, frames, recompute_tangents)]
+    resampled = dict(curve_data)
+    resampled.update({
+        'inputs': frames,
+        'values': values,
+        'inTangentTypes': ['linear'] * len(frames),
+        'outTangentTypes': ['linear'] * len(frames),
+        'inAngles': None,
+        'outAngles': None,
+        'inWeights': None,
+        'outWeights': None,
+        'isWeighted': False,
+    })
+    return resampled
+
+
+def bake_curves(curves, start_frame, end_frame, step=1.0, recompute_tangents=False):
+    """
+    evaluates the curves on every frame of the range.
+    :param curves: <dict> {name: curve data}.
+    :param start_frame: <float> first frame.
+    :param end_frame: <float> last frame.
+    :param step: <float> frame step.
+    :param recompute_tangents: <bool> rebuild the slopes of the computed tangent types from the key values.
+    :return: <tuple> frames, {name: curve values}.
+    """
+    frames = get_frame_range(start_frame, end_frame, step)
+    return frames, evaluate_curves(curves, frames, recompute_tangents)
@@ -4,7 +4,8 @@ Written in both cmds and OpenMaya way.
 """
 from importlib import reload
 # import standard modules
-from math import atan, cos
+import os
+from math import atan, cos, degrees, radians
 
 # import maya modules
 from maya import cmds
@@ -16,6 +17,7 @@ from maya import OpenMayaAnim as OpenMayaAnim
 from . import object_utils
 from maya_utils import math_utils
 from maya_utils import file_utils
+from maya_utils import anim_cache_utils
 from ui_tools import list_tool
 reload(list_tool)
 
@@ -24,6 +26,14 @@ reload(list_tool)
 __version__ = '1.2.0'
 __verbosity__ = 0
 __m_util = OpenMaya.MScriptUtil()
+__curve_edit_plugin_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plugins',
+                                        'animCurveEdit.py')
+_curve_edits = []
+
+# define global variables
+CURVE_EDIT_COMMAND = 'animCurveEdit'
+TIME_CURVE_TYPES = (OpenMayaAnim.MFnAnimCurve.kAnimCurveTA, OpenMayaAnim.MFnAnimCurve.kAnimCurveTL,
+                    OpenMayaAnim.MFnAnimCurve.kAnimCurveTT, OpenMayaAnim.MFnAnimCurve.kAnimCurveTU)
 
 __anim_tangentType = {
     OpenMayaAnim.MFnAnimCurve.kTangentGlobal: "kTangentGlobal",
@@ -63,6 +73,25 @@ __anim_infinityType = {
     OpenMayaAnim.MFnAnimCurve.kOscillate: "kOscillate"
 }
 
+# the keyTangent command tangent type names
+__anim_tangentTypeName = {
+    OpenMayaAnim.MFnAnimCurve.kTangentGlobal: "global",
+    OpenMayaAnim.MFnAnimCurve.kTangentFixed: "fixed",
+    OpenMayaAnim.MFnAnimCurve.kTangentLinear: "linear",
+    OpenMayaAnim.MFnAnimCurve.kTangentFlat: "flat",
+    OpenMayaAnim.MFnAnimCurve.kTangentSmooth: "spline",
+    OpenMayaAnim.MFnAnimCurve.kTangentStep: "step",
+    OpenMayaAnim.MFnAnimCurve.kTangentSlow: "slow",
+    OpenMayaAnim.MFnAnimCurve.kTangentFast: "fast",
+    OpenMayaAnim.MFnAnimCurve.kTangentClamped: "clamped",
+    OpenMayaAnim.MFnAnimCurve.kTangentPlateau: "plateau",
+    OpenMayaAnim.MFnAnimCurve.kTangentStepNext: "stepnext",
+    OpenMayaAnim.MFnAnimCurve.kTangentAuto: "auto",
+    OpenMayaAnim.MFnAnimCurve.kTangentAutoMix: "automix",
+    OpenMayaAnim.MFnAnimCurve.kTangentAutoEase: "autoease",
+    OpenMayaAnim.MFnAnimCurve.kTangentAutoCustom: "autocustom"
+}
+
 
 def write_anim_data():
     """writes keyframe data, from selected objects onto a JSON file into a local temp directory
@@ -143,6 +172,373 @@ def read_anim_data_cmd(file_path=""):
     add_keyframes(data)
 
 
+def write_anim_cache(file_name="", objects=(), compress=True):
+    """writes the keyframe data of the objects into a single columnar binary animation cache.
+    :param file_name: <str> the cache file name, defaults to animCache in the temp directory.
+    :param objects: <list> the objects to write, defaults to the selected objects.
+    :param compress: <bool> compress each curve block.
+    :return: <str> the cache file name.
+    """
+    if not file_name:
+        file_name = file_utils.posixpath.join(
+            file_utils.temp_dir, "animCache.{}".format(anim_cache_utils.CACHE_EXT))
+    if not objects:
+        objects = object_utils.get_selected_objects_gen()
+    with anim_cache_utils.AnimCacheWriter(file_name, compress=compress) as writer:
+        for anim_obj_name in objects:
+            for curve_node, plug_name in get_anim_curve_plugs(anim_obj_name):
+                node_name, attribute_name = plug_name.split('.', 1)
+                curve_data = get_anim_curve_arrays(get_mfn_anim_node(curve_node))
+                writer.add_curve(node_name, attribute_name, curve_data, curve_node=curve_node)
+    return file_name
+
+
+def read_anim_cache(file_path="", objects=(), offset_value=0):
+    """reads the keyframe data from a columnar binary animation cache and applies it.
+    only the curves of the requested objects are read from the file.
+    :param file_path: <str> the cache file name, defaults to animCache in the temp directory.
+    :param objects: <list> the objects to apply, defaults to every object in the cache found in the scene.
+    :param offset_value: <float> the time offset to apply to the keys of the time input curves,
+        driven key curves keep their inputs.
+    :return: <list> the curve names applied.
+    """
+    if not file_path:
+        file_path = file_utils.posixpath.join(
+            file_utils.temp_dir, "animCache.{}".format(anim_cache_utils.CACHE_EXT))
+    applied = []
+    curves = []
+    with anim_cache_utils.AnimCacheReader(file_path) as reader:
+        node_names = objects or reader.node_names()
+        curve_names = []
+        for node_name in node_names:
+            if cmds.objExists(node_name):
+                curve_names.extend(reader.curve_names(node_name))
+        for name, curve_data in reader.read_curves(curve_names):
+            if offset_value and curve_data['curveType'] in TIME_CURVE_TYPES:
+                curve_data = dict(curve_data, inputs=[x + offset_value for x in curve_data['inputs']])
+            curves.append((curve_data['node'], curve_data['attribute'], curve_data))
+            applied.append(name)
+    if curves:
+        run_curve_edit(apply_anim_curves, curves)
+    return applied
+
+
+def get_anim_curve_plugs(object_name=""):
+    """gets the anim curves directly driving the object and the plugs they drive.
+    :param object_name: <str> the animated object name.
+    :return: <list> (anim curve node, node.attribute) pairs.
+    """
+    connections = cmds.listConnections(object_name, source=True, destination=False, connections=True,
+                                       plugs=False, type='animCurve', skipConversionNodes=True) or []
+    return [(connections[i + 1], connections[i]) for i in range(0, len(connections), 2)]
+
+
+def to_internal_value(curve_type, value):
+    """converts the ui unit value into the internal unit stored on the anim curve.
+    :param curve_type: <int> MFnAnimCurve.AnimCurveType.
+    :param value: <float> the ui unit value.
+    :return: <float> internal unit value.
+    """
+    if curve_type in (OpenMayaAnim.MFnAnimCurve.kAnimCurveTA, OpenMayaAnim.MFnAnimCurve.kAnimCurveUA):
+        return OpenMaya.MAngle(value, OpenMaya.MAngle.uiUnit()).asRadians()
+    if curve_type in (OpenMayaAnim.MFnAnimCurve.kAnimCurveTL, OpenMayaAnim.MFnAnimCurve.kAnimCurveUL):
+        return OpenMaya.MDistance(value, OpenMaya.MDistance.uiUnit()).asCentimeters()
+    return value
+
+
+def get_pending_curve_edit():
+    """the edit waiting in run_curve_edit, read by the animCurveEdit command.
+    :return: <dict> function, args, kwargs and result of the edit.
+    """
+    return _curve_edits[-1]
+
+
+def run_curve_edit(edit_function, *args, **kwargs):
+    """runs the API anim curve edit from the animCurveEdit command, so its changes are on Maya's undo queue.
+    the edit function is called with the command's m_curve_change and m_dag_mod keyword arguments,
+    only the changes made through those two objects are undone and redone with the command.
+    :param edit_function: <function> the edit to run.
+    :param args: <list> the edit function arguments.
+    :param kwargs: <dict> the edit function keyword arguments.
+    :return: the edit function result.
+    """
+    if not cmds.pluginInfo(CURVE_EDIT_COMMAND, query=True, loaded=True):
+        cmds.loadPlugin(__curve_edit_plugin_path, quiet=True)
+    edit = {'function': edit_function, 'args': args, 'kwargs': kwargs, 'result': None}
+    _curve_edits.append(edit)
+    try:
+        getattr(cmds, CURVE_EDIT_COMMAND)()
+    finally:
+        _curve_edits.pop()
+    return edit['result']
+
+
+def get_or_create_anim_curve(node_name="", attribute_name="", curve_type=None, m_dag_mod=None):
+    """gets the anim curve driving the plug, creating one when there is none.
+    the curve is created with the modifier when one is given, for the animCurveEdit command to undo,
+    otherwise it is created with cmds, so the creation is undone with the caller's undo chunk.
+    :param node_name: <str> the animated node name.
+    :param attribute_name: <str> the animated attribute name.
+    :param curve_type: <int> MFnAnimCurve.AnimCurveType to create, chosen from the plug when None.
+    :param m_dag_mod: <OpenMaya.MDGModifier> modifier used for creating the curve.
+    :return: <OpenMayaAnim.MFnAnimCurve> anim curve function set.
+    """
+    plug = object_utils.get_plug(node_name, attribute_name)
+    anim_fn = OpenMayaAnim.MFnAnimCurve()
+    plugs = OpenMaya.MPlugArray()
+    plug.connectedTo(plugs, True, False)
+    if plugs.length() and plugs[0].node().hasFn(OpenMaya.MFn.kAnimCurve):
+        anim_fn.setObject(plugs[0].node())
+        return anim_fn
+    if m_dag_mod is None:
+        if curve_type is None:
+            curve_type = anim_fn.timedAnimCurveTypeForPlug(plug)
+        plug_name = '{}.{}'.format(node_name, attribute_name)
+        curve_name = '{}_{}'.format(node_name.split('|')[-1].split(':')[-1], attribute_name)
+        curve_name = cmds.createNode('animCurve' + __anim_curveType[curve_type][-2:],
+                                     name=curve_name.replace('.', '_').replace('[', '_').replace(']', ''))
+        cmds.connectAttr(curve_name + '.output', plug_name)
+        anim_fn.setObject(object_utils.get_m_obj(curve_name))
+        return anim_fn
+    if curve_type is None:
+        anim_fn.create(plug, m_dag_mod)
+    else:
+        anim_fn.create(plug, curve_type, m_dag_mod)
+    m_dag_mod.doIt()
+    return anim_fn
+
+
+def apply_anim_curve_arrays(node_name="", attribute_name="", curve_data=None, offset_value=0, m_curve_change=None,
+                            m_dag_mod=None):
+    """applies the curve arrays onto the plug, replacing any existing keys.
+    :param node_name: <str> the animated node name.
+    :param attribute_name: <str> the animated attribute name.
+    :param curve_data: <dict> curve arrays as returned by get_anim_curve_arrays.
+    :param offset_value: <float> the time offset to apply to the keys.
+    :param m_curve_change: <OpenMayaAnim.MAnimCurveChange> use this change object for the undo/ redo behavior.
+    :param m_dag_mod: <OpenMaya.MDGModifier> modifier used for creating a missing curve.
+    :return: <OpenMayaAnim.MFnAnimCurve> the anim curve function set.
+    """
+    anim_fn = get_or_create_anim_curve(node_name, attribute_name, curve_data['curveType'], m_dag_mod=m_dag_mod)
+    return apply_anim_curve_arrays_to_curve(anim_fn, curve_data, offset_value=offset_value,
+                                            m_curve_change=m_curve_change)
+
+
+def apply_anim_curves(curves=(), offset_value=0, m_curve_change=None, m_dag_mod=None):
+    """applies the curve arrays of many plugs, run it through run_curve_edit for undo.
+    :param curves: <list> (node name, attribute name, curve arrays) of each plug.
+    :param offset_value: <float> the time offset to apply to the keys.
+    :param m_curve_change: <OpenMayaAnim.MAnimCurveChange> use this change object for the undo/ redo behavior.
+    :param m_dag_mod: <OpenMaya.MDGModifier> modifier used for creating the missing curves.
+    :return: <int> the number of curves applied.
+    """
+    for node_name, attribute_name, curve_data in curves:
+        apply_anim_curve_arrays(node_name, attribute_name, curve_data, offset_value=offset_value,
+                                m_curve_change=m_curve_change, m_dag_mod=m_dag_mod)
+    return len(curves)
+
+
+def apply_anim_curve_arrays_to_curve(anim_fn, curve_data=None, offset_value=0, m_curve_change=None):
+    """applies the curve arrays onto an existing anim curve, replacing its keys.
+    :param anim_fn: <OpenMayaAnim.MFnAnimCurve> the anim curve function set.
+    :param curve_data: <dict> curve arrays as returned by get_anim_curve_arrays.
+    :param offset_value: <float> the input offset to apply to the keys.
+    :param m_curve_change: <OpenMayaAnim.MAnimCurveChange> use this change object for the undo/ redo behavior.
+    :return: <OpenMayaAnim.MFnAnimCurve> the anim curve function set.
+    """
+    if m_curve_change is None:
+        m_curve_change = OpenMayaAnim.MAnimCurveChange()
+    curve_type = curve_data['curveType']
+    for i in reversed(range(anim_fn.numKeys())):
+        anim_fn.remove(i, m_curve_change)
+
+    key_indices = add_keys_bulk(anim_fn,
+                                [x + offset_value for x in curve_data['inputs']],
+                                [to_internal_value(curve_type, v) for v in curve_data['values']],
+                                curve_data['inTangentTypes'],
+                                curve_data['outTangentTypes'],
+                                unitless=curve_data['isUnitless'],
+                                m_curve_change=m_curve_change)
+
+    anim_fn.setIsWeighted(bool(curve_data['isWeighted']), m_curve_change)
+    anim_fn.setPreInfinityType(curve_data['preInfinityType'], m_curve_change)
+    anim_fn.setPostInfinityType(curve_data['postInfinityType'], m_curve_change)
+    angle = OpenMaya.MAngle()
+    for k, i in enumerate(key_indices):
+        anim_fn.setTangentsLocked(i, False, m_curve_change)
+        angle.setValue(radians(curve_data['inAngles'][k]))
+        anim_fn.setTangent(i, angle, curve_data['inWeights'][k], True, m_curve_change)
+        angle.setValue(radians(curve_data['outAngles'][k]))
+        anim_fn.setTangent(i, angle, curve_data['outWeights'][k], False, m_curve_change)
+        anim_fn.setTangentsLocked(i, bool(curve_data['tangentsLocked'][k]), m_curve_change)
+        anim_fn.setWeightsLocked(i, bool(curve_data['weightsLocked'][k]), m_curve_change)
+        anim_fn.setIsBreakdown(i, bool(curve_data['isBreakdown'][k]), m_curve_change)
+    return anim_fn
+
+
+def add_keys_bulk(anim_fn, inputs=(), values=(), in_tangent_types=(), out_tangent_types=(), unitless=False,
+                  time_unit=None, keep_existing_keys=True, m_curve_change=None):
+    """adds all the keys to the anim curve in a single addKeys call, then sets the per key tangent types.
+    unitless input curves have no addKeys equivalent, so their keys are added with addKey.
+    :param anim_fn: <OpenMayaAnim.MFnAnimCurve> the anim curve function set.
+    :param inputs: <list> key times in time_unit, or unitless inputs.
+    :param values: <list> key values in internal units.
+    :param in_tangent_types: <list> MFnAnimCurve.TangentType per key.
+    :param out_tangent_types: <list> MFnAnimCurve.TangentType per key.
+    :param unitless: <bool> the anim curve has unitless inputs.
+    :param time_unit: <int> OpenMaya.MTime unit of the input times, defaults to the ui unit.
+    :param keep_existing_keys: <bool> merge the keys with the existing keys on the curve.
+    :param m_curve_change: <OpenMayaAnim.MAnimCurveChange> use this change object for the undo/ redo behavior.
+    :return: <list> the key index of each input.
+    """
+    if time_unit is None:
+        time_unit = OpenMaya.MTime.uiUnit()
+    global_type = OpenMayaAnim.MFnAnimCurve.kTangentGlobal
+    if unitless:
+        for input_value, value in zip(inputs, values):
+            anim_fn.addKey(input_value, value, global_type, global_type, m_curve_change)
+    else:
+        m_times = OpenMaya.MTimeArray()
+        m_values = OpenMaya.MDoubleArray()
+        for input_value, value in zip(inputs, values):
+            m_times.append(OpenMaya.MTime(input_value, time_unit))
+            m_values.append(value)
+        anim_fn.addKeys(m_times, m_values, global_type, global_type, keep_existing_keys, m_curve_change)
+
+    # map every key input to its index in one pass over the curve
+    index_map = {}
+    for i in range(anim_fn.numKeys()):
+        if unitless:
+            key_input = anim_fn.unitlessInput(i)
+        else:
+            key_input = anim_fn.time(i).asUnits(time_unit)
+        index_map[round(key_input, 6)] = i
+    key_indices = [index_map[round(input_value, 6)] for input_value in inputs]
+
+    for idx, in_type, out_type in zip(key_indices, in_tangent_types, out_tangent_types):
+        anim_fn.setInTangentType(idx, in_type, m_curve_change)
+        anim_fn.setOutTangentType(idx, out_type, m_curve_change)
+    return key_indices
+
+
+def _sample_slope(inputs, values, index):
+    """the slope of the sampled curve at the index, from its neighboring samples.
+    :param inputs: <list> sample inputs.
+    :param values: <list> sample values.
+    :param index: <int> sample index.
+    :return: <float> slope.
+    """
+    prev_index = max(index - 1, 0)
+    next_index = min(index + 1, len(inputs) - 1)
+    dt = inputs[next_index] - inputs[prev_index]
+    if not dt:
+        return 0.0
+    return (values[next_index] - values[prev_index]) / dt
+
+
+def _hermite_segment_error(points, slopes, first, last):
+    """the largest value error of the samples between two keys, against the Hermite segment
+    built from the key values and slopes.
+    :param points: <list> (input, value) samples.
+    :param slopes: <list> sample slopes.
+    :param first: <int> first key sample index.
+    :param last: <int> last key sample index.
+    :return: <tuple> largest error, sample index.
+    """
+    x0, y0 = points[first]
+    x1, y1 = points[last]
+    dt = x1 - x0
+    m0 = slopes[first] * dt
+    m1 = slopes[last] * dt
+    error = 0.0
+    index = first
+    for i in range(first + 1, last):
+        s = (points[i][0] - x0) / dt
+        s2 = s * s
+        s3 = s2 * s
+        value = ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * m0 +
+                 (3 * s2 - 2 * s3) * y1 + (s3 - s2) * m1)
+        d = abs(value - points[i][1])
+        if d > error:
+            error = d
+            index = i
+    return error, index
+
+
+def fit_curve_keys(inputs, values, tolerance=0.01):
+    """finds the fewest keys with fixed tangents that reproduce the sampled curve within tolerance.
+    keys are split with an iterative Ramer-Douglas-Peucker, measuring the error against the Hermite
+    segment between the keys with tangents fitted to the sample slopes.
+    :param inputs: <list> sample inputs, sorted.
+    :param values: <list> sample values.
+    :param tolerance: <float> the largest value error allowed.
+    :return: <tuple> kept sample indices, tangent angles in degrees.
+    """
+    points = list(zip(inputs, values))
+    slopes = [_sample_slope(inputs, values, i) for i in range(len(points))]
+    key_indices = math_utils.simplify_indices(
+        points, tolerance, error_fn=lambda p, first, last: _hermite_segment_error(p, slopes, first, last))
+    angles = [degrees(atan(slopes[i])) for i in key_indices]
+    return key_indices, angles
+
+
+def reduce_anim_keys(objects=(), tolerance=0.01, attribute_tolerances=None, apply=True):
+    """reduces the keys of every anim curve on the objects, for dense baked animation.
+    all curves are changed from one animCurveEdit command, undone with a single undo.
+    :param objects: <list> the objects to reduce, defaults to the selected objects.
+    :param tolerance: <float> the largest value error allowed, in ui units.
+    :param attribute_tolerances: <dict> tolerance per attribute name or node.attribute name.
+    :param apply: <bool> replace the curve keys, otherwise only report.
+    :return: <dict> curves: {node.attribute: (keys before, keys after)}, keys_before, keys_after, ratio.
+    """
+    if not objects:
+        objects = object_utils.get_selected_objects_gen()
+    if attribute_tolerances is None:
+        attribute_tolerances = {}
+    report = {'curves': {}, 'keys_before': 0, 'keys_after': 0}
+    reduced_curves = []
+    fixed_type = OpenMayaAnim.MFnAnimCurve.kTangentFixed
+    for anim_obj_name in objects:
+        for curve_node, plug_name in get_anim_curve_plugs(anim_obj_name):
+            node_name, attr = plug_name.split('.', 1)
+            curve_data = get_anim_curve_arrays(get_mfn_anim_node(curve_node))
+            num_keys = len(curve_data['inputs'])
+            attr_tolerance = attribute_tolerances.get(plug_name, attribute_tolerances.get(attr, tolerance))
+            key_indices, angles = fit_curve_keys(curve_data['inputs'], curve_data['values'], attr_tolerance)
+            num_reduced = len(key_indices)
+            report['curves'][plug_name] = (num_keys, num_reduced)
+            report['keys_before'] += num_keys
+            report['keys_after'] += num_reduced
+            if not apply or num_reduced == num_keys:
+                continue
+
+            reduced = dict(curve_data)
+            for key in ('inputs', 'values'):
+                reduced[key] = [curve_data[key][i] for i in key_indices]
+            reduced.update({
+                'isWeighted': False,
+                'inTangentTypes': [fixed_type] * num_reduced,
+                'outTangentTypes': [fixed_type] * num_reduced,
+                'inAngles': angles,
+                'outAngles': angles,
+                'inWeights': [1.0] * num_reduced,
+                'outWeights': [1.0] * num_reduced,
+                'tangentsLocked': [True] * num_reduced,
+                'weightsLocked': [False] * num_reduced,
+                'isBreakdown': [False] * num_reduced,
+            })
+            reduced_curves.append((node_name, attr, reduced))
+    if reduced_curves:
+        run_curve_edit(apply_anim_curves, reduced_curves)
+    if report['keys_before']:
+        report['ratio'] = float(report['keys_after']) / report['keys_before']
+    else:
+        report['ratio'] = 1.0
+    print("[ReduceAnimKeys] :: {} keys reduced to {}, {:.1f}% of the original.".format(
+        report['keys_before'], report['keys_after'], report['ratio'] * 100.0))
+    return report
+
+
 def _get_file_from_dir(dir_name=""):
     """return file name from directory
     """
@@ -372,58 +768,81 @@ def get_tangents_angle_from_time(a_node, idx=0):
 
 
 def add_keys_from_data(anim_data={}, offset_value=0, add_key=True, apply_angles=True, apply_xy=True):
-    """sets the animation data onto the object name
-    :param object_name: <str> the name of the object to add keyframes to
+    """sets the animation data onto the object name.
+    the keys of each curve are created in a single addKeys call and the tangents are fixed up in one pass,
+    all from one animCurveEdit command, undone with a single undo.
+    :param anim_data: <dict> animation data from get_anim_curve_data.
+    :param offset_value: <float> the time offset to apply to the keys.
+    :param add_key: <bool> create the keys, otherwise only apply the tangents and properties onto existing keys.
+    :param apply_angles: <bool> apply the tangent angles and weights.
+    :param apply_xy: <bool> apply the tangent XY values.
+    :return: <bool> True for success.
+    """
+    return run_curve_edit(_add_keys_from_data, anim_data, offset_value=offset_value, add_key=add_key,
+                          apply_angles=apply_angles, apply_xy=apply_xy)
+
+
+def _add_keys_from_data(anim_data=None, offset_value=0, add_key=True, apply_angles=True, apply_xy=True,
+                        m_curve_change=None, m_dag_mod=None):
+    """the add_keys_from_data edit, run from the animCurveEdit command.
     """
-    anim_indices = {}
     for node_name, a_list in anim_data.items():
-        # use this node for the undo/ redo behavior
-        m_curve_change = OpenMayaAnim.MAnimCurveChange()
-        anim_fn = None
-        anim_indices[node_name] = {
-            'indices': (), 'anim_nodes': (), 'angle_tangents': (), 'property_data': (), 'xy_tangent_data': ()}
+        # gather the keys of this curve as arrays, in time order
+        keys = []
         for a_data_dict in a_list:
             for anim_index, a_data_list in a_data_dict.items():
-                node_data, xy_tangent_data, angle_tangent_data, property_data, key_type = a_data_list
-                m_time = OpenMaya.MTime(
-                    node_data["time"] + offset_value, OpenMaya.MTime.kFilm)
-                if not anim_fn:
-                    # get anim_fn instead of finding a key at time
-                    object_name = node_name[:node_name.rfind('_')]
-                    anim_fn = find_keyframe(object_name, m_time, anim_index)
-                    if not anim_fn:
-                        anim_fn, m_dag_mod = add_keyframe_node(
-                            node_name, key_type["type"])
-                if add_key:
-                    anim_fn.addKeyframe(
-                        m_time, node_data["value"], angle_tangent_data["in"][0], angle_tangent_data["out"][0], m_curve_change)
-                anim_indices[node_name]['indices'] += int(anim_index),
-                anim_indices[node_name]['anim_nodes'] += anim_fn,
-                anim_indices[node_name]['property_data'] += property_data,
-                anim_indices[node_name]['angle_tangents'] += angle_tangent_data,
-                anim_indices[node_name]['xy_tangent_data'] += xy_tangent_data,
-                anim_fn.evaluate(m_time)
-    # the argument is that the tangents aren't created until all the keys have been made
-    for anim_node, anim_data in anim_indices.items():
-        anim_idxs = anim_data['indices']
-        anim_nodes = anim_data['anim_nodes']
-        property_data = anim_data['property_data']
-        angle_tangent_data = anim_data['angle_tangents']
-        xy_tangent_data = anim_data['xy_tangent_data']
-        for node_fn in anim_nodes:
-            # anim indices start at 1, we want the system to start counting from 0
-            for idx, anim_idx in enumerate(anim_idxs):
-                # unlock the tangents first, if there are any
-                set_properties_at_time(
-                    node_fn, property_data[idx], anim_idx)
-                # set the XY coordinate to tangents
-                if apply_xy:
-                    set_tangent_XY_at_time(
-                        node_fn, xy_tangent_data[idx], anim_idx)
-                # set the angles to tangents
-                if apply_angles:
-                    set_tangents_angle_at_time(
-                        node_fn, angle_tangent_data[idx], anim_idx)
+                keys.append(a_data_list)
+        if not keys:
+            continue
+        keys.sort(key=lambda k: k[0]["time"])
+        node_datas, xy_tangent_datas, angle_tangent_datas, property_datas, key_types = zip(*keys)
+        times = [node_data["time"] + offset_value for node_data in node_datas]
+
+        object_name = node_name[:node_name.rfind('_')]
+        attribute_name = node_name[node_name.rfind('_') + 1:]
+        anim_fn = get_or_create_anim_curve(object_name, attribute_name, key_types[0]["type"], m_dag_mod=m_dag_mod)
+
+        if add_key:
+            key_indices = add_keys_bulk(anim_fn, times, [node_data["value"] for node_data in node_datas],
+                                        [angle_data["in"][0] for angle_data in angle_tangent_datas],
+                                        [angle_data["out"][0] for angle_data in angle_tangent_datas],
+                                        time_unit=OpenMaya.MTime.kFilm,
+                                        m_curve_change=m_curve_change)
+        else:
+            key_indices = []
+            for key_time in times:
+                idx = object_utils.ScriptUtil(as_uint_ptr=True)
+                anim_fn.find(OpenMaya.MTime(key_time, OpenMaya.MTime.kFilm), idx.ptr)
+                key_indices.append(OpenMaya.MScriptUtil.getUint(idx.ptr))
+
+        # the curve level properties only need to be set once
+        property_data = property_datas[0]
+        anim_fn.setIsWeighted(property_data["isWeighted"], m_curve_change)
+        anim_fn.setPreInfinityType(property_data["preInfinityType"], m_curve_change)
+        anim_fn.setPostInfinityType(property_data["postInfinityType"], m_curve_change)
+
+        # the tangents aren't valid until all the keys have been made, fix them up in one pass
+        angle = OpenMaya.MAngle()
+        angle.setUnit(OpenMaya.MAngle.kRadians)
+        for k, idx in enumerate(key_indices):
+            property_data = property_datas[k]
+            # unlock the tangents first, if there are any
+            anim_fn.setTangentsLocked(idx, False, m_curve_change)
+            anim_fn.setIsBreakdown(idx, property_data["isBreakdown"], m_curve_change)
+            anim_fn.setWeightsLocked(idx, property_data["weightsLocked"], m_curve_change)
+            # set the XY coordinate to tangents
+            if apply_xy:
+                xy_data = xy_tangent_datas[k]
+                anim_fn.setTangent(idx, xy_data["xy_in"][1], xy_data["xy_in"][2], True, m_curve_change)
+                anim_fn.setTangent(idx, xy_data["xy_out"][1], xy_data["xy_out"][2], False, m_curve_change)
+            # set the angles to tangents
+            if apply_angles:
+                angle_data = angle_tangent_datas[k]
+                angle.setValue(angle_data["in"][1])
+                anim_fn.setTangent(idx, angle, angle_data["in"][2], True, m_curve_change)
+                angle.setValue(angle_data["out"][1])
+                anim_fn.setTangent(idx, angle, angle_data["out"][2], False, m_curve_change)
+            anim_fn.setTangentsLocked(idx, property_data["tangentsLocked"], m_curve_change)
     # MS::kSuccess
     return True
 
@@ -698,6 +1117,68 @@ def get_anim_connections(object_name=""):
     return found_nodes
 
 
+def get_anim_curve_arrays(anim_fn):
+    """reads every key of the anim curve in a single pass of MFnAnimCurve queries.
+    inputs and values are in ui units, angles in degrees.
+    :param anim_fn: <OpenMayaAnim.MFnAnimCurve> the anim curve function set.
+    :return: <dict> parallel key arrays.
+    """
+    curve_type = anim_fn.animCurveType()
+    is_unitless = anim_fn.isUnitlessInput()
+    is_angular = curve_type in (OpenMayaAnim.MFnAnimCurve.kAnimCurveTA, OpenMayaAnim.MFnAnimCurve.kAnimCurveUA)
+    is_linear = curve_type in (OpenMayaAnim.MFnAnimCurve.kAnimCurveTL, OpenMayaAnim.MFnAnimCurve.kAnimCurveUL)
+    time_unit = OpenMaya.MTime.uiUnit()
+    angle_unit = OpenMaya.MAngle.uiUnit()
+    distance_unit = OpenMaya.MDistance.uiUnit()
+
+    # the tangent XY values are only stored on the curve attributes
+    node_fn = OpenMaya.MFnDependencyNode(anim_fn.object())
+    tan_plugs = [node_fn.findPlug(a) for a in ('keyTanInX', 'keyTanInY', 'keyTanOutX', 'keyTanOutY')]
+
+    data = {
+        'curveType': curve_type,
+        'isUnitless': is_unitless,
+        'isWeighted': anim_fn.isWeighted(),
+        'preInfinityType': anim_fn.preInfinityType(),
+        'postInfinityType': anim_fn.postInfinityType(),
+    }
+    keys = ('inputs', 'values', 'inTangentTypes', 'outTangentTypes', 'inAngles', 'outAngles',
+            'inWeights', 'outWeights', 'inX', 'inY', 'outX', 'outY', 'tangentsLocked', 'weightsLocked',
+            'isBreakdown')
+    for key in keys:
+        data[key] = []
+
+    angle = OpenMaya.MAngle()
+    weight = object_utils.ScriptUtil(as_double_ptr=True)
+    for i in range(anim_fn.numKeys()):
+        if is_unitless:
+            data['inputs'].append(anim_fn.unitlessInput(i))
+        else:
+            data['inputs'].append(anim_fn.time(i).asUnits(time_unit))
+        value = anim_fn.value(i)
+        if is_angular:
+            value = OpenMaya.MAngle(value).asUnits(angle_unit)
+        elif is_linear:
+            value = OpenMaya.MDistance(value).asUnits(distance_unit)
+        data['values'].append(value)
+        data['inTangentTypes'].append(anim_fn.inTangentType(i))
+        data['outTangentTypes'].append(anim_fn.outTangentType(i))
+        anim_fn.getTangent(i, angle, weight.ptr, True)
+        data['inAngles'].append(angle.asDegrees())
+        data['inWeights'].append(weight.get_double())
+        anim_fn.getTangent(i, angle, weight.ptr, False)
+        data['outAngles'].append(angle.asDegrees())
+        data['outWeights'].append(weight.get_double())
+        data['inX'].append(tan_plugs[0].elementByLogicalIndex(i).asDouble())
+        data['inY'].append(tan_plugs[1].elementByLogicalIndex(i).asDouble())
+        data['outX'].append(tan_plugs[2].elementByLogicalIndex(i).asDouble())
+        data['outY'].append(tan_plugs[3].elementByLogicalIndex(i).asDouble())
+        data['tangentsLocked'].append(anim_fn.tangentsLocked(i))
+        data['weightsLocked'].append(anim_fn.weightsLocked(i))
+        data['isBreakdown'].append(anim_fn.isBreakdown(i))
+    return data
+
+
 def get_animation_data_from_node(object_node=""):
     """get the animation data from the node specified.
     :param object_node: <str> the object to check the data.
@@ -731,54 +1212,29 @@ def get_animation_data_from_node(object_node=""):
                                   'sourceAttr': source_attr,
                                   'targetAttr': destination_attr
                                   }
+        # read all the keys at once, then shape them as the keyframe/ keyTangent queries used to
+        curve_data = get_anim_curve_arrays(o_anim)
         for i_key in range(number_of_keys):
-            # get the information the old way
-            v_float = cmds.keyframe(object_node, q=1, valueChange=1)[i_key]
-            try:
-                t_float = cmds.keyframe(object_node, floatChange=1, q=1)[i_key]
-            except TypeError:
-                t_float = i_key
-            time = cmds.keyframe(object_node,
-                                 q=True, index=(i_key, i_key))[0]
-            time = int(time)
-            o_x = cmds.getAttr('{}.keyTanOutX[{}]'.format(object_node, i_key))
-            o_y = cmds.getAttr('{}.keyTanOutY[{}]'.format(object_node, i_key))
-            i_x = cmds.getAttr('{}.keyTanInX[{}]'.format(object_node, i_key))
-            i_y = cmds.getAttr('{}.keyTanInY[{}]'.format(object_node, i_key))
-            in_angle = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, inAngle=True)
-            in_weight = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, inWeight=True)
-            out_angle = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, outAngle=True)
-            out_weight = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, outWeight=True)
-            # ...tangent properties
-            lock_tangents = cmds.keyTangent("{}".format(object_node),
-                                            time=(time, time), query=True, lock=True)
-            out_tangent = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, outTangentType=True)
-            in_tangent = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, inTangentType=True)
-            weight_lock = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, weightLock=True)
-            weight_tangent = cmds.keyTangent("{}".format(object_node), time=(
-                time, time), query=True, weightedTangents=True)
+            input_value = curve_data['inputs'][i_key]
+            # the float key of time based curves is the key index, as keyframe -floatChange is empty for them
+            t_float = input_value if curve_data['isUnitless'] else i_key
+            time = int(input_value)
             # save the information
-            anim_data[object_node]['tangents'][t_float] = {'time': time,
-                                                           'xy_out': (o_x, o_y),
-                                                           'xy_in': (i_x, i_y),
-                                                           'in_angle': (in_angle),
-                                                           'in_weight': (in_weight),
-                                                           'out_angle': (out_angle),
-                                                           'out_weight': (out_weight),
-                                                           'keyNum': i_key,
-                                                           'lock': lock_tangents,
-                                                           'out_tangent': out_tangent,
-                                                           'in_tangent': in_tangent,
-                                                           'weight_lock': weight_lock,
-                                                           'weight_tangent': weight_tangent}
-            anim_data[object_node]['values'][t_float] = v_float
+            anim_data[object_node]['tangents'][t_float] = {
+                'time': time,
+                'xy_out': (curve_data['outX'][i_key], curve_data['outY'][i_key]),
+                'xy_in': (curve_data['inX'][i_key], curve_data['inY'][i_key]),
+                'in_angle': [curve_data['inAngles'][i_key]],
+                'in_weight': [curve_data['inWeights'][i_key]],
+                'out_angle': [curve_data['outAngles'][i_key]],
+                'out_weight': [curve_data['outWeights'][i_key]],
+                'keyNum': i_key,
+                'lock': [curve_data['tangentsLocked'][i_key]],
+                'out_tangent': [__anim_tangentTypeName.get(curve_data['outTangentTypes'][i_key], "auto")],
+                'in_tangent': [__anim_tangentTypeName.get(curve_data['inTangentTypes'][i_key], "auto")],
+                'weight_lock': [curve_data['weightsLocked'][i_key]],
+                'weight_tangent': [curve_data['isWeighted']]}
+            anim_data[object_node]['values'][t_float] = curve_data['values'][i_key]
     return anim_data
 
 
@@ -1,3 +1,13 @@
+# import standard modules
+import gzip
+import json
+import shutil
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 # import maya modules
 from maya import cmds
 try:
@@ -13,6 +23,59 @@ reload(file_utils)
 # load the atom importer/ exporter
 cmds.loadPlugin('atomImportExport', quiet=True)
 
+# define local variables
+ATOM_EXT = 'atom'
+COMPRESSED_EXT = 'atom.gz'
+MANIFEST_FILE = 'atomManifest.json'
+
+
+def get_atom_import_options(min_time, max_time):
+    """the atomImport options string.
+    :param min_time: <float> source and destination start time.
+    :param max_time: <float> source and destination end time.
+    :return: <str> options.
+    """
+    proj_path = cmds.workspace(rd=True, q=True)
+    return (
+        ";;"
+        "targetTime=1;"
+        "srcTime={min_time}:{max_time};"
+        "dstTime={min_time}:{max_time};"
+        "option=scaleInsert;"
+        "match=hierarchy;"
+        ";"
+        "selected=selectedOnly;"
+        "search=;"
+        "replace=;"
+        "prefix=;"
+        "suffix=;"
+        "mapFile={proj_path}/data/;"
+        "".format(min_time=min_time, max_time=max_time, proj_path=proj_path))
+
+
+def get_atom_export_options(min_time, max_time):
+    """the atomExport options string.
+    :param min_time: <float> export range start time.
+    :param max_time: <float> export range end time.
+    :return: <str> options.
+    """
+    return (
+        "precision=8;"
+        "statics=1;"
+        "baked=1;"
+        "sdk=0;"
+        "constraint=0;"
+        "animLayers=0;"
+        "selected=selectedOnly;"
+        "whichRange=1;"
+        "range={min_time}:{max_time};"
+        "hierarchy=none;"
+        "controlPoints=0;"
+        "useChannelBox=1;"
+        "options=keys;"
+        "copyKeyCmd=-animation objects -option keys -hierarchy none -controlPoints 0 "
+        "".format(min_time=min_time, max_time=max_time))
+
 
 def import_atom(atom_file_name=""):
     """imports the atom file
@@ -22,6 +85,8 @@ def import_atom(atom_file_name=""):
     if not atom_file_name:
         directory_name = file_utils.temp_dir
         objects = object_utils.get_selected_node(single=False)
+        min_time, max_time = animation_utils.get_time_range()
+        atom_import_options = get_atom_import_options(min_time, max_time)
         for anim_obj_name in objects:
             atom_file_name = file_utils.posixpath.join(
                 directory_name, anim_obj_name)
@@ -30,23 +95,6 @@ def import_atom(atom_file_name=""):
                 continue
             base_name = file_utils.get_file_name_from_file_path(atom_file_name)
             namespace = file_utils.remove_file_ext(base_name)
-            min_time, max_time = animation_utils.get_time_range()
-            proj_path = cmds.workspace(rd=True, q=True)
-            atom_import_options = (
-                ";;"
-                "targetTime=1;"
-                "srcTime={min_time}:{max_time};"
-                "dstTime={min_time}:{max_time};"
-                "option=scaleInsert;"
-                "match=hierarchy;"
-                ";"
-                "selected=selectedOnly"
-                "search=;"
-                "replace=;"
-                "prefix=;"
-                "suffix=;"
-                "mapFile={proj_path}/data/;"
-                "".format(min_time=min_time, max_time=max_time, proj_path=proj_path))
             print("Importing file: ", atom_file_name)
             cmds.file(atom_file_name, i=True, type="atomImport", renameAll=True,
                       namespace=namespace, options=atom_import_options)
@@ -58,31 +106,248 @@ def export_atom(atom_file_name=""):
     :return: None
     """
     min_time, max_time = animation_utils.get_time_range()
+    atom_export_options = get_atom_export_options(min_time, max_time)
     if not atom_file_name:
         directory_name = file_utils.temp_dir
         objects = object_utils.get_selected_node(single=False)
         for anim_obj_name in objects:
             file_name = file_utils.posixpath.join(
                 directory_name, anim_obj_name)
-            atom_export_options = (
-                "precision=8;"
-                "statics=1;"
-                "baked=1;"
-                "sdk=0;"
-                "constraint=0;"
-                "animLayers=0;"
-                "selected=selectedOnly;"
-                "whichRange=1;"
-                "range={min_time}:{max_time};"
-                "hierarchy=none;"
-                "controlPoints=0;"
-                "useChannelBox=1;"
-                "options=keys;"
-                "copyKeyCmd=-animation objects -option keys -hierarchy none -controlPoints 0 "
-                "".format(min_time=min_time, max_time=max_time))
             print("exporting file: {}".format(file_name))
             cmds.file(file_name, force=True, options=atom_export_options,
                       constructionHistory=True, typ="atomExport", exportSelected=True)
     return True
+
+
+def _atom_file_stem(object_name=""):
+    """a file name safe stem for the object name.
+    :param object_name: <str> the maya object name.
+    :return: <str> file stem.
+    """
+    return object_name.strip('|').replace('|', '__').replace(':', '--')
+
+
+def compress_file(source_file="", target_file="", remove_source=True):
+    """gzip compresses the file.
+    :param source_file: <str> file to compress.
+    :param target_file: <str> compressed file name.
+    :param remove_source: <bool> delete the source file after compressing.
+    :return: <str> compressed file name.
+    """
+    with open(source_file, 'rb') as source, gzip.open(target_file, 'wb') as target:
+        shutil.copyfileobj(source, target)
+    if remove_source:
+        file_utils.remove_file(source_file)
+    return target_file
+
+
+def decompress_file(source_file="", target_file=""):
+    """decompresses the gzip file.
+    :param source_file: <str> compressed file.
+    :param target_file: <str> decompressed file name.
+    :return: <str> decompressed file name.
+    """
+    with gzip.open(source_file, 'rb') as source, open(target_file, 'wb') as target:
+        shutil.copyfileobj(source, target)
+    return target_file
+
+
+def prepare_atom_file(file_name=""):
+    """the importable atom file, compressed files are decompressed next to themselves.
+    :param file_name: <str> atom file, compressed or not.
+    :return: <str> atom file name.
+    """
+    if file_name.endswith(COMPRESSED_EXT):
+        return decompress_file(file_name, file_name[:-len('.gz')])
+    return file_name
+
+
+def _file_worker(task_queue, task_fn, results, errors):
+    """runs the file tasks from the queue until it receives None.
+    every task posts a result, None when it failed, so readers waiting on the results never block.
+    :param task_queue: <queue.Queue> argument tuples for the task function.
+    :param task_fn: <function> the file task.
+    :param results: <queue.Queue>, <list> receives the task results.
+    :param errors: <list> receives the failed task arguments and errors.
+    """
+    while True:
+        task_args = task_queue.get()
+        if task_args is None:
+            break
+        try:
+            result = task_fn(*task_args)
+        except Exception as error:
+            errors.append((task_args, error))
+            result = None
+        if isinstance(results, list):
+            results.append(result)
+        else:
+            results.put(result)
+
+
+def _start_file_worker(task_fn, results):
+    """starts a file worker thread.
+    :param task_fn: <function> the file task.
+    :param results: <queue.Queue>, <list> receives the task results.
+    :return: <tuple> task queue, worker thread, errors list.
+    """
+    task_queue = queue.Queue()
+    errors = []
+    worker = threading.Thread(target=_file_worker, args=(task_queue, task_fn, results, errors))
+    worker.daemon = True
+    worker.start()
+    return task_queue, worker, errors
+
+
+def export_atom_batch(objects=(), directory_name="", compress=True):
+    """exports the animation of every object into its own atom file in one pass.
+    Maya writes each file on the main thread while the previously written files are compressed on a worker thread.
+    a manifest of the object names is written next to the files.
+    :param objects: <list> the objects to export, defaults to the selected objects.
+    :param directory_name: <str> the export directory, defaults to the temp directory.
+    :param compress: <bool> gzip compress the atom files.
+    :return: <dict> object name: file name.
+    """
+    if not directory_name:
+        directory_name = file_utils.temp_dir
+    if not objects:
+        objects = object_utils.get_selected_node(single=False) or ()
+    file_utils.build_dir(directory_name)
+    min_time, max_time = animation_utils.get_time_range()
+    atom_export_options = get_atom_export_options(min_time, max_time)
+
+    written = []
+    task_queue, worker, errors = _start_file_worker(compress_file, written)
+    manifest = {}
+    selection = cmds.ls(sl=True)
+    try:
+        for anim_obj_name in objects:
+            stem = file_utils.posixpath.join(directory_name, _atom_file_stem(anim_obj_name))
+            atom_file_name = '{}.{}'.format(stem, ATOM_EXT)
+            cmds.select(anim_obj_name, replace=True)
+            cmds.file(atom_file_name, force=True, options=atom_export_options,
+                      constructionHistory=True, typ="atomExport", exportSelected=True)
+            if compress:
+                compressed_file_name = '{}.{}'.format(stem, COMPRESSED_EXT)
+                task_queue.put((atom_file_name, compressed_file_name))
+                manifest[anim_obj_name] = file_utils.get_file_name_from_file_path(compressed_file_name)
+            else:
+                manifest[anim_obj_name] = file_utils.get_file_name_from_file_path(atom_file_name)
+    finally:
+        task_queue.put(None)
+        worker.join()
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+    # the files that could not be compressed are kept uncompressed
+    failed_files = dict((file_utils.get_file_name_from_file_path(task_args[1]), task_args[0])
+                        for task_args, _ in errors)
+    for anim_obj_name, file_name in manifest.items():
+        if file_name in failed_files:
+            manifest[anim_obj_name] = file_utils.get_file_name_from_file_path(failed_files[file_name])
+    for task_args, error in errors:
+        print("[ExportAtomBatch] :: Could not compress {}: {}".format(task_args[0], error))
+
+    with open(file_utils.posixpath.join(directory_name, MANIFEST_FILE), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    print("[ExportAtomBatch] :: {} objects exported to {}.".format(len(manifest), directory_name))
+    return dict((k, file_utils.posixpath.join(directory_name, v)) for k, v in manifest.items())
+
+
+def build_name_index(node_type='transform'):
+    """indexes the scene nodes by their name, their leaf name and their name without namespaces.
+    names that are not unique are left out of the leaf and namespace free lookups.
+    :param node_type: <str> the node type to index.
+    :return: <dict> name: node name.
+    """
+    index = {}
+    ambiguous = set()
+    nodes = cmds.ls(type=node_type, long=True) or []
+    for node in nodes:
+        leaf_name = node.rpartition('|')[-1]
+        for key in (leaf_name, leaf_name.rpartition(':')[-1]):
+            if key in index and index[key] != node:
+                ambiguous.add(key)
+            index[key] = node
+    for key in ambiguous:
+        index.pop(key, None)
+    for node in nodes:
+        index[node] = node
+    return index
+
+
+def resolve_atom_target(object_name="", name_index=None):
+    """finds the scene node for the exported object name.
+    :param object_name: <str> the exported object name.
+    :param name_index: <dict> from build_name_index.
+    :return: <str> scene node name. <None> if not found.
+    """
+    leaf_name = object_name.rpartition('|')[-1]
+    for key in (object_name, leaf_name, leaf_name.rpartition(':')[-1]):
+        if key in name_index:
+            return name_index[key]
+    return None
+
+
+def import_atom_batch(directory_name="", objects=()):
+    """imports the atom files written by export_atom_batch onto the matching scene objects.
+    the targets are resolved from a name index built once, and the compressed files are decompressed
+    on a worker thread ahead of the imports.
+    :param directory_name: <str> the directory with the atom files, defaults to the temp directory.
+    :param objects: <list> only import these exported object names, defaults to every object in the manifest.
+    :return: <dict> exported object name: scene node name.
+    """
+    if not directory_name:
+        directory_name = file_utils.temp_dir
+    manifest_file_name = file_utils.posixpath.join(directory_name, MANIFEST_FILE)
+    if not file_utils.is_file(manifest_file_name):
+        raise IOError("[ImportAtomBatch] :: No atom manifest found: {}".format(manifest_file_name))
+    with open(manifest_file_name, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    name_index = build_name_index()
+    targets = []
+    for anim_obj_name in sorted(objects or manifest):
+        if anim_obj_name not in manifest:
+            continue
+        target = resolve_atom_target(anim_obj_name, name_index)
+        if target is None:
+            print("[ImportAtomBatch] :: No scene object found for: {}".format(anim_obj_name))
+            continue
+        targets.append((anim_obj_name, target, file_utils.posixpath.join(directory_name, manifest[anim_obj_name])))
+
+    min_time, max_time = animation_utils.get_time_range()
+    atom_import_options = get_atom_import_options(min_time, max_time)
+
+    # every file goes through the worker, so the results arrive in the order of the targets
+    ready = queue.Queue()
+    task_queue, worker, errors = _start_file_worker(prepare_atom_file, ready)
+    for anim_obj_name, target, file_name in targets:
+        task_queue.put((file_name,))
+    task_queue.put(None)
+
+    imported = {}
+    selection = cmds.ls(sl=True)
+    try:
+        for anim_obj_name, target, file_name in targets:
+            atom_file_name = ready.get()
+            if atom_file_name is None:
+                continue
+            cmds.select(target, replace=True)
+            cmds.file(atom_file_name, i=True, type="atomImport", options=atom_import_options)
+            if file_name.endswith(COMPRESSED_EXT):
+                file_utils.remove_file(atom_file_name)
+            imported[anim_obj_name] = target
+    finally:
+        worker.join()
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+    for task_args, error in errors:
+        print("[ImportAtomBatch] :: Could not read {}: {}".format(task_args[0], error))
+    print("[ImportAtomBatch] :: {} objects imported from {}.".format(len(imported), directory_name))
+    return imported
 # __________________________________________________________________________________________________________________
 # atom_utils.py
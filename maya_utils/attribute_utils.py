@@ -256,6 +256,23 @@ def get_mfn_obj(m_obj=None):
     elif isinstance(m_obj, OpenMaya.MObject):
         return OpenMaya.MFnDependencyNode(m_obj)
 
+def get_non_zero_values(attr_data=None):
+    """
+    identify which attribute values are not their default values.
+    :param attr_data: <dict> attribute values, as read by the Attributes class.
+    :return: <dict> dictionary of non zero values.
+    """
+    non_zero = {}
+    for k, v in attr_data.items():
+        if k not in 'visibility' and k not in Attributes.SCALE_ATTRS and v != 0.0:
+            non_zero[k] = v
+        if k in Attributes.SCALE_ATTRS and v != 1.0:
+            non_zero[k] = v
+        if k in 'visibility' and v != 1.0:
+            non_zero[k] = v
+    return non_zero
+
+
 class Attributes:
     MAYA_STR_OBJECT = None
     SCALE_ATTRS = ['scaleX', 'scaleY', 'scaleZ']
@@ -725,15 +742,7 @@ class Attributes:
         identify which values are not their default values.
         :return: <dict> dictionary of non zero values.
         """
-        non_zero = {}
-        for k, v in self.items():
-            if k not in'visibility' and k not in self.SCALE_ATTRS and v != 0.0:
-                non_zero[k] = v
-            if k in self.SCALE_ATTRS and v != 1.0:
-                non_zero[k] = v
-            if k in 'visibility' and v != 1.0:
-                non_zero[k] = v
-        return non_zero
+        return get_non_zero_values(self.attr_data)
 
     def scale_attr(self):
         """
@@ -10,6 +10,7 @@ from . import object_utils
 from . import math_utils
 from . import transform_utils
 from . import attribute_utils
+from . import nurbs_kernels
 
 # define local variables
 __shape_name__ = 'nurbsCurve'
@@ -330,101 +331,71 @@ def list_scanner(array_list, index=0):
 
 
 def get_spans(ncvs, degree):
-    return ncvs - degree
+    return nurbs_kernels.get_spans(ncvs, degree)
 
 
 def get_knots(ncvs, degree):
-    return get_spans(ncvs, degree) + 2 * (degree - 1)
+    return nurbs_kernels.get_num_knots(ncvs, degree)
 
 
-def get_knot_sequence(ncvs, degree):
+def _double_array(values):
     """
-    knot sequence
-    :param ncvs:
-    :param degree:
-    :return:
+    fills an MDoubleArray in one pass.
+    :param values: <list> float values.
+    :return: <OpenMaya.MDoubleArray>
     """
-    num_knots = get_knots(ncvs, degree)
-    m_double_array = OpenMaya.MDoubleArray()
-    m_double_array.append(0)
-    for i in range(0, num_knots + degree - 1):
-        m_double_array.append(i)
-        if i == num_knots:
-            m_double_array.append(i)
+    m_double_array = OpenMaya.MDoubleArray(len(values), 0.0)
+    for i, value in enumerate(values):
+        m_double_array.set(float(value), i)
     return m_double_array
 
 
+def _point_array(points):
+    """
+    fills an MPointArray in one pass.
+    :param points: <list> xyz points.
+    :return: <OpenMaya.MPointArray>
+    """
+    m_array = OpenMaya.MPointArray(len(points))
+    for i, point in enumerate(points):
+        m_array.set(i, point[0], point[1], point[2])
+    return m_array
+
+
+def get_knot_sequence(ncvs, degree):
+    """
+    the clamped uniform knot sequence of an open curve.
+    :param ncvs: <int> the number of CVs.
+    :param degree: <int> curve degree.
+    :return: <OpenMaya.MDoubleArray> knots.
+    """
+    return _double_array(nurbs_kernels.uniform_knots(ncvs, degree))
+
+
 def get_point_array(points_array, equal_distance=False):
     """calculate the positional array object.
     :param points_array:
     :param equal_distance: <bool> calculate the equal distance of CV's
     :return:
     """
-    m_array = OpenMaya.MPointArray()
-    if equal_distance:
-        array_length = len(points_array)
-        for idx, point in enumerate(points_array):
-            if idx == 0:
-                m_array.append(OpenMaya.MPoint(*point))
-                m_array.append(OpenMaya.MPoint(*point))
-            elif idx >= 1 and idx != array_length - 1:
-                prev_p, cur_p, next_p = list_scanner(points_array, idx)
-                cur_v = math_utils.Vector(*cur_p)
-                prev_v = math_utils.Vector(*prev_p)
-                new_vec = math_utils.Vector(cur_v - prev_v)
-                new_vec = math_utils.Vector(new_vec * 0.5)
-                new_vec = math_utils.Vector(prev_v + new_vec)
-                position = (new_vec.x, new_vec.y, new_vec.z)
-                m_array.append(OpenMaya.MPoint(*position))
-            elif idx == array_length - 1:
-                prev_p, cur_p, next_p = list_scanner(points_array, idx)
-                prev_v = math_utils.Vector(*prev_p)
-                next_v = math_utils.Vector(*next_p)
-                new_vec = math_utils.Vector(next_v - prev_v)
-                new_vec = math_utils.Vector(new_vec * 0.5)
-                new_vec = math_utils.Vector(prev_v + new_vec)
-                # add two points in the same spot
-                m_array.append(OpenMaya.MPoint(new_vec.x, new_vec.y, new_vec.z))
-                m_array.append(OpenMaya.MPoint(*point))
-    else:
-        for idx, point in enumerate(points_array):
-            print(point)
-            if idx == 1:
-                prev_p, cur_p, next_p = list_scanner(points_array, idx)
-                cur_v = OpenMaya.MVector(*cur_p)
-                prev_v = OpenMaya.MVector(*prev_p)
-                new_vec = OpenMaya.MVector(cur_v - prev_v)
-                new_vec = OpenMaya.MVector(new_vec * 0.5)
-                new_vec = OpenMaya.MVector(prev_v + new_vec)
-                position = (new_vec.x, new_vec.y, new_vec.z)
-                m_array.append(OpenMaya.MPoint(*position))
-            elif idx == len(points_array) - 1:
-                prev_p, cur_p, next_p = list_scanner(points_array, idx)
-                prev_v = OpenMaya.MVector(*prev_p)
-                next_v = OpenMaya.MVector(*next_p)
-                new_vec = OpenMaya.MVector(next_v - prev_v)
-                new_vec = OpenMaya.MVector(new_vec * 0.5)
-                new_vec = OpenMaya.MVector(prev_v + new_vec)
-                position = (new_vec.x, new_vec.y, new_vec.z)
-                m_array.append(OpenMaya.MPoint(*position))
-            m_array.append(OpenMaya.MPoint(*point))
-    return m_array
+    return _point_array(nurbs_kernels.insert_end_midpoints(points_array, equal_distance=equal_distance).tolist())
 
 
-def create_curve_from_points(points_array, degree=2, curve_name="", equal_cv_positions=True):
+def create_curve_from_data(cvs, knots, degree=3, curve_name=""):
     """
-    create a nurbs curve from points.
-    :param points_array: <tuple> positional points array.
+    creates an open nurbs curve from pure curve data, the only Maya call of the curve set up.
+    :param cvs: <list> xyz CV positions.
+    :param knots: <list> Maya knots.
     :param degree: <int> curve degree.
     :param curve_name: <str> the name of the curve to create.
-    :param equal_cv_positions: <bool> if True create CV's at equal positions.
     :return: <str> maya curve name.
     """
-    knot_length = len(points_array)
-    knot_array = get_knot_sequence(knot_length, degree)
-    m_point_array = get_point_array(points_array, equal_distance=equal_cv_positions)
+    if not isinstance(cvs, OpenMaya.MPointArray):
+        cvs = _point_array([tuple(p) for p in cvs])
+    if not isinstance(knots, OpenMaya.MDoubleArray):
+        knots = _double_array(knots)
     curve_fn = OpenMaya.MFnNurbsCurve()
-    curve_fn.create(m_point_array, knot_array, degree,
+    curve_fn.create(cvs, knots, degree,
                     OpenMaya.MFnNurbsCurve.kOpen,
                     False, False)
     m_path = OpenMaya.MDagPath()
@@ -436,6 +407,77 @@ def create_curve_from_points(points_array, degree=2, curve_name="", equal_cv_pos
     return curve_fn.name()
 
 
+def create_curve_from_points(points_array, degree=2, curve_name="", equal_cv_positions=True):
+    """
+    create a nurbs curve from points.
+    :param points_array: <tuple> positional points array.
+    :param degree: <int> curve degree.
+    :param curve_name: <str> the name of the curve to create.
+    :param equal_cv_positions: <bool> if True create CV's at equal positions.
+    :return: <str> maya curve name.
+    """
+    cvs = nurbs_kernels.insert_end_midpoints(points_array, equal_distance=equal_cv_positions)
+    knots = nurbs_kernels.uniform_knots(len(cvs), degree)
+    return create_curve_from_data(cvs, knots, degree=degree, curve_name=curve_name)
+
+
+def create_curve_through_points(points_array, degree=3, curve_name=""):
+    """
+    create a nurbs curve passing through every point.
+    :param points_array: <tuple> positional points array, more points than the degree.
+    :param degree: <int> curve degree.
+    :param curve_name: <str> the name of the curve to create.
+    :return: <str> maya curve name.
+    """
+    cvs, knots, _ = nurbs_kernels.fit_curve(points_array, degree=degree)
+    return create_curve_from_data(cvs, knots, degree=degree, curve_name=curve_name)
+
+
+def get_curve_data(curve_name):
+    """
+    reads the curve CVs, knots and degree once, for the pure data queries.
+    :param curve_name: <str> the curve name.
+    :return: <tuple> xyz CV positions, Maya knots, degree.
+    """
+    curve_fn = get_curve_shapes_fn(curve_name)[0]
+    cvs = OpenMaya.MPointArray()
+    curve_fn.getCVs(cvs, OpenMaya.MSpace.kObject)
+    knots = OpenMaya.MDoubleArray()
+    curve_fn.getKnots(knots)
+    return [(cvs[i].x, cvs[i].y, cvs[i].z) for i in range(cvs.length())], list(knots), curve_fn.degree()
+
+
+def get_param_u_from_points(curve_name, points):
+    """Returns the closest parameterU values of many object space points, reading the curve once.
+
+    Args:
+        curve_name: (str) the curve name to get parameterU from
+        points: (tuple, list) array of x, y, z positions
+
+    Returns:
+        list: parameterU float values.
+
+    """
+    cvs, knots, degree = get_curve_data(curve_name)
+    return nurbs_kernels.closest_parameters(cvs, knots, degree, points).tolist()
+
+
+def get_equal_param_u(curve_name, count):
+    """Returns the parameterU values spaced at equal lengths along the curve.
+
+    Args:
+        curve_name: (str) the curve name to get parameterU from
+        count: (int) the number of parameters, including both ends
+
+    Returns:
+        list: parameterU float values.
+
+    """
+    cvs, knots, degree = get_curve_data(curve_name)
+    fractions = [float(i) / max(count - 1, 1) for i in range(count)]
+    return nurbs_kernels.parameters_at_fractions(cvs, knots, degree, fractions).tolist()
+
+
 def create_curve_from_transforms(transform_array, degree=2, curve_name="", equal_cv_positions=False):
     """
     creates a curve object from an array of transforms.
@@ -0,0 +1,152 @@
+"""
+Batched falloff weight maps.
+Distances from (N, 3) positions to points, polyline or NURBS curves and planes are measured in one call,
+and turned into gaussian, smoothstep, linear or sinusoidal falloff weights from 1.0 at the target
+to 0.0 at the radius, ready for bulk deformer or skin weight assignment.
+This module does not import Maya, anything with x, y, z attributes such as MVector is accepted as a point.
+"""
+# import local modules
+from . import spline_kernels
+from . import nurbs_kernels
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+FALLOFF_TYPES = ('gaussian', 'smoothstep', 'linear', 'sinusoidal')
+GAUSSIAN_SIGMAS = 3.0
+CHUNK_SIZE = 4096
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[FalloffKernels] :: numpy is required for the falloff weights.")
+
+
+def point_distances(positions, points):
+    """
+    the distance from each position to its closest point.
+    :param positions: <list> (N, 3) positions.
+    :param points: <list> (M, 3) target points.
+    :return: <numpy.ndarray> (N,) distances.
+    """
+    positions = spline_kernels.as_points(positions)
+    points = spline_kernels.as_points(points)
+    squared = (numpy.einsum('ij,ij->i', positions, positions)[:, None] +
+               numpy.einsum('ij,ij->i', points, points)[None, :] -
+               2.0 * numpy.matmul(positions, points.T))
+    return numpy.sqrt(numpy.maximum(squared.min(axis=1), 0.0))
+
+
+def polyline_distances(positions, points):
+    """
+    the distance from each position to the closest segment of the polyline.
+    :param positions: <list> (N, 3) positions.
+    :param points: <list> (M, 3) polyline points, a dense curve sampling.
+    :return: <numpy.ndarray> (N,) distances.
+    """
+    positions = spline_kernels.as_points(positions)
+    points = spline_kernels.as_points(points)
+    if len(points) < 2:
+        return point_distances(positions, points)
+    starts = points[:-1]
+    segments = points[1:] - starts
+    lengths = numpy.einsum('ij,ij->i', segments, segments)
+    lengths = numpy.where(lengths > EPSILON, lengths, 1.0)
+    distances = numpy.empty(len(positions))
+    # chunk the positions so the (chunk, segments, 3) arrays stay small on dense meshes
+    for i in range(0, len(positions), CHUNK_SIZE):
+        offsets = positions[i:i + CHUNK_SIZE, None, :] - starts[None, :, :]
+        t = numpy.clip(numpy.einsum('nmj,mj->nm', offsets, segments) / lengths[None, :], 0.0, 1.0)
+        distances[i:i + CHUNK_SIZE] = numpy.linalg.norm(offsets - t[:, :, None] * segments[None, :, :],
+                                                        axis=2).min(axis=1)
+    return distances
+
+
+def curve_distances(positions, cvs, knots, degree, samples_per_span=nurbs_kernels.CLOSEST_SAMPLES_PER_SPAN):
+    """
+    the distance from each position to the NURBS curve, measured against a dense polyline of the curve.
+    :param positions: <list> (N, 3) positions.
+    :param cvs: <list> (C, 3) CV positions.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param samples_per_span: <int> the polyline points per span.
+    :return: <numpy.ndarray> (N,) distances.
+    """
+    start, end = nurbs_kernels.knot_domain(knots, degree)
+    spans = max(nurbs_kernels.get_spans(len(cvs), degree), 1)
+    parameters = numpy.linspace(start, end, spans * samples_per_span + 1)
+    return polyline_distances(positions, nurbs_kernels.evaluate_points(cvs, knots, degree, parameters))
+
+
+def plane_distances(positions, normal=(1.0, 0.0, 0.0), origin=(0.0, 0.0, 0.0), signed=False):
+    """
+    the distance from each position to the plane.
+    :param positions: <list> (N, 3) positions.
+    :param normal: <tuple> the plane normal.
+    :param origin: <tuple> a point on the plane.
+    :param signed: <bool> positions behind the plane get negative distances.
+    :return: <numpy.ndarray> (N,) distances.
+    """
+    positions = spline_kernels.as_points(positions)
+    normal = spline_kernels.as_points([normal])[0]
+    normal = normal / max(numpy.linalg.norm(normal), EPSILON)
+    distances = numpy.matmul(positions - spline_kernels.as_points([origin])[0], normal)
+    return distances if signed else numpy.abs(distances)
+
+
+def falloff(distances, radius=1.0, falloff_type='gaussian'):
+    """
+    the falloff weights of the distances, 1.0 at the target and 0.0 at the radius.
+    The gaussian falloff places the radius at three standard deviations and keeps its tail.
+    :param distances: <list> (N,) distances.
+    :param radius: <float> the falloff radius.
+    :param falloff_type: <str> gaussian, smoothstep, linear or sinusoidal.
+    :return: <numpy.ndarray> (N,) weights.
+    """
+    _require_numpy()
+    t = numpy.abs(numpy.asarray(distances, dtype=float)) / max(radius, EPSILON)
+    if falloff_type == 'gaussian':
+        return numpy.exp(-0.5 * (t * GAUSSIAN_SIGMAS) ** 2)
+    t = numpy.clip(t, 0.0, 1.0)
+    if falloff_type == 'smoothstep':
+        return 1.0 - t * t * (3.0 - 2.0 * t)
+    if falloff_type == 'linear':
+        return 1.0 - t
+    if falloff_type == 'sinusoidal':
+        return 0.5 + 0.5 * numpy.cos(numpy.pi * t)
+    raise ValueError("[Falloff] :: Unsupported falloff type: {}, use one of {}".format(falloff_type, FALLOFF_TYPES))
+
+
+def weight_map(positions, points=None, polyline=None, curve=None, plane=None, radius=1.0, falloff_type='gaussian',
+               invert=False):
+    """
+    the falloff weights of the positions from the closest of the given targets.
+    :param positions: <list> (N, 3) positions, such as mesh vertices.
+    :param points: <list> (M, 3) target points.
+    :param polyline: <list> (M, 3) polyline points.
+    :param curve: <tuple> NURBS curve CVs, Maya knots and degree.
+    :param plane: <tuple> plane normal and origin.
+    :param radius: <float> the falloff radius.
+    :param falloff_type: <str> gaussian, smoothstep, linear or sinusoidal.
+    :param invert: <bool> 0.0 at the target and 1.0 away from it.
+    :return: <numpy.ndarray> (N,) weights.
+    """
+    positions = spline_kernels.as_points(positions)
+    distances = []
+    if points is not None:
+        distances.append(point_distances(positions, points))
+    if polyline is not None:
+        distances.append(polyline_distances(positions, polyline))
+    if curve is not None:
+        distances.append(curve_distances(positions, *curve))
+    if plane is not None:
+        distances.append(plane_distances(positions, *plane))
+    if not distances:
+        raise ValueError("[WeightMap] :: No points, polyline, curve or plane given.")
+    weights = falloff(numpy.min(distances, axis=0), radius, falloff_type)
+    return 1.0 - weights if invert else weights
@@ -15,6 +15,10 @@ from maya import cmds
 from . import transform_utils
 from . import object_utils
 from . import attribute_utils
+from . import vector_kernels
+from . import matrix_kernels
+from . import spline_kernels
+from . import aim_kernels
 
 # define local variables
 M_PI = 3.14159265358979323846
@@ -132,9 +136,7 @@ def cross_product(vector_1, vector_2):
     :param vector_2: <list> xyz translation vector.
     :return: <tuple> xyz values.
     """
-    vector = MVector(*vector_1) ^ MVector(*vector_2)
-    vector.normalize()
-    return vector.x, vector.y, vector.z,
+    return vector_kernels.to_tuples(vector_kernels.cross(vector_1, vector_2, normalized=True))[0]
 
 
 def dot_product(vector_1, vector_2):
@@ -144,7 +146,7 @@ def dot_product(vector_1, vector_2):
     :param vector_2: <list> xyz translation vector.
     :return: <tuple> xyz values.
     """
-    return MVector(*vector_1) * MVector(*vector_2)
+    return float(vector_kernels.dot(vector_1, vector_2)[0])
 
 
 def float_range(start, stop, step):
@@ -448,7 +450,6 @@ def magnitude(*args):
 
         Inputs must be a vector of 3 values in a list!
     """
-    data = list()
     # if a list of tail vector values are fed.
     if len(args) == 2:
         tail = args[0]
@@ -457,22 +458,13 @@ def magnitude(*args):
         head = args[1]
         if isinstance(head, str):
             head = Vector(head).position
-        # vectors assume only three values in the list!
-        # Using this, we find the vector!
-        for j in range(3):
-            data.append((tail[j] - head[j])**2)
-        data = sum(data)
-        return abs(data**0.5)
+        return float(vector_kernels.distance(tail, head)[0])
     # if a list of head vector values are fed.
     elif len(args) == 1:
         head = args[0]
         if not type(head) is list:
             raise ValueError("Please use a list of 3 floats or intergers")
-        # Calculating magnitude of WorldSpace: sqrt((ax * ax) + (ay * ay) + (az * az))
-        for j in range(len(head)):
-            data.append(head[j]**2)
-        data = sum(data)**0.5
-        return abs(data)
+        return float(vector_kernels.length(head)[0])
     else:
         print("Wrong number of arguments used!\r\n\
                 You must have either one or two lists of vectors: head, tail or head")
@@ -485,12 +477,7 @@ def angle(vector1, vector2):
     :param vector1: <list> translate point
     :param vector2: <list> translate point
     """
-    data = list()
-    # Add all magnitude of vector components!
-    for j in range(3):
-        data.append(vector1[j] * vector2[j])
-    data = sum(data)
-    return math.degrees(math.acos(data / (magnitude(vector1) * magnitude(vector2))))
+    return float(vector_kernels.angle(vector1, vector2)[0])
 
 
 class Vector(MVector):
@@ -677,50 +664,46 @@ def rotate_object_3d(x, y, z, delta=0.5):
 def look_at(source, target, up_vector=(0, 1, 0), as_vector=True):
     """
     allows the transform object to look at another target vector object.
+    The negative z axis aims at the target and the y axis turns towards the up vector.
     :return: <tuple> rotational vector.
     """
-    source_world = transform_utils.Transform(source).world_matrix_list()
-    target_world = transform_utils.Transform(target).world_matrix_list()
+    world_matrices = transform_utils.get_world_matrices([source, target])
     source_parent_name = object_utils.get_parent_name(source)[0]
-    if source_parent_name == 'world':
-        source_parent_name = None
-    else:
-        parent_world = transform_utils.Transform(
-            source_parent_name).world_matrix_list()
-    # build normalized vector from the translations from matrix data
-    z = MVector(target_world[12] - source_world[12],
-                target_world[13] - source_world[13],
-                target_world[14] - source_world[14])
-    z *= -1
-    z.normalize()
-    # get normalized cross product of the z against the up vector at origin
-    # x = z ^ MVector(-up_vector[0], -up_vector[1], -up_vector[2])
-    x = z ^ MVector(up_vector[0], up_vector[1], up_vector[2])
-    x.normalize()
-    # get the normalized y vector
-    y = x ^ z
-    y.normalize()
-    # build the aim matrix
-    local_matrix_list = (
-        x.x, x.y, x.z, 0,
-        y.x, y.y, y.z, 0,
-        z.x, z.y, z.z, 0,
-        0, 0, 0, 1.0)
-    matrix = object_utils.ScriptUtil(
-        local_matrix_list, matrix_from_list=True).matrix
-    if source_parent_name:
-        # transform the matrix in the local space of the parent object
-        parent_matrix = object_utils.ScriptUtil(
-            parent_world, matrix_from_list=True)
-        matrix *= parent_matrix.matrix.inverse()
-    # retrieve the desired rotation for "source" to aim at "target", in degrees
-    if as_vector:
-        rotation = MTransformationMatrix(
-            matrix).eulerRotation() * RADIANS_2_DEGREES
-        vector = rotation.asVector()
-        return vector.x, vector.y, vector.z,
-    else:
-        return local_matrix_list
+    if not as_vector:
+        matrix = aim_kernels.aim_matrices(world_matrices[0, 3, :3], world_matrices[1, 3, :3], up_vector,
+                                          aim_axis='-z', up_axis='y')[0]
+        matrix[3, :3] = 0.0
+        return tuple(matrix.flatten().tolist())
+    parent_matrices = None
+    if source_parent_name != 'world':
+        # the rotation in the local space of the parent object
+        parent_matrices = transform_utils.get_world_matrices([source_parent_name])
+    rotation = aim_kernels.look_at_rotations(world_matrices[0, 3, :3], world_matrices[1, 3, :3], up_vector,
+                                             parent_matrices, aim_axis='-z', up_axis='y')[0]
+    return tuple(rotation.tolist())
+
+
+def get_aim_rotations(sources=(), targets=(), up_vector=(0, 1, 0), aim_axis='x', up_axis='y'):
+    """
+    the local rotations aiming each source transform at its target transform.
+    sources and targets are read separately, chains aim each joint at the next one so they share names.
+    :param sources: <list> source transform names.
+    :param targets: <list> target transform names.
+    :param up_vector: <tuple> the world up vector.
+    :param aim_axis: <str> the axis aimed at the target.
+    :param up_axis: <str> the axis turned towards the up vector.
+    :return: <list> xyz rotations in degrees.
+    """
+    parent_names = [object_utils.get_parent_name(source)[0] for source in sources]
+    source_matrices = transform_utils.get_world_matrices(sources)
+    target_matrices = transform_utils.get_world_matrices(targets)
+    parent_matrices = matrix_kernels.identity(len(sources))
+    parented = [i for i, parent_name in enumerate(parent_names) if parent_name != 'world']
+    if parented:
+        parent_matrices[parented] = transform_utils.get_world_matrices([parent_names[i] for i in parented])
+    rotations = aim_kernels.look_at_rotations(source_matrices[:, 3, :3], target_matrices[:, 3, :3],
+                                              up_vector, parent_matrices, aim_axis=aim_axis, up_axis=up_axis)
+    return [tuple(r) for r in rotations.tolist()]
 
 
 def get_vector_position_2_points(position_1, position_2, divisions=2.0):
@@ -877,16 +860,9 @@ def quadratic(v0, v1, v2, t):
     :param v1: <OpenMaya.MVector>
     :param v2: <OpenMaya.MVector>
     :param t: <float>
-    :return:
+    :return: <dict> x, y, z point.
     """
-    point_final = {}
-    point_final.update(x=((1 - t) ** 2) * v0.x + (1 - t)
-                       * 2 * t * v1.x + t * t * v2.x)
-    point_final.update(y=((1 - t) ** 2) * v0.y + (1 - t)
-                       * 2 * t * v1.y + t * t * v2.y)
-    point_final.update(z=((1 - t) ** 2) * v0.z + (1 - t)
-                       * 2 * t * v1.z + t * t * v2.z)
-    return point_final
+    return _point_dicts(spline_kernels.evaluate_bezier((v0, v1, v2), t))[0]
 
 
 def bezier(v0, v1, v2, v3, t):
@@ -897,39 +873,40 @@ def bezier(v0, v1, v2, v3, t):
     :param v2: <OpenMaya.MVector>
     :param v3: <OpenMaya.MVector>
     :param t: <float>
-    :return:
+    :return: <dict> x, y, z point.
     """
-    point_final = {}
-    point_final.update(x=((1 - t) ** 3) * v0.x + (1 - t) ** 2 *
-                       3 * t * v1.x + (1 - t) * 3 * t * t * v2.x + t * t * t * v3.x)
-    point_final.update(y=((1 - t) ** 3) * v0.y + (1 - t) ** 2 * 3 * t * v1.y +
-                         (1 - t) * 3 * t * t * v2.y + t * t * t * v3.y)
-    point_final.update(z=((1 - t) ** 3) * v0.z + (1 - t) ** 2 *
-                       3 * t * v1.z + (1 - t) * 3 * t * t * v2.z + t * t * t * v3.z)
-    return point_final
+    return _point_dicts(spline_kernels.evaluate_bezier((v0, v1, v2, v3), t))[0]
 
 
-def linear_cubic_interpolation(driver_array=(), divisions=20, interpolation='quadratic'):
+def _point_dicts(points):
+    """
+    converts the points array into x, y, z point dictionaries.
+    :param points: <numpy.ndarray> (T, 3) points.
+    :return: <tuple> point dictionaries.
+    """
+    return tuple(dict(zip('xyz', point)) for point in points.tolist())
+
+
+def linear_cubic_interpolation(driver_array=(), divisions=20, interpolation='quadratic', arc_length=False):
     """
     interpolate the cubic line between points.
+    :param driver_array: <list> transform object names, or xyz positions, of the control points.
+    :param divisions: <int> the number of points.
+    :param interpolation: <str> quadratic, bezier, catmull_rom or bspline.
+    :param arc_length: <bool> space the points at equal distances along the curve.
     :return: <tuple> the array of point dictionary.
     """
-    point_final = ()
+    control_points = [get_object_transform(p) if isinstance(p, str) else p for p in driver_array]
     if interpolation == 'quadratic':
-        for t in xrange(divisions):
-            v1 = Vector(driver_array[0])
-            v2 = Vector(driver_array[1])
-            v3 = Vector(driver_array[2])
-            point_final += quadratic(v1, v2, v3, float(t) / float(divisions)),
-        return point_final
+        control_points = control_points[:3]
     elif interpolation == 'bezier':
-        for t in xrange(divisions):
-            v1 = Vector(driver_array[0])
-            v2 = Vector(driver_array[1])
-            v3 = Vector(driver_array[2])
-            v4 = Vector(driver_array[3])
-            point_final += bezier(v1, v2, v3, v4, float(t) / float(divisions))
-        return point_final
+        control_points = control_points[:4]
+    if arc_length:
+        points = spline_kernels.evenly_spaced_points(interpolation, control_points, divisions, end_point=False)[0]
+    else:
+        points = spline_kernels.evaluate(
+            interpolation, control_points, spline_kernels.uniform_parameters(divisions, end_point=False))
+    return _point_dicts(points)
 
 
 def normalize(num, max_num):
@@ -977,18 +954,25 @@ def get_pole_vector_position(st_joint, mid_joint, en_joint):
     :param st_joint: <str> start joint.
     :param en_joint: <str> end joint.
     :param mid_joint: <str> mid joint.
-    :param distance_from_elbow: <int> distance from the elbow the pole vector to be created.
-    :return:
+    :return: <tuple> pole vector position.
     """
-    v1 = Vector(st_joint)
-    v2 = Vector(en_joint)
-    v3 = Vector(mid_joint)
-    v = Vector(v2 - v1)
-    v *= 0.5
-    v += v1
-    va = v3 - v
-    v += va * Vector(v2 - v1).length()
-    return Vector(v).position
+    positions = [Vector(p).position for p in (st_joint, mid_joint, en_joint)]
+    return tuple(aim_kernels.pole_vector_positions(*positions)[0].tolist())
+
+
+def get_pole_vector_positions(chains=(), distance=None):
+    """
+    the pole vector positions of many three joint chains, with one scene read.
+    :param chains: <list> (start, mid, end) joint names of each chain.
+    :param distance: <float> the distance of the pole from the mid joint, scaled by the chain length when not given.
+    :return: <list> pole vector positions.
+    """
+    if not chains:
+        return []
+    positions = transform_utils.get_world_matrices([j for chain in chains for j in chain])[:, 3, :3]
+    positions = positions.reshape(len(chains), 3, 3)
+    poles = aim_kernels.pole_vector_positions(positions[:, 0], positions[:, 1], positions[:, 2], distance)
+    return [tuple(p) for p in poles.tolist()]
 
 
 class Plane(MPlane):
@@ -1238,19 +1222,7 @@ def barycentric_interpolation(vecA, vecB, vecC, vecP):
 
     Returns list of 3 floats representing weight values per each point.
     """
-    v0 = vecB - vecA
-    v1 = vecC - vecA
-    v2 = vecP - vecA
-    d00 = v0 * v0
-    d01 = v0 * v1
-    d11 = v1 * v1
-    d20 = v2 * v0
-    d21 = v2 * v1
-    denom = d00 * d11 - d01 * d01
-    v = (d11 * d20 - d01 * d21) / denom
-    w = (d00 * d21 - d01 * d20) / denom
-    u = 1.0 - v - w
-    return [u, v, w]
+    return list(vector_kernels.to_tuples(vector_kernels.barycentric_weights(vecA, vecB, vecC, vecP))[0])
 
 
 def sine_maxima(x, b):
@@ -1309,25 +1281,72 @@ def point_line_distance(point, start, end):
         return n / d
 
 
+def point_vertical_distance(point, start, end):
+    """distance along the Y axis between a point and a line, the error of a curve sampled over X.
+
+    Args:
+        point (list): two value array defining a point in 2D space
+        start (list): two value array defining the start of a line in 2DSpace
+        end (list): two value array defining the end of a line in 2DSpace
+
+    Returns:
+        float: vertical distance
+    """
+    if start[0] == end[0]:
+        return abs(point[1] - start[1])
+    weight = float(point[0] - start[0]) / (end[0] - start[0])
+    return abs(point[1] - (start[1] + (end[1] - start[1]) * weight))
+
+
+def simplify_indices(points, epsilon, vertical=False, error_fn=None):
+    """Iterative Ramer-Douglas-Peucker, finds the points that keep the shape of the series
+    within epsilon without slicing the series.
+
+    Args:
+        points (list): two value arrays.
+        epsilon (float): the largest distance a removed point may have from the simplified series.
+        vertical (bool): measure the distance along Y only, for curves sampled over time.
+        error_fn (function): error_fn(points, first, last) returns the largest error of the points between
+                             first and last and its index, replaces the distance to the straight line.
+
+    Returns:
+        list: sorted indices of the points to keep.
+    """
+    count = len(points)
+    if epsilon <= 0 or count < 3:
+        return list(range(count))
+    distance_fn = point_vertical_distance if vertical else point_line_distance
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if error_fn:
+            dmax, index = error_fn(points, first, last)
+        else:
+            dmax = 0.0
+            index = first
+            start = points[first]
+            end = points[last]
+            for i in range(first + 1, last):
+                d = distance_fn(points[i], start, end)
+                if d > dmax:
+                    index = i
+                    dmax = d
+        if dmax >= epsilon and first < index < last:
+            keep[index] = True
+            stack.append((index, last))
+            stack.append((first, index))
+    return [i for i in range(count) if keep[i]]
+
+
 def simplify(points, epsilon):
     """Reduces a series of points to a simplified version that loses detail, but
     maintains the general shape of the series.
     """
     if epsilon <= 0:
         return points
-    dmax = 0.0
-    index = 0
-    for i in range(1, len(points) - 1):
-        d = point_line_distance(points[i], points[0], points[-1])
-        if d > dmax:
-            index = i
-            dmax = d
-    if dmax >= epsilon:
-        results = simplify(points[:index+1], epsilon)[:-1] + \
-            simplify(points[index:], epsilon)
-    else:
-        results = [points[0], points[-1]]
-    return results
+    return [points[i] for i in simplify_indices(points, epsilon)]
 
 
 def mirror_vector(transform_object, mirror_object=None, normal=(1.0, 0.0, 0.0)):
@@ -1363,6 +1382,16 @@ def list_from_MMatrix(m):
         m(3, 0), m(3, 1), m(3, 2), m(3, 3)]
 
 
+def mmatrix_from_list(matrix_list):
+    """return an MMatrix object from a flat matrix list
+    :param matrix_list: (list, ) 16 float values
+    :return: (OpenMaya.MMatrix, )
+    """
+    m = MMatrix()
+    MScriptUtil.createMatrixFromList(list(matrix_list), m)
+    return m
+
+
 def print_list_matrix(list_matrix):
     print(['%.4f' % i for i in list_matrix[0:4]], " ,")
     print(['%.4f' % i for i in list_matrix[4:8]], " ,")
@@ -1377,18 +1406,11 @@ def get_mirror_vector(pointed_vector, base_vector=(0.0, 0.0, 0.0), normal=None):
     :param normal: (tuple, list, ) the direction of the reflected vector
     :return: (tuple, list) mirror, reflected vector
     """
-    base_vector = MVector(*base_vector)
-    pointed_vector = MVector(*pointed_vector)
     if normal:
-        normal = base_vector + MVector(*normal)
-        normal.normalize()
+        normal = vector_kernels.add(base_vector, normal)
     else:
-        normal = MVector(*normal)
-    # wrong: 2.0 * MVector(0.0, 1.0, 0.0)
-    # right: MVector(0.0, 1.0, 0.0) * 2.0
-    mirror_vector = pointed_vector - \
-        (normal * ((pointed_vector * 2.0) * normal))
-    return mirror_vector.x, mirror_vector.y, mirror_vector.z
+        normal = base_vector
+    return vector_kernels.to_tuples(vector_kernels.reflect(pointed_vector, normal))[0]
 
 
 def get_mirror_axis_vector(pointed_vector, base_vector=(0.0, 0.0, 0.0), normal=(0.0, 1.0, 0.0)):
@@ -1415,20 +1437,20 @@ def get_matrix_from_vectors(axis_x, axis_y, axis_z, base_vector):
     :param base_vector: (tuple, list, ) the base vector to transform the x, y, z axis vectors
     :return: (list, ) matrix_from_vector_axes
     """
-    m = MMatrix()
-    m.setToIdentity()
-    data = list_from_MMatrix(m)
-    for i in range(0, 3):
-        data[i] = axis_x[i]
-    for i in range(0, 3):
-        data[4 + i] = axis_y[i]
-    for i in range(0, 3):
-        data[8 + i] = axis_z[i]
-    for i in range(0, 3):
-        data[12 + i] = base_vector[i]
-    MScriptUtil.createMatrixFromList([*data], m)
-    matrix_from_vector_axes = list_from_MMatrix(m)
-    return matrix_from_vector_axes
+    return matrix_kernels.to_flat_lists(matrix_kernels.from_axes(axis_x, axis_y, axis_z, base_vector))[0]
+
+
+def _apply_mirror_matrix(transform_node, apply_xform_to_node, matrices):
+    """applies the mirrored world matrix in one undoable batch
+    :param transform_node: (str, ) the transform node the matrix was read from
+    :param apply_xform_to_node: (str, ) apply xform information to this transform node instead
+    :param matrices: (numpy.ndarray, ) (1, 4, 4) world matrix
+    :return: (tuple, ) axis x, axis y, axis z and translation vectors
+    """
+    matrices = matrix_kernels.orthonormalize(matrices)
+    transform_utils.set_world_matrices([apply_xform_to_node or transform_node], matrices)
+    rows = matrices[0].tolist()
+    return tuple(rows[0][:3]), tuple(rows[1][:3]), tuple(rows[2][:3]), tuple(rows[3][:3])
 
 
 def mirror_matrix_xz(transform_node, apply_xform_to_node=None):
@@ -1438,128 +1460,46 @@ def mirror_matrix_xz(transform_node, apply_xform_to_node=None):
     :return: (list, ) matrix list
     """
     normal = (1.0, 0.0, 0.0)
-    matrix = cmds.xform(transform_node, m=1, ws=1, q=True)
-    axis_x = matrix[0:3]
-    axis_y = matrix[4:7]
-    axis_z = matrix[8:11]
-    translate_vector = matrix[12:15]
-    base_mirror = get_mirror_vector(translate_vector, normal=normal)
-    axis_x = MVector(*axis_x) + MVector(*base_mirror)
-    axis_y = MVector(*axis_y) + MVector(*base_mirror)
-    axis_z = MVector(*axis_z) + MVector(*base_mirror)
-    mirror_x = get_mirror_axis_vector(
-        mvector_to_list(axis_x), translate_vector, normal=normal)
-    mirror_y = get_mirror_axis_vector(
-        mvector_to_list(axis_y), translate_vector, normal=normal)
-    mirror_z = get_mirror_axis_vector(
-        mvector_to_list(axis_z), translate_vector, normal=normal)
-    m = get_matrix_from_vectors(
-        mirror_x, mirror_y, mirror_z, base_mirror)
-    if apply_xform_to_node:
-        cmds.xform(apply_xform_to_node, m=m)
-        identity_scale(apply_xform_to_node)
-        identity_shear(apply_xform_to_node)
-    else:
-        cmds.xform(transform_node, m=m)
-        identity_scale(transform_node)
-        identity_shear(transform_node)
-    return mirror_x, mirror_y, mirror_z, base_mirror
+    matrices = transform_utils.get_world_matrices([transform_node])
+    matrices = matrix_kernels.mirror_across_plane(matrices, normal, behavior=False)
+    return _apply_mirror_matrix(transform_node, apply_xform_to_node, matrices)
 
 
 def mirror_matrix_at_axis_xy(transform_node, apply_xform_to_node=None,
                              x_normal=(0.0, 1.0, 0.0), y_normal=(1.0, 0.0, 0.0)):
     """locally mirrors the x axis at base vector
     """
-    matrix = cmds.xform(transform_node, m=1, ws=1, q=True)
-    axis_x = matrix[0:3]
-    axis_y = matrix[4:7]
-    axis_z = matrix[8:11]
-    translate_vector = matrix[12:15]
-    mirror_x = get_mirror_vector(
-        axis_x, (0.0, 0.0, 0.0), normal=x_normal)
-    mirror_y = get_mirror_vector(
-        axis_y, (0.0, 0.0, 0.0), normal=y_normal)
-    mirror_x = normalize_float_vector(mirror_x)
-    mirror_y = normalize_float_vector(mirror_y)
-    m = get_matrix_from_vectors(
-        mirror_x, mirror_y, axis_z, translate_vector)
-    if apply_xform_to_node:
-        cmds.xform(apply_xform_to_node, m=m)
-        identity_scale(apply_xform_to_node)
-        identity_shear(apply_xform_to_node)
-    else:
-        cmds.xform(transform_node, m=m)
-        identity_scale(transform_node)
-        identity_shear(transform_node)
-    return mirror_x, mirror_y, axis_z, translate_vector
+    matrices = transform_utils.get_world_matrices([transform_node])
+    matrices = matrix_kernels.reflect_axes(matrices, 'x', x_normal)
+    matrices = matrix_kernels.reflect_axes(matrices, 'y', y_normal)
+    return _apply_mirror_matrix(transform_node, apply_xform_to_node, matrices)
 
 
 def mirror_matrix_at_axis_zx(transform_node, apply_xform_to_node=None,
                              z_normal=(1.0, 0.0, 0.0), x_normal=(0.0, 0.0, 1.0)):
     """locally mirrors the x axis at base vector
     """
-    matrix = cmds.xform(transform_node, m=1, ws=1, q=True)
-    axis_x = matrix[0:3]
-    axis_y = matrix[4:7]
-    axis_z = matrix[8:11]
-    translate_vector = matrix[12:15]
-    mirror_x = get_mirror_vector(
-        axis_x, (0.0, 0.0, 0.0), normal=x_normal)
-    mirror_z = get_mirror_vector(
-        axis_z, (0.0, 0.0, 0.0), normal=z_normal)
-    mirror_x = normalize_float_vector(mirror_x)
-    mirror_z = normalize_float_vector(mirror_z)
-    m = get_matrix_from_vectors(
-        mirror_x, axis_y, mirror_z, translate_vector)
-    if apply_xform_to_node:
-        cmds.xform(apply_xform_to_node, m=m)
-        identity_scale(apply_xform_to_node)
-        identity_shear(apply_xform_to_node)
-    else:
-        cmds.xform(transform_node, m=m)
-        identity_scale(transform_node)
-        identity_shear(transform_node)
-    return mirror_x, axis_y, mirror_z, translate_vector
+    matrices = transform_utils.get_world_matrices([transform_node])
+    matrices = matrix_kernels.reflect_axes(matrices, 'x', x_normal)
+    matrices = matrix_kernels.reflect_axes(matrices, 'z', z_normal)
+    return _apply_mirror_matrix(transform_node, apply_xform_to_node, matrices)
 
 
 def mirror_matrix_at_axis_zy(transform_node, apply_xform_to_node=None,
                              z_normal=(1.0, 0.0, 0.0), y_normal=(0.0, 0.0, 1.0)):
     """locally mirrors the x axis at base vector
     """
-    matrix = cmds.xform(transform_node, m=1, ws=1, q=True)
-    axis_x = matrix[0:3]
-    axis_y = matrix[4:7]
-    axis_z = matrix[8:11]
-    translate_vector = matrix[12:15]
-    mirror_y = get_mirror_vector(
-        axis_y, (0.0, 0.0, 0.0), normal=y_normal)
-    mirror_z = get_mirror_vector(
-        axis_z, (0.0, 0.0, 0.0), normal=z_normal)
-    mirror_y = normalize_float_vector(mirror_y)
-    mirror_z = normalize_float_vector(mirror_z)
-    m = get_matrix_from_vectors(
-        axis_x, mirror_y, mirror_z, translate_vector)
-    if apply_xform_to_node:
-        cmds.xform(apply_xform_to_node, m=m)
-        identity_scale(apply_xform_to_node)
-        identity_shear(apply_xform_to_node)
-    else:
-        cmds.xform(transform_node, m=m)
-        identity_scale(transform_node)
-        identity_shear(transform_node)
-    return axis_x, mirror_y, mirror_z, translate_vector
+    matrices = transform_utils.get_world_matrices([transform_node])
+    matrices = matrix_kernels.reflect_axes(matrices, 'y', y_normal)
+    matrices = matrix_kernels.reflect_axes(matrices, 'z', z_normal)
+    return _apply_mirror_matrix(transform_node, apply_xform_to_node, matrices)
 
 
 def normalize_float_vector(float_vector):
     """normalize a float vector by the magnitude of each value
     :param float_vector: (tuple, list) a vector of 3 float values of xyz co-ordinates
     """
-    x = float_vector[0]
-    y = float_vector[1]
-    z = float_vector[2]
-    mag = ((x * x) + (y * y) + (z * z)) ** 0.5
-    normalized_float_vector = x / mag, y / mag, z / mag,
-    return normalized_float_vector
+    return vector_kernels.to_tuples(vector_kernels.normalize(float_vector))[0]
 
 # ______________________________________________________________________________________________________________________
 # math_utils.py
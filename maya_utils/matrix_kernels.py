@@ -0,0 +1,541 @@
+"""
+Batched 4x4 matrix and quaternion operations over (N, 4, 4) arrays.
+Matrices follow the Maya convention: row vectors, the translation is in the last row and
+a transform composes as scale * rotation * translation. Quaternions are (x, y, z, w) like MQuaternion.
+Rotate orders are the Maya rotateOrder names, or their enum index.
+This module does not import Maya, convert to MMatrix only when the result is applied to the scene.
+"""
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+ROTATE_ORDERS = ('xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx')
+AXES = {'x': 0, 'y': 1, 'z': 2}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[MatrixKernels] :: numpy is required for the batched matrix operations.")
+
+
+def get_rotate_order(rotate_order):
+    """
+    the rotate order name.
+    :param rotate_order: <int>, <str> Maya rotateOrder index or name.
+    :return: <str> rotate order name.
+    """
+    if isinstance(rotate_order, int):
+        return ROTATE_ORDERS[rotate_order]
+    rotate_order = rotate_order.lower()
+    if rotate_order not in ROTATE_ORDERS:
+        raise ValueError("[GetRotateOrder] :: Unsupported rotate order: {}".format(rotate_order))
+    return rotate_order
+
+
+def get_axis_index(axis):
+    """
+    the index of the axis.
+    :param axis: <int>, <str> 0, 1, 2 or x, y, z.
+    :return: <int> axis index.
+    """
+    if isinstance(axis, int):
+        return axis
+    try:
+        return AXES[axis.lower()]
+    except KeyError:
+        raise ValueError("[GetAxisIndex] :: Unsupported axis. Got {}".format(axis))
+
+
+def as_matrices(matrices):
+    """
+    converts the matrices into an (N, 4, 4) array.
+    :param matrices: <list> a flat 16 value matrix, a 4x4 matrix, or a list of either.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    _require_numpy()
+    return numpy.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+
+
+def as_vectors(vectors, size=3):
+    """
+    converts the vectors into an (N, size) array.
+    :param vectors: <list> a single vector or a list of vectors.
+    :param size: <int> the vector size.
+    :return: <numpy.ndarray> (N, size) vectors.
+    """
+    _require_numpy()
+    return numpy.asarray(vectors, dtype=float).reshape(-1, size)
+
+
+def to_flat_lists(matrices):
+    """
+    the matrices as flat 16 value lists, as used by cmds.xform.
+    :param matrices: <numpy.ndarray> (N, 4, 4) matrices.
+    :return: <list> flat matrix lists.
+    """
+    return as_matrices(matrices).reshape(-1, 16).tolist()
+
+
+def identity(count=1):
+    """
+    identity matrices.
+    :param count: <int> the number of matrices.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    _require_numpy()
+    return numpy.tile(numpy.eye(4), (count, 1, 1))
+
+
+def multiply(matrices_a, matrices_b):
+    """
+    multiplies each pair of matrices, a single matrix is broadcast against many.
+    :param matrices_a: <list> (N, 4, 4) matrices.
+    :param matrices_b: <list> (N, 4, 4) matrices.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    return numpy.matmul(as_matrices(matrices_a), as_matrices(matrices_b))
+
+
+def inverse(matrices):
+    """
+    inverts the matrices.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    return numpy.linalg.inv(as_matrices(matrices))
+
+
+def transform_points(points, matrices):
+    """
+    transforms each point by its matrix.
+    :param points: <list> (N, 3) points.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :return: <numpy.ndarray> (N, 3) points.
+    """
+    points = as_vectors(points)
+    matrices = as_matrices(matrices)
+    return numpy.einsum('ni,nij->nj', points, matrices[:, :3, :3]) + matrices[:, 3, :3]
+
+
+def from_axes(axis_x, axis_y, axis_z, positions=(0.0, 0.0, 0.0)):
+    """
+    builds the matrices from their axis vectors and positions.
+    :param axis_x: <list> (N, 3) x axis vectors.
+    :param axis_y: <list> (N, 3) y axis vectors.
+    :param axis_z: <list> (N, 3) z axis vectors.
+    :param positions: <list> (N, 3) translations.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    axes = numpy.broadcast_arrays(as_vectors(axis_x), as_vectors(axis_y), as_vectors(axis_z), as_vectors(positions))
+    matrices = identity(len(axes[0]))
+    for row, axis in enumerate(axes):
+        matrices[:, row, :3] = axis
+    return matrices
+
+
+def _axis_rotations(angles, axis):
+    """
+    the row vector rotation matrices around a single axis.
+    :param angles: <numpy.ndarray> (N,) radians.
+    :param axis: <int> axis index.
+    :return: <numpy.ndarray> (N, 3, 3) matrices.
+    """
+    cos = numpy.cos(angles)
+    sin = numpy.sin(angles)
+    matrices = numpy.zeros((len(angles), 3, 3))
+    j, k = (axis + 1) % 3, (axis + 2) % 3
+    matrices[:, axis, axis] = 1.0
+    matrices[:, j, j] = cos
+    matrices[:, j, k] = sin
+    matrices[:, k, j] = -sin
+    matrices[:, k, k] = cos
+    return matrices
+
+
+def euler_to_rotation(rotations, rotate_order='xyz', as_degrees=True):
+    """
+    the 3x3 rotation matrices of the euler rotations.
+    :param rotations: <list> (N, 3) x, y, z rotations.
+    :param rotate_order: <int>, <str> Maya rotate order.
+    :param as_degrees: <bool> the rotations are in degrees, otherwise radians.
+    :return: <numpy.ndarray> (N, 3, 3) matrices.
+    """
+    rotations = as_vectors(rotations)
+    if as_degrees:
+        rotations = numpy.radians(rotations)
+    result = None
+    for axis_name in get_rotate_order(rotate_order):
+        axis = AXES[axis_name]
+        rotation = _axis_rotations(rotations[:, axis], axis)
+        result = rotation if result is None else numpy.matmul(result, rotation)
+    return result
+
+
+def rotation_to_euler(rotations, rotate_order='xyz', as_degrees=True):
+    """
+    the euler rotations of the 3x3 rotation matrices, the first and last axis take the whole rotation at gimbal lock.
+    :param rotations: <numpy.ndarray> (N, 3, 3) orthonormal rotation matrices.
+    :param rotate_order: <int>, <str> Maya rotate order.
+    :param as_degrees: <bool> return degrees, otherwise radians.
+    :return: <numpy.ndarray> (N, 3) x, y, z rotations.
+    """
+    rotations = numpy.asarray(rotations, dtype=float).reshape(-1, 3, 3)
+    i, j, k = (AXES[a] for a in get_rotate_order(rotate_order))
+    # odd permutations mirror the signs of the cyclic xyz, yzx and zxy solution
+    parity = 1.0 if (j - i) % 3 == 1 else -1.0
+    # rows are the rotated axes, the column vector form of R = Ri * Rj * Rk is its transpose
+    m = numpy.swapaxes(rotations, 1, 2)
+    sin_j = numpy.clip(-parity * m[:, k, i], -1.0, 1.0)
+    cos_j = numpy.sqrt(m[:, i, i] ** 2 + m[:, j, i] ** 2)
+    angle_j = numpy.arctan2(sin_j, cos_j)
+    locked = cos_j < 1e-9
+    angle_i = numpy.where(locked, 0.0, numpy.arctan2(parity * m[:, k, j], m[:, k, k]))
+    angle_k = numpy.where(locked,
+                          numpy.arctan2(-parity * m[:, i, j], m[:, j, j]),
+                          numpy.arctan2(parity * m[:, j, i], m[:, i, i]))
+    result = numpy.zeros((len(m), 3))
+    result[:, i] = angle_i
+    result[:, j] = angle_j
+    result[:, k] = angle_k
+    return numpy.degrees(result) if as_degrees else result
+
+
+def compose(translations=(0.0, 0.0, 0.0), rotations=(0.0, 0.0, 0.0), scales=(1.0, 1.0, 1.0),
+            rotate_order='xyz', as_degrees=True):
+    """
+    composes the scale * rotation * translation matrices.
+    :param translations: <list> (N, 3) translations.
+    :param rotations: <list> (N, 3) euler rotations.
+    :param scales: <list> (N, 3) scales.
+    :param rotate_order: <int>, <str> Maya rotate order.
+    :param as_degrees: <bool> the rotations are in degrees, otherwise radians.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    translations, rotations, scales = numpy.broadcast_arrays(
+        as_vectors(translations), as_vectors(rotations), as_vectors(scales))
+    matrices = identity(len(translations))
+    matrices[:, :3, :3] = euler_to_rotation(rotations, rotate_order, as_degrees) * scales[:, :, None]
+    matrices[:, 3, :3] = translations
+    return matrices
+
+
+def decompose(matrices, rotate_order='xyz', as_degrees=True):
+    """
+    decomposes the matrices into translations, euler rotations and scales, shear is ignored.
+    Negative determinant matrices return a negative x scale.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :param rotate_order: <int>, <str> Maya rotate order.
+    :param as_degrees: <bool> return degrees, otherwise radians.
+    :return: <tuple> (N, 3) translations, rotations and scales.
+    """
+    matrices = as_matrices(matrices)
+    translations = matrices[:, 3, :3].copy()
+    rotations, scales = split_rotation_scale(matrices)
+    return translations, rotation_to_euler(rotations, rotate_order, as_degrees), scales
+
+
+def split_rotation_scale(matrices):
+    """
+    splits the upper 3x3 of the matrices into orthonormal rotations and scales.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :return: <tuple> (N, 3, 3) rotations, (N, 3) scales.
+    """
+    matrices = as_matrices(matrices)
+    axes = matrices[:, :3, :3]
+    scales = numpy.linalg.norm(axes, axis=2)
+    scales[numpy.linalg.det(axes) < 0.0, 0] *= -1.0
+    safe = numpy.where(numpy.abs(scales) > EPSILON, scales, 1.0)
+    return axes / safe[:, :, None], scales
+
+
+def orthonormalize(matrices):
+    """
+    removes the scale and shear of the matrices, keeping the x axis direction.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices = as_matrices(matrices).copy()
+    x = matrices[:, 0, :3]
+    x = x / numpy.linalg.norm(x, axis=1)[:, None]
+    z = numpy.cross(x, matrices[:, 1, :3])
+    z = z / numpy.linalg.norm(z, axis=1)[:, None]
+    y = numpy.cross(z, x)
+    matrices[:, 0, :3], matrices[:, 1, :3], matrices[:, 2, :3] = x, y, z
+    matrices[:, :3, 3] = 0.0
+    return matrices
+
+
+def quaternion_to_rotation(quaternions):
+    """
+    the 3x3 row vector rotation matrices of the quaternions.
+    :param quaternions: <list> (N, 4) x, y, z, w quaternions.
+    :return: <numpy.ndarray> (N, 3, 3) matrices.
+    """
+    q = normalize_quaternions(quaternions)
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    matrices = numpy.empty((len(q), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y + z * w)
+    matrices[:, 0, 2] = 2.0 * (x * z - y * w)
+    matrices[:, 1, 0] = 2.0 * (x * y - z * w)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z + x * w)
+    matrices[:, 2, 0] = 2.0 * (x * z + y * w)
+    matrices[:, 2, 1] = 2.0 * (y * z - x * w)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def rotation_to_quaternion(rotations):
+    """
+    the quaternions of the 3x3 row vector rotation matrices, with a positive w.
+    :param rotations: <numpy.ndarray> (N, 3, 3) orthonormal rotation matrices.
+    :return: <numpy.ndarray> (N, 4) x, y, z, w quaternions.
+    """
+    m = numpy.asarray(rotations, dtype=float).reshape(-1, 3, 3)
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    # solve from the largest diagonal term of each matrix to stay away from small divisors
+    candidates = numpy.stack((1.0 + m00 - m11 - m22,
+                              1.0 - m00 + m11 - m22,
+                              1.0 - m00 - m11 + m22,
+                              1.0 + m00 + m11 + m22), axis=1)
+    largest = numpy.argmax(candidates, axis=1)
+    root = numpy.sqrt(numpy.maximum(candidates[numpy.arange(len(m)), largest], EPSILON)) * 2.0
+    q = numpy.empty((len(m), 4))
+    # row vector matrices are the transpose of the column vector form
+    yz, zy = m[:, 2, 1], m[:, 1, 2]
+    zx, xz = m[:, 0, 2], m[:, 2, 0]
+    xy, yx = m[:, 1, 0], m[:, 0, 1]
+    cases = (
+        (0.25 * root, (yx + xy) / root, (zx + xz) / root, (zy - yz) / root),
+        ((yx + xy) / root, 0.25 * root, (zy + yz) / root, (xz - zx) / root),
+        ((zx + xz) / root, (zy + yz) / root, 0.25 * root, (yx - xy) / root),
+        ((zy - yz) / root, (xz - zx) / root, (yx - xy) / root, 0.25 * root),
+    )
+    for index, case in enumerate(cases):
+        selected = largest == index
+        q[selected] = numpy.stack(case, axis=1)[selected]
+    q[q[:, 3] < 0.0] *= -1.0
+    return normalize_quaternions(q)
+
+
+def normalize_quaternions(quaternions):
+    """
+    the unit length quaternions.
+    :param quaternions: <list> (N, 4) x, y, z, w quaternions.
+    :return: <numpy.ndarray> (N, 4) quaternions.
+    """
+    q = as_vectors(quaternions, 4)
+    lengths = numpy.linalg.norm(q, axis=1)
+    return q / numpy.where(lengths > EPSILON, lengths, 1.0)[:, None]
+
+
+def multiply_quaternions(quaternions_a, quaternions_b):
+    """
+    the quaternion products matching the row vector matrix product a * b, rotating by a then b.
+    :param quaternions_a: <list> (N, 4) x, y, z, w quaternions.
+    :param quaternions_b: <list> (N, 4) x, y, z, w quaternions.
+    :return: <numpy.ndarray> (N, 4) quaternions.
+    """
+    a, b = numpy.broadcast_arrays(as_vectors(quaternions_a, 4), as_vectors(quaternions_b, 4))
+    # the Hamilton product b * a applies a first
+    ax, ay, az, aw = a.T
+    bx, by, bz, bw = b.T
+    return numpy.stack((bw * ax + bx * aw + by * az - bz * ay,
+                        bw * ay - bx * az + by * aw + bz * ax,
+                        bw * az + bx * ay - by * ax + bz * aw,
+                        bw * aw - bx * ax - by * ay - bz * az), axis=1)
+
+
+def axis_angle_to_quaternion(axes, angles, as_degrees=True):
+    """
+    the quaternions rotating around each axis by its angle.
+    :param axes: <list> (N, 3) rotation axes.
+    :param angles: <list> (N,) rotation angles.
+    :param as_degrees: <bool> the angles are in degrees, otherwise radians.
+    :return: <numpy.ndarray> (N, 4) x, y, z, w quaternions.
+    """
+    axes = as_vectors(axes)
+    angles = numpy.asarray(angles, dtype=float).reshape(-1)
+    if as_degrees:
+        angles = numpy.radians(angles)
+    axes, angles = numpy.broadcast_arrays(axes, angles[:, None])
+    lengths = numpy.linalg.norm(axes, axis=1)
+    axes = axes / numpy.where(lengths > EPSILON, lengths, 1.0)[:, None]
+    half = angles[:, 0] * 0.5
+    return numpy.concatenate((axes * numpy.sin(half)[:, None], numpy.cos(half)[:, None]), axis=1)
+
+
+def quaternion_to_axis_angle(quaternions, as_degrees=True):
+    """
+    the rotation axes and angles of the quaternions, identity rotations return the x axis.
+    :param quaternions: <list> (N, 4) x, y, z, w quaternions.
+    :param as_degrees: <bool> return degrees, otherwise radians.
+    :return: <tuple> (N, 3) axes, (N,) angles.
+    """
+    q = normalize_quaternions(quaternions)
+    sin_half = numpy.linalg.norm(q[:, :3], axis=1)
+    angles = 2.0 * numpy.arctan2(sin_half, q[:, 3])
+    axes = numpy.where((sin_half > EPSILON)[:, None],
+                       q[:, :3] / numpy.where(sin_half > EPSILON, sin_half, 1.0)[:, None],
+                       numpy.array([1.0, 0.0, 0.0]))
+    return axes, numpy.degrees(angles) if as_degrees else angles
+
+
+def euler_to_quaternion(rotations, rotate_order='xyz', as_degrees=True):
+    """
+    the quaternions of the euler rotations.
+    :return: <numpy.ndarray> (N, 4) x, y, z, w quaternions.
+    """
+    return rotation_to_quaternion(euler_to_rotation(rotations, rotate_order, as_degrees))
+
+
+def quaternion_to_euler(quaternions, rotate_order='xyz', as_degrees=True):
+    """
+    the euler rotations of the quaternions.
+    :return: <numpy.ndarray> (N, 3) x, y, z rotations.
+    """
+    return rotation_to_euler(quaternion_to_rotation(quaternions), rotate_order, as_degrees)
+
+
+def scale_axes(matrices, axis, rows=True, columns=False, translation=False):
+    """
+    negates one axis of the matrices.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :param axis: <int>, <str> the axis to negate.
+    :param rows: <bool> negate the axis row, flipping the direction of that axis.
+    :param columns: <bool> negate the axis column, mirroring every axis across the axis plane.
+    :param translation: <bool> negate the axis component of the translation.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices = as_matrices(matrices).copy()
+    axis = get_axis_index(axis)
+    if columns:
+        matrices[:, :3, axis] *= -1.0
+    if rows:
+        matrices[:, axis, :3] *= -1.0
+    if translation:
+        matrices[:, 3, axis] *= -1.0
+    return matrices
+
+
+def mirror_matrices(matrices, mirror=(False, False, False), flip_position=(False, False, False),
+                    flip_rotation=(False, False, False)):
+    """
+    mirrors the matrices with one set of flags for all of them.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :param mirror: <tuple> mirror the x, y, z columns.
+    :param flip_position: <tuple> negate the x, y, z translation.
+    :param flip_rotation: <tuple> negate the x, y, z axis rows.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices = as_matrices(matrices).copy()
+    column_signs = numpy.where(mirror, -1.0, 1.0)
+    row_signs = numpy.where(flip_rotation, -1.0, 1.0)
+    matrices[:, :3, :3] *= column_signs[None, None, :] * row_signs[None, :, None]
+    # the column mirror also applies to the translation row
+    matrices[:, 3, :3] *= column_signs * numpy.where(flip_position, -1.0, 1.0)
+    return matrices
+
+
+def reflection_matrix(normal=(1.0, 0.0, 0.0), origin=(0.0, 0.0, 0.0)):
+    """
+    the matrix reflecting row vectors across the plane.
+    :param normal: <tuple> the plane normal.
+    :param origin: <tuple> a point on the plane.
+    :return: <numpy.ndarray> (4, 4) matrix.
+    """
+    normal = as_vectors(normal)[0]
+    normal = normal / numpy.linalg.norm(normal)
+    origin = as_vectors(origin)[0]
+    matrix = numpy.eye(4)
+    matrix[:3, :3] -= 2.0 * numpy.outer(normal, normal)
+    matrix[3, :3] = 2.0 * numpy.dot(origin, normal) * normal
+    return matrix
+
+
+def mirror_across_plane(matrices, normal=(1.0, 0.0, 0.0), origin=(0.0, 0.0, 0.0), behavior=True, flip_axis='x'):
+    """
+    reflects the matrices across the plane and restores right handed axes.
+    :param matrices: <list> (N, 4, 4) world matrices.
+    :param normal: <tuple> the plane normal.
+    :param origin: <tuple> a point on the plane.
+    :param behavior: <bool> negate every reflected axis, like the behavior option of mirrorJoint.
+    :param flip_axis: <int>, <str> the axis negated to keep the matrices right handed when not behavior.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices = numpy.matmul(as_matrices(matrices), reflection_matrix(normal, origin))
+    if behavior:
+        matrices[:, :3, :3] *= -1.0
+    else:
+        matrices[:, get_axis_index(flip_axis), :3] *= -1.0
+    return matrices
+
+
+def reflect_axes(matrices, axis, normal=(1.0, 0.0, 0.0)):
+    """
+    reflects one axis row of the matrices across the plane through the origin and normalizes it.
+    :param matrices: <list> (N, 4, 4) matrices.
+    :param axis: <int>, <str> the axis row to reflect.
+    :param normal: <tuple> the plane normal.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices = as_matrices(matrices).copy()
+    axis = get_axis_index(axis)
+    reflected = numpy.matmul(matrices[:, axis, :3], reflection_matrix(normal)[:3, :3])
+    lengths = numpy.linalg.norm(reflected, axis=1)
+    matrices[:, axis, :3] = reflected / numpy.where(lengths > EPSILON, lengths, 1.0)[:, None]
+    return matrices
+
+
+def slerp_quaternions(quaternions_a, quaternions_b, weights):
+    """
+    spherical interpolation along the shortest arc from each quaternion a to b.
+    Nearly parallel quaternions are blended linearly and normalized.
+    :param quaternions_a: <list> (N, 4) x, y, z, w quaternions.
+    :param quaternions_b: <list> (N, 4) x, y, z, w quaternions.
+    :param weights: <float>, <list> one weight, or (N,) weights, 0.0 returns a and 1.0 returns b.
+    :return: <numpy.ndarray> (N, 4) quaternions.
+    """
+    weights = numpy.asarray(weights, dtype=float).reshape(-1)
+    a, b, weights = numpy.broadcast_arrays(normalize_quaternions(quaternions_a),
+                                           normalize_quaternions(quaternions_b), weights[:, None])
+    weights = weights[:, 0]
+    cosines = numpy.einsum('ij,ij->i', a, b)
+    b = numpy.where((cosines < 0.0)[:, None], -b, b)
+    cosines = numpy.abs(cosines)
+    angles = numpy.arccos(numpy.clip(cosines, -1.0, 1.0))
+    sines = numpy.sin(angles)
+    linear = sines < 1e-6
+    safe = numpy.where(linear, 1.0, sines)
+    weight_a = numpy.where(linear, 1.0 - weights, numpy.sin((1.0 - weights) * angles) / safe)
+    weight_b = numpy.where(linear, weights, numpy.sin(weights * angles) / safe)
+    return normalize_quaternions(a * weight_a[:, None] + b * weight_b[:, None])
+
+
+def interpolate_matrices(matrices_a, matrices_b, weights):
+    """
+    blends the matrices by lerping the translation and scale and slerping the rotation, shear is dropped.
+    A single start and end matrix can be blended by many weights in one call.
+    :param matrices_a: <list> (N, 4, 4) start matrices.
+    :param matrices_b: <list> (N, 4, 4) end matrices.
+    :param weights: <float>, <list> one weight, or (N,) weights, 0.0 returns a and 1.0 returns b.
+    :return: <numpy.ndarray> (N, 4, 4) matrices.
+    """
+    matrices_a = as_matrices(matrices_a)
+    matrices_b = as_matrices(matrices_b)
+    weights = numpy.asarray(weights, dtype=float).reshape(-1)
+    rotations_a, scales_a = split_rotation_scale(matrices_a)
+    rotations_b, scales_b = split_rotation_scale(matrices_b)
+    quaternions = slerp_quaternions(rotation_to_quaternion(rotations_a), rotation_to_quaternion(rotations_b), weights)
+    blend = weights[:, None]
+    translations = matrices_a[:, 3, :3] + (matrices_b[:, 3, :3] - matrices_a[:, 3, :3]) * blend
+    scales = scales_a + (scales_b - scales_a) * blend
+    matrices = identity(len(quaternions))
+    matrices[:, :3, :3] = quaternion_to_rotation(quaternions) * scales[:, :, None]
+    matrices[:, 3, :3] = translations
+    return matrices
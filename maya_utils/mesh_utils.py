@@ -4,6 +4,12 @@ mesh_utils.py utility node relating to mesh functions
 # import standatd modules
 from pprint import pprint
 
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # import maya modules
 from maya import OpenMaya
 from maya import cmds
@@ -12,6 +18,7 @@ from maya import cmds
 from . import object_utils
 from maya_utils import transform_utils
 from maya_utils import math_utils
+from maya_utils import falloff_kernels
 
 # define local variables
 DATA_DICT = {}
@@ -562,5 +569,54 @@ def get_edge_loop_points_at_axis(mesh_name='', axis='z', rounded_to=4):
             axis_data[position_value] += vtx_id,
     return axis_data
 
+
+def get_mesh_points(mesh_name="", world_space=True):
+    """
+    gets every vertex position of the mesh in one call.
+    :param mesh_name: <str> the mesh name.
+    :param world_space: <bool> world space positions, otherwise object space.
+    :return: <numpy.ndarray> (N, 3) positions.
+    """
+    # world space points need the dag path of the shape, skip the intermediate orig shapes
+    if cmds.objectType(mesh_name) == 'mesh':
+        shape_name = mesh_name
+    else:
+        shapes = cmds.listRelatives(mesh_name, shapes=True, noIntermediate=True, type='mesh', fullPath=True)
+        if not shapes:
+            raise ValueError("[GetMeshPoints] :: No mesh shape found under: {}".format(mesh_name))
+        shape_name = shapes[0]
+    mesh_fn = OpenMaya.MFnMesh(object_utils.get_m_dag(shape_name))
+    m_points = OpenMaya.MPointArray()
+    mesh_fn.getPoints(m_points, get_space(world_space=world_space, object_space=not world_space))
+    return numpy.array([(m_points[i].x, m_points[i].y, m_points[i].z) for i in range(m_points.length())])
+
+
+def get_falloff_weights(mesh_name="", radius=1.0, falloff_type='gaussian', **targets):
+    """
+    the falloff weight of every vertex of the mesh.
+    :param mesh_name: <str> the mesh name.
+    :param radius: <float> the falloff radius.
+    :param falloff_type: <str> gaussian, smoothstep, linear or sinusoidal.
+    :param targets: <dict> falloff_kernels.weight_map points, polyline, curve, plane and invert arguments.
+    :return: <numpy.ndarray> (N,) weights.
+    """
+    return falloff_kernels.weight_map(get_mesh_points(mesh_name), radius=radius, falloff_type=falloff_type,
+                                      **targets)
+
+
+def set_deformer_weights(deformer_name="", weights=(), geometry_index=0):
+    """
+    sets the deformer weights of every vertex with one call.
+    :param deformer_name: <str> the deformer name.
+    :param weights: <list> (N,) weights, one for each vertex.
+    :param geometry_index: <int> the deformed geometry index.
+    :return: <bool> True for success.
+    """
+    weights = [float(w) for w in weights]
+    if not weights:
+        return False
+    cmds.setAttr(deformer_name + '.weightList[{}].weights[0:{}]'.format(geometry_index, len(weights) - 1), *weights)
+    return True
+
 # _______________________________________________________________________________________________________________
 # mesh_utils.py
\ No newline at end of file
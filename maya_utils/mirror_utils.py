@@ -0,0 +1,99 @@
+"""
+Batch mirroring of transforms across a plane.
+The source world matrices are read in one pass, mirrored in one vectorised call
+and applied to their side paired targets in one undoable batch.
+"""
+# import maya modules
+from maya import cmds
+
+# import local modules
+import read_sides
+from maya_utils import transform_utils
+from maya_utils import matrix_kernels
+
+# define local variables
+MIRROR_SIDES = read_sides.MirrorSides()
+MIRROR_PLANES = {
+    'yz': (1.0, 0.0, 0.0),
+    'xz': (0.0, 1.0, 0.0),
+    'xy': (0.0, 0.0, 1.0),
+}
+
+
+def get_plane_normal(plane='yz'):
+    """
+    the normal of the mirror plane.
+    :param plane: <str>, <tuple> yz, xz, xy, or a normal vector.
+    :return: <tuple> plane normal.
+    """
+    if isinstance(plane, str):
+        try:
+            return MIRROR_PLANES[plane.lower()]
+        except KeyError:
+            raise ValueError("[GetPlaneNormal] :: Unsupported mirror plane: {}".format(plane))
+    return tuple(plane)
+
+
+def get_mirror_name(object_name=""):
+    """
+    the name of the opposite side object.
+    :param object_name: <str> the object name with a side.
+    :return: <str> the mirrored name, the same name for center objects.
+    """
+    return MIRROR_SIDES.replace_side_string(object_name)
+
+
+def get_mirror_pairs(objects=(), skip_missing=True):
+    """
+    pairs each object with its opposite side object.
+    :param objects: <list> source object names.
+    :param skip_missing: <bool> skip objects whose mirror object does not exist, otherwise mirror them onto themselves.
+    :return: <list> (source, target) name pairs.
+    """
+    pairs = []
+    for object_name in objects:
+        mirror_name = get_mirror_name(object_name)
+        if not cmds.objExists(mirror_name):
+            if skip_missing:
+                continue
+            mirror_name = object_name
+        pairs.append((object_name, mirror_name))
+    return pairs
+
+
+def mirror_world_matrices(matrices, plane='yz', origin=(0.0, 0.0, 0.0), behavior=True, flip_axis='x'):
+    """
+    mirrors the world matrices across the plane.
+    :param matrices: <list> (N, 4, 4) world matrices.
+    :param plane: <str>, <tuple> yz, xz, xy, or a normal vector.
+    :param origin: <tuple> a point on the mirror plane.
+    :param behavior: <bool> negate every reflected axis, otherwise only the flip axis.
+    :param flip_axis: <str> the axis negated when not mirroring the behavior.
+    :return: <numpy.ndarray> (N, 4, 4) mirrored matrices.
+    """
+    return matrix_kernels.mirror_across_plane(matrices, get_plane_normal(plane), origin,
+                                              behavior=behavior, flip_axis=flip_axis)
+
+
+def mirror_transforms(objects=(), plane='yz', origin=(0.0, 0.0, 0.0), behavior=True, flip_axis='x',
+                      skip_missing=True):
+    """
+    mirrors the transforms onto their opposite side objects.
+    :param objects: <list> source object names, the selected transforms when not given.
+    :param plane: <str>, <tuple> yz, xz, xy, or a normal vector.
+    :param origin: <tuple> a point on the mirror plane.
+    :param behavior: <bool> negate every reflected axis, otherwise only the flip axis.
+    :param flip_axis: <str> the axis negated when not mirroring the behavior.
+    :param skip_missing: <bool> skip objects whose mirror object does not exist, otherwise mirror them in place.
+    :return: <dict> target object names with their flat world matrices.
+    """
+    if not objects:
+        objects = cmds.ls(sl=1, type='transform')
+    pairs = get_mirror_pairs(objects, skip_missing=skip_missing)
+    if not pairs:
+        return {}
+    sources, targets = zip(*pairs)
+    matrices = mirror_world_matrices(transform_utils.get_world_matrices(sources), plane, origin,
+                                     behavior=behavior, flip_axis=flip_axis)
+    transform_utils.set_world_matrices(targets, matrices)
+    return dict(zip(targets, matrix_kernels.to_flat_lists(matrices)))
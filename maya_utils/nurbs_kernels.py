@@ -0,0 +1,289 @@
+"""
+Pure data NURBS curve construction and evaluation.
+Knot vectors, Cox-de Boor basis evaluation, point, tangent and closest parameter queries and
+curve fitting through points all work on arrays of parameters at once, so a curve can be set up
+and checked without Maya and created in the scene once, at the end.
+Knots are in the Maya format, the full knot vector without its first and last knot,
+and parameters are in knot units like MFnNurbsCurve parameters.
+This module does not import Maya.
+"""
+# import local modules
+from . import spline_kernels
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+CLOSEST_SAMPLES_PER_SPAN = 16
+NEWTON_STEPS = 8
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[NurbsKernels] :: numpy is required for the NURBS evaluation.")
+
+
+def get_spans(ncvs, degree):
+    return ncvs - degree
+
+
+def get_num_knots(ncvs, degree):
+    """
+    the number of knots Maya stores for the curve.
+    :param ncvs: <int> the number of CVs.
+    :param degree: <int> curve degree.
+    :return: <int> number of knots.
+    """
+    return ncvs + degree - 1
+
+
+def uniform_knots(ncvs, degree=3):
+    """
+    the clamped uniform knots of an open curve, spans are one knot unit long.
+    :param ncvs: <int> the number of CVs, more than the degree.
+    :param degree: <int> curve degree.
+    :return: <list> Maya knots.
+    """
+    spans = get_spans(ncvs, degree)
+    if spans < 1:
+        raise ValueError("[UniformKnots] :: A degree {} curve needs at least {} CVs.".format(degree, degree + 1))
+    return [0.0] * (degree - 1) + [float(i) for i in range(spans + 1)] + [float(spans)] * (degree - 1)
+
+
+def to_full_knots(knots, degree):
+    """
+    adds the first and last knots Maya leaves out.
+    Clamped ends repeat their end knot, other ends continue their end spacing.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :return: <numpy.ndarray> full knot vector.
+    """
+    _require_numpy()
+    knots = numpy.asarray(knots, dtype=float)
+    if degree > 1 and knots[1] - knots[0] < EPSILON:
+        first = knots[0]
+    else:
+        first = knots[0] - (knots[1] - knots[0]) if len(knots) > 1 else knots[0] - 1.0
+    if degree > 1 and knots[-1] - knots[-2] < EPSILON:
+        last = knots[-1]
+    else:
+        last = knots[-1] + (knots[-1] - knots[-2]) if len(knots) > 1 else knots[-1] + 1.0
+    return numpy.concatenate(([first], knots, [last]))
+
+
+def to_maya_knots(full_knots):
+    """
+    removes the first and last knots of a full knot vector.
+    :param full_knots: <list> full knot vector.
+    :return: <list> Maya knots.
+    """
+    return [float(k) for k in full_knots[1:-1]]
+
+
+def knot_domain(knots, degree):
+    """
+    the parameter range of the curve.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :return: <tuple> min, max parameters.
+    """
+    return float(knots[degree - 1]), float(knots[len(knots) - degree])
+
+
+def basis(knots, degree, parameters):
+    """
+    the Cox-de Boor basis weights of every CV for each parameter.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param parameters: <list> (T,) parameters.
+    :return: <numpy.ndarray> (T, ncvs) weights.
+    """
+    start, end = knot_domain(knots, degree)
+    u = numpy.clip(numpy.asarray(parameters, dtype=float).reshape(-1), start, end)
+    return spline_kernels.bspline_basis(to_full_knots(knots, degree), degree, u)
+
+
+def evaluate_points(cvs, knots, degree, parameters):
+    """
+    the curve points at the parameters.
+    :param cvs: <list> (N, 3) CV positions.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param parameters: <list> (T,) parameters.
+    :return: <numpy.ndarray> (T, 3) points.
+    """
+    return numpy.matmul(basis(knots, degree, parameters), spline_kernels.as_points(cvs))
+
+
+def _derivative(cvs, full_knots, degree):
+    """
+    the CVs and full knots of the first derivative curve.
+    """
+    spans = full_knots[degree + 1:degree + len(cvs)] - full_knots[1:len(cvs)]
+    derivative_cvs = degree * numpy.diff(cvs, axis=0) / numpy.where(spans > EPSILON, spans, 1.0)[:, None]
+    return derivative_cvs, full_knots[1:-1]
+
+
+def evaluate_derivatives(cvs, knots, degree, parameters, order=1):
+    """
+    the curve derivatives at the parameters.
+    :param cvs: <list> (N, 3) CV positions.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param parameters: <list> (T,) parameters.
+    :param order: <int> 1 for the first derivative, 2 for the second.
+    :return: <numpy.ndarray> (T, 3) derivative vectors.
+    """
+    cvs = spline_kernels.as_points(cvs)
+    start, end = knot_domain(knots, degree)
+    u = numpy.clip(numpy.asarray(parameters, dtype=float).reshape(-1), start, end)
+    if order > degree:
+        return numpy.zeros((len(u), cvs.shape[1]))
+    full_knots = to_full_knots(knots, degree)
+    for _ in range(order):
+        cvs, full_knots = _derivative(cvs, full_knots, degree)
+        degree -= 1
+    return numpy.matmul(spline_kernels.bspline_basis(full_knots, degree, u), cvs)
+
+
+def evaluate_tangents(cvs, knots, degree, parameters, normalize=False):
+    """
+    the curve tangents at the parameters.
+    :param cvs: <list> (N, 3) CV positions.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param parameters: <list> (T,) parameters.
+    :param normalize: <bool> return unit length tangents, otherwise the first derivatives.
+    :return: <numpy.ndarray> (T, 3) tangents.
+    """
+    tangents = evaluate_derivatives(cvs, knots, degree, parameters)
+    if normalize:
+        lengths = numpy.linalg.norm(tangents, axis=1)
+        tangents = tangents / numpy.where(lengths > EPSILON, lengths, 1.0)[:, None]
+    return tangents
+
+
+def closest_parameters(cvs, knots, degree, points, samples_per_span=CLOSEST_SAMPLES_PER_SPAN):
+    """
+    the curve parameters closest to each point, found from dense samples refined by Newton steps.
+    :param cvs: <list> (N, 3) CV positions.
+    :param knots: <list> Maya knots.
+    :param degree: <int> curve degree.
+    :param points: <list> (T, 3) query points.
+    :param samples_per_span: <int> the coarse samples taken per span.
+    :return: <numpy.ndarray> (T,) parameters.
+    """
+    points = spline_kernels.as_points(points)
+    start, end = knot_domain(knots, degree)
+    spans = max(get_spans(len(cvs), degree), 1)
+    samples = numpy.linspace(start, end, spans * samples_per_span + 1)
+    sample_points = evaluate_points(cvs, knots, degree, samples)
+    distances = numpy.linalg.norm(points[:, None, :] - sample_points[None, :, :], axis=2)
+    u = samples[numpy.argmin(distances, axis=1)]
+    for _ in range(NEWTON_STEPS):
+        offsets = evaluate_points(cvs, knots, degree, u) - points
+        first = evaluate_derivatives(cvs, knots, degree, u)
+        second = evaluate_derivatives(cvs, knots, degree, u, order=2)
+        numerator = numpy.einsum('ij,ij->i', offsets, first)
+        denominator = numpy.einsum('ij,ij->i', first, first) + numpy.einsum('ij,ij->i', offsets, second)
+        step = numpy.where(numpy.abs(denominator) > EPSILON, numerator / numpy.where(
+            numpy.abs(denominator) > EPSILON, denominator, 1.0), 0.0)
+        u = numpy.clip(u - step, start, end)
+    return u
+
+
+def closest_points(cvs, knots, degree, points):
+    """
+    the curve points closest to each point.
+    :return: <tuple> (T, 3) curve points, (T,) parameters.
+    """
+    parameters = closest_parameters(cvs, knots, degree, points)
+    return evaluate_points(cvs, knots, degree, parameters), parameters
+
+
+def arc_length_table(cvs, knots, degree, samples_per_span=CLOSEST_SAMPLES_PER_SPAN):
+    """
+    the cumulative arc lengths of the curve at evenly spaced parameters.
+    :return: <tuple> parameters, cumulative lengths.
+    """
+    start, end = knot_domain(knots, degree)
+    spans = max(get_spans(len(cvs), degree), 1)
+    parameters = numpy.linspace(start, end, spans * samples_per_span + 1)
+    chords = numpy.linalg.norm(numpy.diff(evaluate_points(cvs, knots, degree, parameters), axis=0), axis=1)
+    return parameters, numpy.concatenate(([0.0], numpy.cumsum(chords)))
+
+
+def curve_length(cvs, knots, degree):
+    """
+    the approximate curve length.
+    :return: <float> length.
+    """
+    return float(arc_length_table(cvs, knots, degree)[1][-1])
+
+
+def parameters_at_fractions(cvs, knots, degree, fractions):
+    """
+    the curve parameters at the fractions of the curve length.
+    :param fractions: <list> (T,) fractions from 0.0 to 1.0.
+    :return: <numpy.ndarray> (T,) parameters.
+    """
+    return spline_kernels.arc_length_parameters(arc_length_table(cvs, knots, degree), fractions)
+
+
+def chord_length_parameters(points):
+    """
+    the normalized chord length parameter of each point.
+    :param points: <list> (N, 3) points.
+    :return: <numpy.ndarray> (N,) parameters from 0.0 to 1.0.
+    """
+    points = spline_kernels.as_points(points)
+    chords = numpy.linalg.norm(numpy.diff(points, axis=0), axis=1)
+    lengths = numpy.concatenate(([0.0], numpy.cumsum(chords)))
+    if lengths[-1] < EPSILON:
+        return numpy.linspace(0.0, 1.0, len(points))
+    return lengths / lengths[-1]
+
+
+def fit_curve(points, degree=3):
+    """
+    the open curve passing through every point, by global interpolation with chord length
+    parameters and averaged knots.
+    :param points: <list> (N, 3) points, more than the degree.
+    :param degree: <int> curve degree.
+    :return: <tuple> (N, 3) CVs, Maya knots, parameters of the points.
+    """
+    points = spline_kernels.as_points(points)
+    count = len(points)
+    if count <= degree:
+        raise ValueError("[FitCurve] :: A degree {} curve needs at least {} points.".format(degree, degree + 1))
+    parameters = chord_length_parameters(points)
+    full_knots = numpy.concatenate((numpy.zeros(degree + 1),
+                                    [parameters[j:j + degree].mean() for j in range(1, count - degree)],
+                                    numpy.ones(degree + 1)))
+    weights = spline_kernels.bspline_basis(full_knots, degree, parameters)
+    cvs = numpy.linalg.solve(weights, points)
+    return cvs, to_maya_knots(full_knots), parameters
+
+
+def insert_end_midpoints(points, equal_distance=False):
+    """
+    the CV positions create_curve_from_points builds from its points, with a midpoint added at each end span.
+    :param points: <list> (N, 3) points.
+    :param equal_distance: <bool> double the end points and place the inner CVs at the span midpoints.
+    :return: <numpy.ndarray> (N + 2, 3) CV positions, (3, 3) for two points.
+    """
+    points = spline_kernels.as_points(points)
+    if len(points) == 2:
+        # both end span midpoints are the same point
+        return numpy.concatenate((points[:1], [(points[0] + points[1]) * 0.5], points[1:]))
+    if equal_distance:
+        inner = (points[:-2] + points[1:-1]) * 0.5
+        end_mid = (points[-2] + points[-1]) * 0.5
+        return numpy.concatenate((points[:1], points[:1], inner, [end_mid], points[-1:]))
+    first_mid = (points[0] + points[1]) * 0.5
+    last_mid = (points[-2] + points[-1]) * 0.5
+    return numpy.concatenate((points[:1], [first_mid], points[1:-1], [last_mid], points[-1:]))
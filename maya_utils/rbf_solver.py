@@ -0,0 +1,252 @@
+"""
+Offline RBF pose interpolation for weightDriver data.
+The pose inputs and values captured by rbf_utils.get_weight_driver_data are read into arrays,
+the kernel system is solved once per driver and cached, and any number of sample poses
+are evaluated in one batch, so corrective shape activation can be checked without Maya.
+This module does not import Maya.
+"""
+# import standard modules
+import hashlib
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+RBF_TYPE = 1
+KERNELS = ('linear', 'gaussian', 'thin_plate', 'multi_quadratic', 'inverse_multi_quadratic')
+DISTANCE_TYPES = ('euclidean', 'angle')
+# the kernel and distanceType enum values of the weightDriver node
+DRIVER_KERNELS = ('linear', 'gaussian')
+DRIVER_DISTANCE_TYPES = ('euclidean', 'angle')
+_SOLVER_CACHE = {}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[RBFSolver] :: numpy is required for the RBF solver.")
+
+
+def get_pose_arrays(driver_data):
+    """
+    the pose inputs and values of a single driver as arrays, in pose index order.
+    :param driver_data: <dict> one driver entry of rbf_utils.get_weight_driver_data.
+    :return: <tuple> (P, I) pose inputs, (P, O) pose values, pose indices.
+    """
+    _require_numpy()
+    pose_inputs = driver_data["pose_inputs"]
+    pose_values = driver_data["pose_values"]
+    # json round trips turn the pose indices into strings
+    indices = sorted((k for k in pose_inputs if k in pose_values), key=int)
+    inputs = numpy.array([pose_inputs[k] for k in indices], dtype=float).reshape(len(indices), -1)
+    values = numpy.array([pose_values[k] for k in indices], dtype=float).reshape(len(indices), -1)
+    return inputs, values, [int(k) for k in indices]
+
+
+def pairwise_distances(points_a, points_b):
+    """
+    the euclidean distances between every pair of points.
+    :param points_a: <numpy.ndarray> (A, I) points.
+    :param points_b: <numpy.ndarray> (B, I) points.
+    :return: <numpy.ndarray> (A, B) distances.
+    """
+    squared = (numpy.einsum('ij,ij->i', points_a, points_a)[:, None] +
+               numpy.einsum('ij,ij->i', points_b, points_b)[None, :] -
+               2.0 * numpy.matmul(points_a, points_b.T))
+    return numpy.sqrt(numpy.maximum(squared, 0.0))
+
+
+def angle_distances(points_a, points_b):
+    """
+    the angles between every pair of points, taken as vectors from the origin.
+    :param points_a: <numpy.ndarray> (A, I) points.
+    :param points_b: <numpy.ndarray> (B, I) points.
+    :return: <numpy.ndarray> (A, B) angles in radians.
+    """
+    lengths_a = numpy.linalg.norm(points_a, axis=1)
+    lengths_b = numpy.linalg.norm(points_b, axis=1)
+    points_a = points_a / numpy.where(lengths_a > EPSILON, lengths_a, 1.0)[:, None]
+    points_b = points_b / numpy.where(lengths_b > EPSILON, lengths_b, 1.0)[:, None]
+    return numpy.arccos(numpy.clip(numpy.matmul(points_a, points_b.T), -1.0, 1.0))
+
+
+def get_distances(points_a, points_b, distance_type='euclidean'):
+    """
+    the distances between every pair of points.
+    :param points_a: <numpy.ndarray> (A, I) points.
+    :param points_b: <numpy.ndarray> (B, I) points.
+    :param distance_type: <str> euclidean or angle.
+    :return: <numpy.ndarray> (A, B) distances.
+    """
+    if distance_type == 'euclidean':
+        return pairwise_distances(points_a, points_b)
+    if distance_type == 'angle':
+        return angle_distances(points_a, points_b)
+    raise ValueError("[GetDistances] :: Unsupported distance type: {}, use one of {}".format(
+        distance_type, DISTANCE_TYPES))
+
+
+def get_driver_options(driver_data):
+    """
+    the RBFSolver options of the kernel, radius and distance type settings captured from the weightDriver.
+    :param driver_data: <dict> one driver entry of rbf_utils.get_weight_driver_data.
+    :return: <dict> RBFSolver keyword arguments.
+    """
+    settings = driver_data.get("settings", {})
+    options = {}
+    if "kernel" in settings:
+        options["kernel"] = DRIVER_KERNELS[int(settings["kernel"])]
+    if settings.get("radius", 0.0) > EPSILON:
+        options["radius"] = float(settings["radius"])
+    if "distanceType" in settings:
+        options["distance_type"] = DRIVER_DISTANCE_TYPES[int(settings["distanceType"])]
+    return options
+
+
+def apply_kernel(distances, kernel='gaussian', radius=1.0):
+    """
+    the radial basis function of the distances.
+    :param distances: <numpy.ndarray> distances.
+    :param kernel: <str> linear, gaussian, thin_plate, multi_quadratic or inverse_multi_quadratic.
+    :param radius: <float> the kernel width.
+    :return: <numpy.ndarray> kernel values.
+    """
+    r = distances / max(radius, EPSILON)
+    if kernel == 'linear':
+        return r
+    if kernel == 'gaussian':
+        return numpy.exp(-r * r)
+    if kernel == 'thin_plate':
+        return numpy.where(r > EPSILON, r * r * numpy.log(numpy.maximum(r, EPSILON)), 0.0)
+    if kernel == 'multi_quadratic':
+        return numpy.sqrt(1.0 + r * r)
+    if kernel == 'inverse_multi_quadratic':
+        return 1.0 / numpy.sqrt(1.0 + r * r)
+    raise ValueError("[ApplyKernel] :: Unsupported kernel: {}, use one of {}".format(kernel, KERNELS))
+
+
+class RBFSolver(object):
+    """
+    solves the pose weights once and evaluates sample poses in batches.
+    Usage:
+        solver = RBFSolver(pose_inputs, pose_values, kernel='gaussian')
+        values = solver.evaluate(samples)
+    """
+
+    def __init__(self, pose_inputs=(), pose_values=(), kernel='gaussian', radius=None, regularization=1e-8,
+                 clamp=False, distance_type='euclidean'):
+        """
+        :param pose_inputs: <list> (P, I) pose input values.
+        :param pose_values: <list> (P, O) pose output values.
+        :param kernel: <str> linear, gaussian, thin_plate, multi_quadratic or inverse_multi_quadratic.
+        :param radius: <float> the kernel width, the mean distance between the poses when not given.
+        :param regularization: <float> added to the kernel diagonal, smooths the fit and keeps it solvable.
+        :param clamp: <bool> clamp the evaluated values between 0.0 and 1.0.
+        :param distance_type: <str> euclidean, or angle for the angles between the pose vectors.
+        """
+        _require_numpy()
+        self.pose_inputs = numpy.asarray(pose_inputs, dtype=float)
+        self.pose_values = numpy.asarray(pose_values, dtype=float)
+        self.pose_inputs = self.pose_inputs.reshape(len(self.pose_inputs), -1)
+        self.pose_values = self.pose_values.reshape(len(self.pose_values), -1)
+        self.kernel = kernel
+        self.regularization = regularization
+        self.clamp = clamp
+        self.distance_type = distance_type
+        distances = get_distances(self.pose_inputs, self.pose_inputs, distance_type)
+        if radius is None:
+            count = len(distances)
+            radius = distances.sum() / (count * (count - 1)) if count > 1 else 1.0
+        self.radius = radius if radius > EPSILON else 1.0
+        self.weights = self.solve(distances)
+
+    def solve(self, distances):
+        """
+        solves the kernel system for the pose weights.
+        :param distances: <numpy.ndarray> (P, P) pose distances.
+        :return: <numpy.ndarray> (P, O) weights.
+        """
+        matrix = apply_kernel(distances, self.kernel, self.radius)
+        matrix = matrix + numpy.eye(len(matrix)) * self.regularization
+        try:
+            return numpy.linalg.solve(matrix, self.pose_values)
+        except numpy.linalg.LinAlgError:
+            # duplicate poses make the system singular, fall back to the least squares weights
+            return numpy.linalg.lstsq(matrix, self.pose_values, rcond=None)[0]
+
+    def evaluate(self, samples):
+        """
+        evaluates the output values of the sample poses.
+        :param samples: <list> (S, I) sample input values.
+        :return: <numpy.ndarray> (S, O) output values.
+        """
+        samples = numpy.asarray(samples, dtype=float).reshape(-1, self.pose_inputs.shape[1])
+        distances = get_distances(samples, self.pose_inputs, self.distance_type)
+        values = numpy.matmul(apply_kernel(distances, self.kernel, self.radius), self.weights)
+        if self.clamp:
+            values = numpy.clip(values, 0.0, 1.0)
+        return values
+
+    def validate(self):
+        """
+        the largest difference between the pose values and the evaluated poses.
+        :return: <float> maximum error.
+        """
+        return float(numpy.abs(self.evaluate(self.pose_inputs) - self.pose_values).max())
+
+
+def _data_key(driver_name, inputs, values, options):
+    """
+    the cache key of the driver, changes when its poses or options change.
+    """
+    digest = hashlib.md5(inputs.tobytes() + values.tobytes() + repr(sorted(options.items())).encode('utf-8'))
+    return driver_name, digest.hexdigest()
+
+
+def get_solver(driver_name="", driver_data=None, **options):
+    """
+    the cached solver of the driver, solved again only when the pose data or options change.
+    :param driver_name: <str> the weightDriver name.
+    :param driver_data: <dict> one driver entry of rbf_utils.get_weight_driver_data.
+    :param options: <dict> RBFSolver keyword arguments, override the settings captured from the weightDriver.
+    :return: <RBFSolver>
+    """
+    if driver_data.get("type", RBF_TYPE) != RBF_TYPE:
+        raise ValueError("[GetSolver] :: {} is not an RBF weightDriver.".format(driver_name))
+    driver_options = get_driver_options(driver_data)
+    driver_options.update(options)
+    options = driver_options
+    inputs, values, _ = get_pose_arrays(driver_data)
+    key = _data_key(driver_name, inputs, values, options)
+    if key not in _SOLVER_CACHE:
+        # drop the stale solver of this driver
+        for stale_key in [k for k in _SOLVER_CACHE if k[0] == driver_name]:
+            del _SOLVER_CACHE[stale_key]
+        _SOLVER_CACHE[key] = RBFSolver(inputs, values, **options)
+    return _SOLVER_CACHE[key]
+
+
+def clear_cache():
+    """
+    removes every cached solver.
+    """
+    _SOLVER_CACHE.clear()
+
+
+def evaluate_drivers(driver_data=None, samples=None, **options):
+    """
+    evaluates the sample poses of every RBF driver.
+    :param driver_data: <dict> rbf_utils.get_weight_driver_data output.
+    :param samples: <dict> driver names with their (S, I) sample input values, for example one row per frame.
+    :param options: <dict> RBFSolver keyword arguments, override the settings captured from each weightDriver.
+    :return: <dict> driver names with their (S, O) output values.
+    """
+    results = {}
+    for driver_name, driver_samples in samples.items():
+        if driver_data[driver_name].get("type", RBF_TYPE) != RBF_TYPE:
+            continue
+        results[driver_name] = get_solver(driver_name, driver_data[driver_name], **options).evaluate(driver_samples)
+    return results
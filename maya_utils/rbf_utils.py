@@ -1,10 +1,27 @@
+# import standard modules
+import json
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# import maya modules
+from maya import OpenMaya
 from maya import cmds
 
+# import local modules
+from . import object_utils
+from . import rbf_solver
+
 
 # local variables
 _suffix_name = "_rbf"
 _left_name = "_lf_"
 _right_name = "_rt_"
+_rotation_mirror_axes = -1.0, -1.0, 1.0,
+_setting_attrs = "kernel", "radius", "distanceType",
 
 
 # load the necessary plugins
@@ -18,149 +35,324 @@ def get_weight_drivers():
     return cmds.ls(type='weightDriver')
 
 
-def get_weight_driver_data():
+def _get_indices(m_plug):
+    """
+    the existing logical indices of the array plug.
+    :param m_plug: <OpenMaya.MPlug> array plug.
+    :return: <list> logical indices.
+    """
+    indices = OpenMaya.MIntArray()
+    m_plug.getExistingArrayAttributeIndices(indices)
+    return [indices[i] for i in range(indices.length())]
+
+
+def _get_plug_name(m_plug):
+    """
+    the node.attribute name of the plug, the same as listConnections plugs names.
+    :param m_plug: <OpenMaya.MPlug> plug.
+    :return: <str> plug name.
+    """
+    return m_plug.partialName(True, False, False, False, False, True)
+
+
+def _get_connected_plug(m_plug, source=True):
+    """
+    the first plug connected to the plug, passing through unit conversion nodes.
+    :param m_plug: <OpenMaya.MPlug> plug.
+    :param source: <bool> find the incoming connection, otherwise the outgoing connection.
+    :return: <OpenMaya.MPlug>, <NoneType> the connected plug.
+    """
+    m_plug_array = OpenMaya.MPlugArray()
+    m_plug.connectedTo(m_plug_array, source, not source)
+    if not m_plug_array.length():
+        return None
+    connected_plug = m_plug_array[0]
+    if connected_plug.node().hasFn(OpenMaya.MFn.kUnitConversion):
+        conversion_fn = OpenMaya.MFnDependencyNode(connected_plug.node())
+        return _get_connected_plug(conversion_fn.findPlug('input' if source else 'output', False), source)
+    return connected_plug
+
+
+def _get_array_values(m_plug):
+    """
+    the values of the numeric array plug.
+    :param m_plug: <OpenMaya.MPlug> array plug.
+    :return: <tuple> values, in logical index order.
+    """
+    return tuple(m_plug.elementByLogicalIndex(i).asDouble() for i in _get_indices(m_plug))
+
+
+def _get_settings(driver_fn):
+    """
+    the solver settings of the weightDriver, the kernel, radius and distance type.
+    :param driver_fn: <OpenMaya.MFnDependencyNode> weightDriver function set.
+    :return: <dict> setting attribute values.
+    """
+    settings = {}
+    for attr in _setting_attrs:
+        if not driver_fn.hasAttribute(attr):
+            continue
+        m_plug = driver_fn.findPlug(attr, False)
+        settings[attr] = m_plug.asDouble() if attr == "radius" else m_plug.asInt()
+    return settings
+
+
+def get_weight_driver_data(drivers=None):
+    """
+    captures the weightDriver connections and poses, reading each driver's plug arrays in one pass.
+    :param drivers: <list> weightDriver node names, every weightDriver in the scene when not given.
+    :return: <dict> driver data.
+    """
     driver_data = {}
-    drivers = get_weight_drivers()
+    if drivers is None:
+        drivers = get_weight_drivers()
     for driver in drivers:
-        num_poses = cmds.getAttr(driver + '.poses', mi=1)
+        driver_fn = OpenMaya.MFnDependencyNode(object_utils.get_m_obj(driver))
+        poses_plug = driver_fn.findPlug('poses', False)
+        num_poses = _get_indices(poses_plug)
         if not len(num_poses) > 1:
             continue
-        num_inputs = cmds.getAttr(driver + '.input', mi=1)
-        num_outputs = cmds.getAttr(driver + '.output', mi=1)
+        input_plug = driver_fn.findPlug('input', False)
+        output_plug = driver_fn.findPlug('output', False)
+        num_inputs = _get_indices(input_plug)
+        num_outputs = _get_indices(output_plug)
+
+        # get drivers and drivens
+        driver_plugs = [_get_connected_plug(input_plug.elementByLogicalIndex(i), source=True) for i in num_inputs]
+        driven_plugs = [_get_connected_plug(output_plug.elementByLogicalIndex(i), source=False) for i in num_outputs]
+        driver_plugs = [m_plug for m_plug in driver_plugs if m_plug is not None]
+        driven_plugs = [m_plug for m_plug in driven_plugs if m_plug is not None]
+
         driver_data[driver] = {}
         # 0 = vectorAngle; 1 = RBF;
-        driver_data[driver]["type"] = cmds.getAttr(driver + '.type')
+        driver_data[driver]["type"] = driver_fn.findPlug('type', False).asInt()
+        driver_data[driver]["settings"] = _get_settings(driver_fn)
         driver_data[driver]["num_poses"] = num_poses
         driver_data[driver]["num_inputs"] = num_inputs
         driver_data[driver]["pose_inputs"] = {}
         driver_data[driver]["pose_values"] = {}
-        driver_data[driver]["driver_node"] = cmds.listConnections(driver + '.input[0]', s=1, d=0,
-                                                                  skipConversionNodes=True)[0]
-        driver_data[driver]["driven_node"] = cmds.listConnections(driver + '.output[0]', s=0, d=1)[0]
-        driver_data[driver]["driver_attrs"] = ()
-        driver_data[driver]["driven_attrs"] = ()
-
-        # get drivers
-        for input_idx in num_inputs:
-            driver_data[driver]["driver_attrs"] += cmds.listConnections(driver + '.input[{}]'.format(input_idx),
-                                                                        s=1, d=0, skipConversionNodes=True, plugs=True)[0],
-
-        # get drivens
-        for output_idx in num_outputs:
-            driver_data[driver]["driven_attrs"] += cmds.listConnections(driver + '.output[{}]'.format(output_idx),
-                                                                        s=0, d=1, plugs=True)[0],
+        driver_data[driver]["driver_attrs"] = tuple(_get_plug_name(m_plug) for m_plug in driver_plugs)
+        driver_data[driver]["driven_attrs"] = tuple(_get_plug_name(m_plug) for m_plug in driven_plugs)
+        driver_data[driver]["driver_node"] = driver_data[driver]["driver_attrs"][0].split('.')[0]
+        driver_data[driver]["driven_node"] = driver_data[driver]["driven_attrs"][0].split('.')[0]
 
         # get poses data
+        pose_input_attr = driver_fn.attribute('poseInput')
+        pose_value_attr = driver_fn.attribute('poseValue')
         for num_pose in num_poses:
-            pose_inputs = cmds.getAttr(driver + '.poses[{}].poseInput'.format(num_pose), mi=1)
-            pose_values = cmds.getAttr(driver + '.poses[{}].poseValue'.format(num_pose), mi=1)
-
+            pose_plug = poses_plug.elementByLogicalIndex(num_pose)
+            pose_inputs = _get_array_values(pose_plug.child(pose_input_attr))
+            pose_values = _get_array_values(pose_plug.child(pose_value_attr))
             if not pose_inputs or not pose_values:
                 continue
+            driver_data[driver]["pose_inputs"][num_pose] = pose_inputs
+            driver_data[driver]["pose_values"][num_pose] = pose_values
+    return driver_data
+
 
-            driver_data[driver]["pose_inputs"][num_pose] = ()
-            driver_data[driver]["pose_values"][num_pose] = ()
+def serialize_driver_data(driver_data={}):
+    """
+    the compact form of the driver data, with the poses stored as one row per pose.
+    :param driver_data: <dict> driver data.
+    :return: <dict> json ready driver data.
+    """
+    serialized_data = {}
+    for driver in driver_data:
+        inputs, values, indices = rbf_solver.get_pose_arrays(driver_data[driver])
+        serialized_data[driver] = {
+            "type": driver_data[driver]["type"],
+            "settings": dict(driver_data[driver].get("settings", {})),
+            "driver_attrs": list(driver_data[driver]["driver_attrs"]),
+            "driven_attrs": list(driver_data[driver]["driven_attrs"]),
+            "poses": indices,
+            "pose_inputs": inputs.tolist(),
+            "pose_values": values.tolist(),
+        }
+    return serialized_data
 
-            pose_input_attr = driver + '.poses[{}].poseInput'.format(num_pose)
-            pose_value_attr = driver + '.poses[{}].poseValue'.format(num_pose)
-            for input_idx in pose_inputs:
-                input_idx = int(input_idx)
-                driver_data[driver]["pose_inputs"][num_pose] += cmds.getAttr(pose_input_attr + '[{}]'.format(
-                    int(input_idx))),
 
-            for input_idx in pose_values:
-                input_idx = int(input_idx)
-                driver_data[driver]["pose_values"][num_pose] += cmds.getAttr(pose_value_attr + '[{}]'.format(
-                    int(input_idx))),
+def deserialize_driver_data(serialized_data={}):
+    """
+    the driver data from its compact form.
+    :param serialized_data: <dict> serialize_driver_data output.
+    :return: <dict> driver data.
+    """
+    driver_data = {}
+    for driver in serialized_data:
+        data = serialized_data[driver]
+        poses = [int(idx) for idx in data["poses"]]
+        driver_data[driver] = {
+            "type": data["type"],
+            "settings": dict(data.get("settings", {})),
+            "driver_attrs": tuple(data["driver_attrs"]),
+            "driven_attrs": tuple(data["driven_attrs"]),
+            "driver_node": data["driver_attrs"][0].split('.')[0],
+            "driven_node": data["driven_attrs"][0].split('.')[0],
+            "num_poses": poses,
+            "num_inputs": list(range(len(data["driver_attrs"]))),
+            "pose_inputs": dict(zip(poses, map(tuple, data["pose_inputs"]))),
+            "pose_values": dict(zip(poses, map(tuple, data["pose_values"]))),
+        }
     return driver_data
 
 
-def mirror_data(driver_data={}, mirror_rotations=True):
+def write_driver_data(file_name="", driver_data={}):
+    """
+    writes the driver data to a json file in its compact form.
+    :param file_name: <str> json file name.
+    :param driver_data: <dict> driver data.
+    :return: <str> file name.
+    """
+    with open(file_name, 'w') as f:
+        json.dump(serialize_driver_data(driver_data), f, separators=(',', ':'))
+    return file_name
+
+
+def read_driver_data(file_name=""):
+    """
+    reads the driver data written by write_driver_data.
+    :param file_name: <str> json file name.
+    :return: <dict> driver data.
+    """
+    with open(file_name, 'r') as f:
+        return deserialize_driver_data(json.load(f))
+
+
+def _get_rbf_node_name(driver_attrs):
+    """
+    the weightDriver name built from its first driver attribute.
+    """
+    driven_name = driver_attrs[0].split('.')[0]
+    if _suffix_name not in driven_name:
+        return driven_name + _suffix_name
+    return driven_name
+
+
+def mirror_data(driver_data={}, mirror_rotations=True, mirror_axes=_rotation_mirror_axes):
     """
     Adds additional data for mirroring the information.
     :param driver_data: <dict> driver data from the left side.
     :param mirror_rotations: <bool> adds mirroring information.
+    :param mirror_axes: <tuple> the sign flips of the xyz pose inputs, repeated over every input.
     :return: <dict> driver data with right side information.
     :note:
         Currently supports mirroring the rotational data from left to right.
     """
-    if mirror_rotations:
-        mirror_axes = -1.0, -1.0, 1.0,
     right_driver_data = {}
     for driver in driver_data:
-        driven_name = driver_data[driver]["driver_attrs"][0].split('.')[0]
-        if _suffix_name not in driven_name:
-            rbf_node_name = driven_name + _suffix_name
-        else:
-            rbf_node_name = driven_name
+        rbf_node_name = _get_rbf_node_name(driver_data[driver]["driver_attrs"])
         if _left_name in driver:
             rbf_node_name = rbf_node_name.replace(_left_name, _right_name)
         if cmds.ls(rbf_node_name):
             continue
 
-        right_driver_data[rbf_node_name] = {}
-        right_driver_data[rbf_node_name]["type"] = driver_data[driver]["type"]
-        driver_attrs = driver_data[driver]["driver_attrs"]
-        right_driver_data[rbf_node_name]["driver_attrs"] = map(lambda x: x.replace(
-            _left_name, _right_name), driver_attrs)
-
-        driven_attrs = driver_data[driver]["driven_attrs"]
-        right_driver_data[rbf_node_name]["driven_attrs"] = map(lambda x: x.replace(
-            _left_name, _right_name), driven_attrs)
-
-        right_driver_data[rbf_node_name]["num_poses"] = driver_data[driver]["num_poses"]
-        right_driver_data[rbf_node_name]["pose_inputs"] = {}
-        for idx in driver_data[driver]["num_poses"]:
-            # mirror the pose inputs
-            inputs = driver_data[driver]["pose_inputs"][idx]
-            right_driver_data[rbf_node_name]["pose_inputs"][idx] = map(lambda x, a: x*a, inputs, mirror_axes)
-
-        # edit the pose values
-        right_driver_data[rbf_node_name]["pose_values"] = driver_data[driver]["pose_values"]
+        # mirror the pose inputs of every pose at once
+        inputs, values, indices = rbf_solver.get_pose_arrays(driver_data[driver])
+        if mirror_rotations:
+            inputs = inputs * numpy.resize(numpy.asarray(mirror_axes, dtype=float), inputs.shape[1])
+
+        driver_attrs = [x.replace(_left_name, _right_name) for x in driver_data[driver]["driver_attrs"]]
+        driven_attrs = [x.replace(_left_name, _right_name) for x in driver_data[driver]["driven_attrs"]]
+        right_driver_data[rbf_node_name] = {
+            "type": driver_data[driver]["type"],
+            "settings": dict(driver_data[driver].get("settings", {})),
+            "driver_attrs": tuple(driver_attrs),
+            "driven_attrs": tuple(driven_attrs),
+            "num_poses": indices,
+            "pose_inputs": dict(zip(indices, map(tuple, inputs.tolist()))),
+            # the pose values are the same on both sides
+            "pose_values": dict(zip(indices, map(tuple, values.tolist()))),
+        }
     return right_driver_data
 
 
 def setup_weight_drivers(driver_data={}):
     """
-    Installs the drivers based on the data input
-    :param driver_data:
-    :return:
+    Installs the drivers based on the data input, in one undoable batch.
+    :param driver_data: <dict> driver data.
+    :return: <tuple> weightDriver transform names.
     """
     # load the necessary plugins
     load_plugins()
 
     driver_nodes = ()
-    for driver in driver_data:
-        driven_name = driver_data[driver]["driver_attrs"][0].split('.')[0]
-        if _suffix_name not in driven_name:
-            rbf_node_name = driven_name + _suffix_name
-        else:
-            rbf_node_name = driven_name
-        print(rbf_node_name)
-        if cmds.ls(rbf_node_name):
-            continue
-        weight_driver_node = cmds.createNode('weightDriver')
+    cmds.undoInfo(openChunk=True, chunkName='setupWeightDrivers')
+    try:
+        for driver in driver_data:
+            rbf_node_name = _get_rbf_node_name(driver_data[driver]["driver_attrs"])
+            if cmds.ls(rbf_node_name):
+                continue
+            weight_driver_node = cmds.createNode('weightDriver')
 
-        cmds.setAttr(weight_driver_node + '.type', driver_data[driver]["type"])
+            cmds.setAttr(weight_driver_node + '.type', driver_data[driver]["type"])
+            for attr, value in driver_data[driver].get("settings", {}).items():
+                if cmds.attributeQuery(attr, node=weight_driver_node, exists=True):
+                    cmds.setAttr(weight_driver_node + '.' + attr, value)
 
-        for idx, driver_attr in enumerate(driver_data[driver]["driver_attrs"]):
-            cmds.connectAttr(driver_attr, weight_driver_node + '.input[{}]'.format(idx))
+            for idx, driver_attr in enumerate(driver_data[driver]["driver_attrs"]):
+                cmds.connectAttr(driver_attr, weight_driver_node + '.input[{}]'.format(idx))
 
-        for idx, driven_attr in enumerate(driver_data[driver]["driven_attrs"]):
-            cmds.connectAttr(weight_driver_node + '.output[{}]'.format(idx), driven_attr)
+            for idx, driven_attr in enumerate(driver_data[driver]["driven_attrs"]):
+                cmds.connectAttr(weight_driver_node + '.output[{}]'.format(idx), driven_attr)
 
-        for idx in driver_data[driver]["num_poses"]:
-            # edit the pose inputs
-            inputs = driver_data[driver]["pose_inputs"][idx]
-            for input_idx, input_value in enumerate(inputs):
-                cmds.setAttr(weight_driver_node + '.poses[{}].poseInput[{}]'.format(idx, input_idx), input_value)
+            # set each pose array with one call
+            for idx in driver_data[driver]["num_poses"]:
+                inputs = driver_data[driver]["pose_inputs"][idx]
+                cmds.setAttr(weight_driver_node + '.poses[{}].poseInput[0:{}]'.format(idx, len(inputs) - 1), *inputs)
 
-            # edit the pose values
-            pose_values = driver_data[driver]["pose_values"][idx]
-            for pose_value_idx, pose_value in enumerate(pose_values):
-                cmds.setAttr(weight_driver_node + '.poses[{}].poseValue[{}]'.format(idx, pose_value_idx), pose_value)
-        driver_nodes += cmds.rename(cmds.listRelatives(weight_driver_node, p=1)[0], rbf_node_name),
+                pose_values = driver_data[driver]["pose_values"][idx]
+                cmds.setAttr(weight_driver_node + '.poses[{}].poseValue[0:{}]'.format(idx, len(pose_values) - 1),
+                             *pose_values)
+            driver_nodes += cmds.rename(cmds.listRelatives(weight_driver_node, p=1)[0], rbf_node_name),
+    finally:
+        cmds.undoInfo(closeChunk=True)
     return driver_nodes
 
+
+def mirror_weight_drivers(drivers=None, mirror_rotations=True, mirror_axes=_rotation_mirror_axes):
+    """
+    captures the left side drivers and builds their mirrored right side drivers.
+    :param drivers: <list> weightDriver node names, every weightDriver in the scene when not given.
+    :param mirror_rotations: <bool> flip the signs of the pose inputs.
+    :param mirror_axes: <tuple> the sign flips of the xyz pose inputs.
+    :return: <tuple> the created weightDriver transform names.
+    """
+    driver_data = get_weight_driver_data(drivers)
+    left_data = dict((k, v) for k, v in driver_data.items() if _left_name in v["driver_attrs"][0])
+    return setup_weight_drivers(mirror_data(left_data, mirror_rotations, mirror_axes))
+
+
+def evaluate_weight_drivers(samples=None, driver_data=None, **options):
+    """
+    evaluates the sample poses of the RBF drivers offline, with each driver solved once and cached.
+    :param samples: <dict> driver names with their (S, I) sample input values, for example one row per frame.
+    :param driver_data: <dict> captured driver data, read from the scene when not given.
+    :param options: <dict> rbf_solver.RBFSolver keyword arguments, override the kernel, radius and distance type
+        captured from each weightDriver.
+    :return: <dict> driver names with their (S, O) output values.
+    """
+    if driver_data is None:
+        driver_data = get_weight_driver_data()
+    return rbf_solver.evaluate_drivers(driver_data, samples, **options)
+
+
+def compare_weight_driver(driver="", driver_data=None, **options):
+    """
+    compares the offline solver with the weightDriver output at the current driver input values.
+    :param driver: <str> weightDriver node name.
+    :param driver_data: <dict> captured driver data, read from the scene when not given.
+    :param options: <dict> rbf_solver.RBFSolver keyword arguments.
+    :return: <tuple> the solver output values, the weightDriver output values and their largest difference.
+    """
+    if driver_data is None:
+        driver_data = get_weight_driver_data([driver])
+    driver_fn = OpenMaya.MFnDependencyNode(object_utils.get_m_obj(driver))
+    inputs = _get_array_values(driver_fn.findPlug('input', False))
+    solver = rbf_solver.get_solver(driver, driver_data[driver], **options)
+    solver_values = solver.evaluate([inputs])[0]
+    output_plug = driver_fn.findPlug('output', False)
+    scene_values = numpy.array([output_plug.elementByLogicalIndex(i).asDouble() for i in range(len(solver_values))])
+    return solver_values, scene_values, float(numpy.abs(solver_values - scene_values).max())
+
 # ______________________________________________________________________________________________________________________
 # rbf_utils.py
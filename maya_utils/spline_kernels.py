@@ -0,0 +1,286 @@
+"""
+Batched spline evaluation over arrays of parameters.
+Quadratic and cubic Bezier, Catmull-Rom and uniform or non-uniform B-splines are evaluated for
+every parameter at once, and arc-length tables turn evenly spaced distances into curve parameters
+so points placed along a curve are evenly distributed.
+Parameters run from 0.0 to 1.0 over the whole curve for every spline type.
+This module does not import Maya, anything with x, y, z attributes such as MVector is accepted as a point.
+"""
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+ARC_LENGTH_SAMPLES = 256
+SPLINE_TYPES = ('quadratic', 'bezier', 'catmull_rom', 'bspline')
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("[SplineKernels] :: numpy is required for the spline evaluation.")
+
+
+def as_points(points):
+    """
+    converts the points into an (N, D) array.
+    :param points: <list> xyz points, or objects with x, y, z attributes.
+    :return: <numpy.ndarray> (N, D) points.
+    """
+    _require_numpy()
+    points = [(p.x, p.y, p.z) if hasattr(p, 'x') else p for p in points]
+    points = numpy.asarray(points, dtype=float)
+    return points.reshape(len(points), -1)
+
+
+def as_parameters(parameters, clamp=True):
+    """
+    converts the parameters into a (T,) array.
+    :param parameters: <float>, <list> parameters from 0.0 to 1.0.
+    :param clamp: <bool> clamp the parameters to 0.0 and 1.0.
+    :return: <numpy.ndarray> (T,) parameters.
+    """
+    _require_numpy()
+    parameters = numpy.asarray(parameters, dtype=float).reshape(-1)
+    if clamp:
+        return numpy.clip(parameters, 0.0, 1.0)
+    return parameters
+
+
+def uniform_parameters(count, end_point=True):
+    """
+    evenly spaced parameters.
+    :param count: <int> the number of parameters.
+    :param end_point: <bool> include the 1.0 parameter.
+    :return: <numpy.ndarray> (T,) parameters.
+    """
+    _require_numpy()
+    return numpy.linspace(0.0, 1.0, count, endpoint=end_point)
+
+
+def bernstein_basis(degree, parameters):
+    """
+    the Bernstein basis weights of each parameter.
+    Parameters outside 0.0 to 1.0 are not clamped, they extrapolate the segment.
+    :param degree: <int> the Bezier degree.
+    :param parameters: <list> (T,) parameters.
+    :return: <numpy.ndarray> (T, degree + 1) weights.
+    """
+    t = as_parameters(parameters, clamp=False)[:, None]
+    index = numpy.arange(degree + 1)[None, :]
+    coefficients = numpy.array([_binomial(degree, i) for i in range(degree + 1)], dtype=float)[None, :]
+    return coefficients * t ** index * (1.0 - t) ** (degree - index)
+
+
+def _binomial(n, k):
+    result = 1
+    for i in range(1, k + 1):
+        result = result * (n - i + 1) // i
+    return result
+
+
+def evaluate_bezier(control_points, parameters):
+    """
+    the points of a single Bezier segment, of the degree given by the control points.
+    :param control_points: <list> 3 points for a quadratic, 4 for a cubic.
+    :param parameters: <list> (T,) parameters.
+    :return: <numpy.ndarray> (T, D) points.
+    """
+    control_points = as_points(control_points)
+    return numpy.matmul(bernstein_basis(len(control_points) - 1, parameters), control_points)
+
+
+def bezier_tangents(control_points, parameters):
+    """
+    the derivatives of a single Bezier segment.
+    :param control_points: <list> 3 points for a quadratic, 4 for a cubic.
+    :param parameters: <list> (T,) parameters.
+    :return: <numpy.ndarray> (T, D) derivative vectors.
+    """
+    control_points = as_points(control_points)
+    degree = len(control_points) - 1
+    return evaluate_bezier(degree * numpy.diff(control_points, axis=0), parameters)
+
+
+def _segment_parameters(parameters, segments):
+    """
+    splits the global parameters into segment indices and local parameters.
+    """
+    scaled = as_parameters(parameters) * segments
+    indices = numpy.minimum(numpy.floor(scaled).astype(int), segments - 1)
+    return indices, scaled - indices
+
+
+def evaluate_catmull_rom(points, parameters, alpha=0.5, closed=False):
+    """
+    the points of a Catmull-Rom spline passing through every point.
+    :param points: <list> (N, D) points to pass through, at least two.
+    :param parameters: <list> (T,) parameters.
+    :param alpha: <float> 0.0 uniform, 0.5 centripetal, 1.0 chordal knot spacing.
+    :param closed: <bool> the spline loops back to the first point.
+    :return: <numpy.ndarray> (T, D) points.
+    """
+    points = as_points(points)
+    if closed:
+        padded = numpy.concatenate((points[-1:], points, points[:2]))
+        segments = len(points)
+    else:
+        # phantom end points continue the first and last segments
+        padded = numpy.concatenate((2.0 * points[:1] - points[1:2], points, 2.0 * points[-1:] - points[-2:-1]))
+        segments = len(points) - 1
+    indices, u = _segment_parameters(parameters, segments)
+    p0, p1, p2, p3 = (padded[indices + i] for i in range(4))
+
+    # Barry and Goldman's pyramid with the knot spacing of each span
+    def knot(a, b):
+        return numpy.maximum(numpy.linalg.norm(b - a, axis=1) ** alpha, EPSILON)[:, None]
+
+    t0 = numpy.zeros((len(u), 1))
+    t1 = t0 + knot(p0, p1)
+    t2 = t1 + knot(p1, p2)
+    t3 = t2 + knot(p2, p3)
+    t = t1 + (t2 - t1) * u[:, None]
+    a1 = (t1 - t) / (t1 - t0) * p0 + (t - t0) / (t1 - t0) * p1
+    a2 = (t2 - t) / (t2 - t1) * p1 + (t - t1) / (t2 - t1) * p2
+    a3 = (t3 - t) / (t3 - t2) * p2 + (t - t2) / (t3 - t2) * p3
+    b1 = (t2 - t) / (t2 - t0) * a1 + (t - t0) / (t2 - t0) * a2
+    b2 = (t3 - t) / (t3 - t1) * a2 + (t - t1) / (t3 - t1) * a3
+    return (t2 - t) / (t2 - t1) * b1 + (t - t1) / (t2 - t1) * b2
+
+
+def uniform_knots(count, degree=3, clamped=True):
+    """
+    a uniform knot vector for the number of control points.
+    :param count: <int> the number of control points, more than the degree.
+    :param degree: <int> the spline degree.
+    :param clamped: <bool> repeat the end knots so the spline starts and ends at the end points.
+    :return: <numpy.ndarray> (count + degree + 1,) knots.
+    """
+    _require_numpy()
+    if count <= degree:
+        raise ValueError("[UniformKnots] :: A degree {} spline needs at least {} control points.".format(
+            degree, degree + 1))
+    if clamped:
+        inner = numpy.linspace(0.0, 1.0, count - degree + 1)
+        return numpy.concatenate((numpy.zeros(degree), inner, numpy.ones(degree)))
+    return numpy.arange(count + degree + 1, dtype=float)
+
+
+def bspline_basis(knots, degree, parameters):
+    """
+    the Cox-de Boor basis weights of every control point for each knot parameter.
+    :param knots: <list> (count + degree + 1,) non-decreasing knots.
+    :param degree: <int> the spline degree.
+    :param parameters: <list> (T,) parameters in knot units.
+    :return: <numpy.ndarray> (T, count) weights.
+    """
+    knots = numpy.asarray(knots, dtype=float)
+    u = numpy.asarray(parameters, dtype=float).reshape(-1)
+    count = len(knots) - degree - 1
+    # the last parameter belongs to the last non-empty span
+    last_span = numpy.nonzero(knots[:-1] < knots[1:])[0][-1]
+    left, right = knots[:-1], knots[1:]
+    basis = ((u[:, None] >= left[None, :]) & (u[:, None] < right[None, :])).astype(float)
+    basis[u >= knots[last_span + 1], :] = 0.0
+    basis[u >= knots[last_span + 1], last_span] = 1.0
+    for p in range(1, degree + 1):
+        span_count = len(knots) - p - 1
+        lower = knots[p:p + span_count] - knots[:span_count]
+        upper = knots[p + 1:p + 1 + span_count] - knots[1:1 + span_count]
+        left_term = numpy.where(lower > 0.0, (u[:, None] - knots[None, :span_count]) / numpy.where(lower > 0.0, lower, 1.0), 0.0)
+        right_term = numpy.where(upper > 0.0,
+                                 (knots[None, p + 1:p + 1 + span_count] - u[:, None]) / numpy.where(upper > 0.0, upper, 1.0),
+                                 0.0)
+        basis = left_term * basis[:, :span_count] + right_term * basis[:, 1:span_count + 1]
+    return basis[:, :count]
+
+
+def knot_domain(knots, degree):
+    """
+    the parameter range of the knot vector.
+    :return: <tuple> start, end knot parameters.
+    """
+    knots = numpy.asarray(knots, dtype=float)
+    return knots[degree], knots[len(knots) - degree - 1]
+
+
+def evaluate_bspline(control_points, parameters, degree=3, knots=None):
+    """
+    the points of a B-spline.
+    :param control_points: <list> (N, D) control points, more than the degree.
+    :param parameters: <list> (T,) parameters from 0.0 to 1.0 over the knot domain.
+    :param degree: <int> the spline degree.
+    :param knots: <list> non-uniform knots, a clamped uniform knot vector when not given.
+    :return: <numpy.ndarray> (T, D) points.
+    """
+    control_points = as_points(control_points)
+    if knots is None:
+        knots = uniform_knots(len(control_points), degree)
+    elif len(knots) != len(control_points) + degree + 1:
+        raise ValueError("[EvaluateBspline] :: {} control points of degree {} need {} knots, got {}.".format(
+            len(control_points), degree, len(control_points) + degree + 1, len(knots)))
+    start, end = knot_domain(knots, degree)
+    u = start + as_parameters(parameters) * (end - start)
+    return numpy.matmul(bspline_basis(knots, degree, u), control_points)
+
+
+def evaluate(spline_type, points, parameters, **kwargs):
+    """
+    the points of the spline type.
+    :param spline_type: <str> quadratic, bezier, catmull_rom or bspline.
+    :param points: <list> (N, D) control points.
+    :param parameters: <list> (T,) parameters.
+    :param kwargs: <dict> the evaluator keyword arguments.
+    :return: <numpy.ndarray> (T, D) points.
+    """
+    if spline_type in ('quadratic', 'bezier'):
+        return evaluate_bezier(points, parameters)
+    if spline_type == 'catmull_rom':
+        return evaluate_catmull_rom(points, parameters, **kwargs)
+    if spline_type == 'bspline':
+        return evaluate_bspline(points, parameters, **kwargs)
+    raise ValueError("[Evaluate] :: Unsupported spline type: {}, use one of {}".format(spline_type, SPLINE_TYPES))
+
+
+def arc_length_table(spline_type, points, samples=ARC_LENGTH_SAMPLES, **kwargs):
+    """
+    the cumulative arc lengths of the spline at evenly spaced parameters.
+    :param spline_type: <str> quadratic, bezier, catmull_rom or bspline.
+    :param points: <list> (N, D) control points.
+    :param samples: <int> the number of chords measured.
+    :param kwargs: <dict> the evaluator keyword arguments.
+    :return: <tuple> (samples + 1,) parameters, (samples + 1,) cumulative lengths.
+    """
+    parameters = uniform_parameters(samples + 1)
+    positions = evaluate(spline_type, points, parameters, **kwargs)
+    chords = numpy.linalg.norm(numpy.diff(positions, axis=0), axis=1)
+    return parameters, numpy.concatenate(([0.0], numpy.cumsum(chords)))
+
+
+def arc_length_parameters(table, fractions):
+    """
+    the curve parameters at the fractions of the total arc length.
+    :param table: <tuple> parameters and lengths as returned by arc_length_table.
+    :param fractions: <list> (T,) fractions of the length from 0.0 to 1.0.
+    :return: <numpy.ndarray> (T,) parameters.
+    """
+    parameters, lengths = table
+    return numpy.interp(as_parameters(fractions) * lengths[-1], lengths, parameters)
+
+
+def evenly_spaced_points(spline_type, points, count, samples=ARC_LENGTH_SAMPLES, end_point=True, **kwargs):
+    """
+    points spaced at equal distances along the spline.
+    :param spline_type: <str> quadratic, bezier, catmull_rom or bspline.
+    :param points: <list> (N, D) control points.
+    :param count: <int> the number of points.
+    :param samples: <int> the arc-length table resolution.
+    :param end_point: <bool> include the end of the spline.
+    :param kwargs: <dict> the evaluator keyword arguments.
+    :return: <tuple> (T, D) points, (T,) parameters.
+    """
+    table = arc_length_table(spline_type, points, samples, **kwargs)
+    parameters = arc_length_parameters(table, uniform_parameters(count, end_point))
+    return evaluate(spline_type, points, parameters, **kwargs), parameters
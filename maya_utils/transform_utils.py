@@ -4,12 +4,19 @@ Transform module for finding, creating and setting attributes
 # import standard modules
 import math
 
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # import maya modules
 from maya import OpenMaya
 from maya import cmds
 
 # import local modules
 from . import object_utils
+from . import matrix_kernels
 
 
 def set_to_object_center(object_name, target_name):
@@ -73,6 +80,109 @@ def match_matrix_transform(source, target):
     return True
 
 
+def get_dag_matrices(objects=()):
+    """
+    reads the world and parent inverse matrices of the objects in one pass.
+    every name gets its own row, repeated names included.
+    :param objects: <list> transform object names.
+    :return: <tuple> (N, 4, 4) world matrices, (N, 4, 4) parent inverse matrices.
+    """
+    # a selection list merges repeated objects, so each unique name gets its own dag path
+    dag_paths = {}
+    for object_name in objects:
+        if object_name in dag_paths:
+            continue
+        m_sel = OpenMaya.MSelectionList()
+        m_sel.add(object_name)
+        m_dag = OpenMaya.MDagPath()
+        m_sel.getDagPath(0, m_dag)
+        dag_paths[object_name] = m_dag
+    world_matrices = []
+    parent_inverse_matrices = []
+    for object_name in objects:
+        m_dag = dag_paths[object_name]
+        world_matrix = m_dag.inclusiveMatrix()
+        parent_inverse = m_dag.exclusiveMatrixInverse()
+        world_matrices.append([world_matrix(r, c) for r in range(4) for c in range(4)])
+        parent_inverse_matrices.append([parent_inverse(r, c) for r in range(4) for c in range(4)])
+    return matrix_kernels.as_matrices(world_matrices), matrix_kernels.as_matrices(parent_inverse_matrices)
+
+
+def get_world_matrices(objects=()):
+    """
+    reads the world matrices of the objects in one pass.
+    :param objects: <list> transform object names.
+    :return: <numpy.ndarray> (N, 4, 4) world matrices.
+    """
+    return get_dag_matrices(objects)[0]
+
+
+def set_world_matrices(objects=(), matrices=(), reset_shear=True):
+    """
+    sets the world matrices of the objects in one undoable batch.
+    The local translate, rotate and scale values are solved for all objects at once against the new
+    parent matrices. Rotate axes and joint orients are taken out of the rotation, the inverse parent scale
+    of joints is taken out of the scale and the rotate and scale pivots, with their pivot translates,
+    are taken out of the translation, the same way xform places the transform.
+    :param objects: <list> transform object names.
+    :param matrices: <list> (N, 4, 4) world matrices.
+    :param reset_shear: <bool> sets the shear values to zero.
+    :return: <bool> True for success.
+    """
+    if not objects:
+        return False
+    matrices = matrix_kernels.as_matrices(matrices)
+    parent_inverse_matrices = get_dag_matrices(objects)[1]
+    # objects parented under other objects in the batch are solved against their new parent matrix
+    # one long name per object, cmds.ls would merge repeated names
+    long_names = [cmds.ls(object_name, long=True)[0] for object_name in objects]
+    for i, long_name in enumerate(long_names):
+        parent_name = long_name.rpartition('|')[0]
+        if parent_name in long_names:
+            parent_inverse_matrices[i] = matrix_kernels.inverse(matrices[long_names.index(parent_name)])[0]
+    local_matrices = matrix_kernels.multiply(matrices, parent_inverse_matrices)
+    is_joint = [cmds.objectType(object_name) == 'joint' for object_name in objects]
+    for i, object_name in enumerate(objects):
+        if is_joint[i] and cmds.getAttr(object_name + '.segmentScaleCompensate'):
+            # joints apply the inverse of their parent scale after the rotation
+            local_matrices[i, :3, :3] *= numpy.array(cmds.getAttr(object_name + '.inverseScale')[0])[None, :]
+    rotation_matrices, scales = matrix_kernels.split_rotation_scale(local_matrices)
+    translations = local_matrices[:, 3, :3].copy()
+    for i, object_name in enumerate(objects):
+        if is_joint[i]:
+            joint_orient = matrix_kernels.euler_to_rotation(cmds.getAttr(object_name + '.jointOrient')[0])
+            rotation_matrices[i] = numpy.matmul(rotation_matrices[i], joint_orient[0].T)
+        else:
+            # the local matrix is -sp * S * sp * spt * -rp * Ra * R * rp * rpt * T
+            rotate_pivot, rotate_pivot_translate, scale_pivot, scale_pivot_translate = (
+                numpy.array(cmds.getAttr(object_name + attr)[0]) for attr in (
+                    '.rotatePivot', '.rotatePivotTranslate', '.scalePivot', '.scalePivotTranslate'))
+            pivot_offset = scale_pivot - scale_pivot * scales[i] + scale_pivot_translate - rotate_pivot
+            translations[i] -= (numpy.matmul(pivot_offset, rotation_matrices[i]) +
+                                rotate_pivot + rotate_pivot_translate)
+        rotate_axis = matrix_kernels.euler_to_rotation(cmds.getAttr(object_name + '.rotateAxis')[0])
+        rotation_matrices[i] = numpy.matmul(rotate_axis[0].T, rotation_matrices[i])
+    # solve the euler rotations once per rotate order
+    rotate_orders = numpy.array([cmds.getAttr(o + '.rotateOrder') for o in objects])
+    rotations = numpy.zeros((len(objects), 3))
+    for rotate_order in set(rotate_orders.tolist()):
+        indices = rotate_orders == rotate_order
+        rotations[indices] = matrix_kernels.rotation_to_euler(rotation_matrices[indices], rotate_order)
+
+    cmds.undoInfo(openChunk=True, chunkName='setWorldMatrices')
+    try:
+        for object_name, translate, rotate, scale in zip(objects, translations.tolist(),
+                                                         rotations.tolist(), scales.tolist()):
+            cmds.setAttr(object_name + '.translate', *translate)
+            cmds.setAttr(object_name + '.rotate', *rotate)
+            cmds.setAttr(object_name + '.scale', *scale)
+            if reset_shear:
+                cmds.setAttr(object_name + '.shear', 0.0, 0.0, 0.0)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return True
+
+
 def get_plug_value(in_plug):
     """
     Gets the value of the given plug.
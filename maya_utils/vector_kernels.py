@@ -0,0 +1,296 @@
+"""
+Batched vector operations over (N, 3) arrays.
+Every function takes sequences of xyz vectors, or numpy (N, 3) arrays, and works on all of them at once.
+A single vector is broadcast against many. Numpy is used when it is available,
+otherwise the same operations run in pure Python and return lists of tuples.
+This module does not import Maya, anything with x, y, z attributes such as MVector is accepted as a vector.
+"""
+# import standard modules
+import math
+
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# define local variables
+EPSILON = 1e-12
+
+
+def _to_tuple(vector):
+    """
+    the xyz tuple of the vector.
+    :param vector: <list>, <tuple>, <MVector> vector.
+    :return: <tuple> x, y, z.
+    """
+    if hasattr(vector, 'x'):
+        return float(vector.x), float(vector.y), float(vector.z)
+    return float(vector[0]), float(vector[1]), float(vector[2])
+
+
+def _is_single(vectors):
+    """
+    checks if the input is a single vector rather than a sequence of vectors.
+    """
+    if hasattr(vectors, 'x'):
+        return True
+    if numpy is not None and isinstance(vectors, numpy.ndarray):
+        return vectors.ndim == 1
+    return len(vectors) == 3 and not hasattr(vectors[0], '__len__') and not hasattr(vectors[0], 'x')
+
+
+def as_vectors(vectors):
+    """
+    converts the vectors into an (N, 3) array, a single vector becomes a (1, 3) array.
+    :param vectors: <list> xyz vectors, or a single vector.
+    :return: <numpy.ndarray>, <list> (N, 3) array, a list of tuples without numpy.
+    """
+    if _is_single(vectors):
+        vectors = [vectors]
+    if numpy is not None:
+        if isinstance(vectors, numpy.ndarray):
+            return vectors.astype(float).reshape(-1, 3)
+        return numpy.array([_to_tuple(v) for v in vectors], dtype=float).reshape(-1, 3)
+    return [_to_tuple(v) for v in vectors]
+
+
+def as_scalars(values, count=1):
+    """
+    converts the values into an (N,) array, a single value is repeated count times without numpy.
+    :param values: <float>, <list> values.
+    :param count: <int> the number of vectors the values apply to.
+    :return: <numpy.ndarray>, <list> values.
+    """
+    if numpy is not None:
+        return numpy.asarray(values, dtype=float).reshape(-1)
+    if isinstance(values, (int, float)):
+        return [float(values)] * count
+    return [float(v) for v in values]
+
+
+def _broadcast(*arrays):
+    """
+    repeats the single entry arrays to the length of the longest array, for the pure Python path.
+    """
+    count = max(len(a) for a in arrays)
+    return [a * count if len(a) == 1 else a for a in arrays]
+
+
+def dot(vectors_a, vectors_b):
+    """
+    the dot product of each pair of vectors.
+    :param vectors_a: <list> (N, 3) vectors.
+    :param vectors_b: <list> (N, 3) vectors.
+    :return: <numpy.ndarray>, <list> (N,) values.
+    """
+    a = as_vectors(vectors_a)
+    b = as_vectors(vectors_b)
+    if numpy is not None:
+        return numpy.einsum('ij,ij->i', *numpy.broadcast_arrays(a, b))
+    a, b = _broadcast(a, b)
+    return [x[0] * y[0] + x[1] * y[1] + x[2] * y[2] for x, y in zip(a, b)]
+
+
+def cross(vectors_a, vectors_b, normalized=False):
+    """
+    the cross product of each pair of vectors.
+    :param vectors_a: <list> (N, 3) vectors.
+    :param vectors_b: <list> (N, 3) vectors.
+    :param normalized: <bool> normalize the results.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    a = as_vectors(vectors_a)
+    b = as_vectors(vectors_b)
+    if numpy is not None:
+        result = numpy.cross(a, b)
+    else:
+        a, b = _broadcast(a, b)
+        result = [(x[1] * y[2] - x[2] * y[1], x[2] * y[0] - x[0] * y[2], x[0] * y[1] - x[1] * y[0])
+                  for x, y in zip(a, b)]
+    if normalized:
+        return normalize(result)
+    return result
+
+
+def length(vectors):
+    """
+    the length of each vector.
+    :param vectors: <list> (N, 3) vectors.
+    :return: <numpy.ndarray>, <list> (N,) lengths.
+    """
+    v = as_vectors(vectors)
+    if numpy is not None:
+        return numpy.sqrt(numpy.einsum('ij,ij->i', v, v))
+    return [math.sqrt(x * x + y * y + z * z) for x, y, z in v]
+
+
+def distance(vectors_a, vectors_b):
+    """
+    the distance between each pair of points.
+    :param vectors_a: <list> (N, 3) points.
+    :param vectors_b: <list> (N, 3) points.
+    :return: <numpy.ndarray>, <list> (N,) distances.
+    """
+    return length(subtract(vectors_a, vectors_b))
+
+
+def add(vectors_a, vectors_b):
+    """
+    adds each pair of vectors.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    a = as_vectors(vectors_a)
+    b = as_vectors(vectors_b)
+    if numpy is not None:
+        return a + b
+    a, b = _broadcast(a, b)
+    return [(x[0] + y[0], x[1] + y[1], x[2] + y[2]) for x, y in zip(a, b)]
+
+
+def subtract(vectors_a, vectors_b):
+    """
+    subtracts each vector b from vector a.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    a = as_vectors(vectors_a)
+    b = as_vectors(vectors_b)
+    if numpy is not None:
+        return a - b
+    a, b = _broadcast(a, b)
+    return [(x[0] - y[0], x[1] - y[1], x[2] - y[2]) for x, y in zip(a, b)]
+
+
+def scale(vectors, scalars):
+    """
+    multiplies each vector by its scalar.
+    :param vectors: <list> (N, 3) vectors.
+    :param scalars: <float>, <list> one scalar, or (N,) scalars.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    v = as_vectors(vectors)
+    s = as_scalars(scalars, len(v))
+    if numpy is not None:
+        return v * s[:, None]
+    v, s = _broadcast(v, s)
+    return [(x * f, y * f, z * f) for (x, y, z), f in zip(v, s)]
+
+
+def normalize(vectors):
+    """
+    the unit length vectors, zero length vectors stay zero.
+    :param vectors: <list> (N, 3) vectors.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    v = as_vectors(vectors)
+    lengths = length(v)
+    if numpy is not None:
+        safe = numpy.where(lengths > EPSILON, lengths, 1.0)
+        return numpy.where((lengths > EPSILON)[:, None], v / safe[:, None], 0.0)
+    return [(x / l, y / l, z / l) if l > EPSILON else (0.0, 0.0, 0.0) for (x, y, z), l in zip(v, lengths)]
+
+
+def angle(vectors_a, vectors_b, as_degrees=True):
+    """
+    the angle between each pair of vectors.
+    :param vectors_a: <list> (N, 3) vectors.
+    :param vectors_b: <list> (N, 3) vectors.
+    :param as_degrees: <bool> return degrees, otherwise radians.
+    :return: <numpy.ndarray>, <list> (N,) angles.
+    """
+    cosines = dot(normalize(vectors_a), normalize(vectors_b))
+    if numpy is not None:
+        angles = numpy.arccos(numpy.clip(cosines, -1.0, 1.0))
+        return numpy.degrees(angles) if as_degrees else angles
+    angles = [math.acos(max(-1.0, min(1.0, c))) for c in cosines]
+    return [math.degrees(a) for a in angles] if as_degrees else angles
+
+
+def project(vectors, onto_vectors):
+    """
+    projects each vector onto its target vector.
+    :param vectors: <list> (N, 3) vectors to project.
+    :param onto_vectors: <list> (N, 3) vectors to project onto.
+    :return: <numpy.ndarray>, <list> (N, 3) projected vectors.
+    """
+    onto = as_vectors(onto_vectors)
+    onto_lengths = dot(onto, onto)
+    scalars = dot(vectors, onto)
+    if numpy is not None:
+        safe = numpy.where(onto_lengths > EPSILON, onto_lengths, 1.0)
+        return scale(onto, numpy.where(onto_lengths > EPSILON, scalars / safe, 0.0))
+    scalars, onto_lengths, onto = _broadcast(scalars, onto_lengths, onto)
+    factors = [s / l if l > EPSILON else 0.0 for s, l in zip(scalars, onto_lengths)]
+    return scale(onto, factors)
+
+
+def reflect(vectors, normals, base_vectors=None):
+    """
+    reflects each vector across the plane of its normal: r = d - 2(d.n)n
+    :param vectors: <list> (N, 3) vectors to reflect.
+    :param normals: <list> (N, 3) plane normals, normalized here.
+    :param base_vectors: <list> (N, 3) plane positions, the vectors are reflected about them when given.
+    :return: <numpy.ndarray>, <list> (N, 3) reflected vectors.
+    """
+    n = normalize(normals)
+    if base_vectors is not None:
+        vectors = subtract(vectors, base_vectors)
+    doubled = dot(vectors, n)
+    doubled = doubled * 2.0 if numpy is not None else [2.0 * d for d in doubled]
+    reflected = subtract(vectors, scale(n, doubled))
+    if base_vectors is not None:
+        reflected = add(reflected, base_vectors)
+    return reflected
+
+
+def lerp(vectors_a, vectors_b, weights):
+    """
+    linear interpolation from each vector a to vector b.
+    :param vectors_a: <list> (N, 3) vectors.
+    :param vectors_b: <list> (N, 3) vectors.
+    :param weights: <float>, <list> one weight, or (N,) weights, 0.0 returns a and 1.0 returns b.
+    :return: <numpy.ndarray>, <list> (N, 3) vectors.
+    """
+    return add(vectors_a, scale(subtract(vectors_b, vectors_a), weights))
+
+
+def barycentric_weights(vectors_a, vectors_b, vectors_c, points):
+    """
+    the barycentric weights of each point in its triangle.
+    :param vectors_a: <list> (N, 3) first triangle vertices.
+    :param vectors_b: <list> (N, 3) second triangle vertices.
+    :param vectors_c: <list> (N, 3) third triangle vertices.
+    :param points: <list> (N, 3) points to interpolate.
+    :return: <numpy.ndarray>, <list> (N, 3) u, v, w weights of a, b and c.
+    """
+    v0 = subtract(vectors_b, vectors_a)
+    v1 = subtract(vectors_c, vectors_a)
+    v2 = subtract(points, vectors_a)
+    d00 = dot(v0, v0)
+    d01 = dot(v0, v1)
+    d11 = dot(v1, v1)
+    d20 = dot(v2, v0)
+    d21 = dot(v2, v1)
+    if numpy is not None:
+        d00, d01, d11, d20, d21 = numpy.broadcast_arrays(d00, d01, d11, d20, d21)
+        denom = d00 * d11 - d01 * d01
+        v = (d11 * d20 - d01 * d21) / denom
+        w = (d00 * d21 - d01 * d20) / denom
+        return numpy.stack((1.0 - v - w, v, w), axis=1)
+    d00, d01, d11, d20, d21 = _broadcast(d00, d01, d11, d20, d21)
+    weights = []
+    for e00, e01, e11, e20, e21 in zip(d00, d01, d11, d20, d21):
+        denom = e00 * e11 - e01 * e01
+        v = (e11 * e20 - e01 * e21) / denom
+        w = (e00 * e21 - e01 * e20) / denom
+        weights.append((1.0 - v - w, v, w))
+    return weights
+
+
+def to_tuples(vectors):
+    """
+    the vectors as a list of xyz float tuples.
+    :param vectors: <numpy.ndarray>, <list> (N, 3) vectors.
+    :return: <list> tuples.
+    """
+    return [tuple(float(x) for x in v) for v in vectors]
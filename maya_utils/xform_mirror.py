@@ -13,6 +13,8 @@ import pymel.core as pymel
 from maya import cmds
 from maya import OpenMaya
 
+from maya_utils import matrix_kernels
+
 class Axis:
     """
     Fake enum as class with constant variable to represent the axis value that could change
@@ -41,31 +43,22 @@ def list_from_MMatrix(m):
         m(3, 3)
     ]
 
-def mirror_matrix_axis(m, axis):
-    m_flip = OpenMaya.MMatrix()
-    if axis == Axis.x:
-        OpenMaya.MScriptUtil.createMatrixFromList([-1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1], m_flip)
-    elif axis == Axis.y:
-        OpenMaya.MScriptUtil.createMatrixFromList([1, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1], m_flip)
-    elif axis == Axis.z:
-        OpenMaya.MScriptUtil.createMatrixFromList([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1], m_flip)
-    else:
-        raise Exception("Unsupported axis. Got {0}".format(axis))
-    m = m * m_flip
+def matrix_from_list(data, m=None):
+    """
+    Commit a flat matrix list into a MMatrix, in place when m is given.
+    """
+    if m is None:
+        m = OpenMaya.MMatrix()
+    OpenMaya.MScriptUtil.createMatrixFromList(list(data), m)
     return m
 
+def mirror_matrix_axis(m, axis):
+    data = matrix_kernels.scale_axes(list_from_MMatrix(m), axis, rows=False, columns=True, translation=True)
+    return matrix_from_list(matrix_kernels.to_flat_lists(data)[0])
+
 def flip_matrix_axis_pos(m, axis):
-    data = list_from_MMatrix(m)
-    if axis == Axis.x:
-        data[12] *= -1.0
-    elif axis == Axis.y:
-        data[13] *= -1.0
-    elif axis == Axis.z:
-        data[14] *= -1.0
-    else:
-        raise Exception("Unsupported axis. Got {0}".format(axis))
-    OpenMaya.MScriptUtil.createMatrixFromList(data, m)
-    return m
+    data = matrix_kernels.scale_axes(list_from_MMatrix(m), axis, rows=False, translation=True)
+    return matrix_from_list(matrix_kernels.to_flat_lists(data)[0], m)
 
 def flip_matrix_axis_rot(m, axis):
     """
@@ -74,24 +67,8 @@ def flip_matrix_axis_rot(m, axis):
     :param axis: The axis to flip.
     :return: The resulting pymel.datatypes.Matrix.
     """
-    data = list_from_MMatrix(m)
-
-    if axis == Axis.x:
-        data[0] *= -1.0
-        data[1] *= -1.0
-        data[2] *= -1.0
-    elif axis == Axis.y:
-        data[4] *= -1.0
-        data[5] *= -1.0
-        data[6] *= -1.0
-    elif axis == Axis.z:
-        data[8] *= -1.0
-        data[9] *= -1.0
-        data[10] *= -1.0
-    else:
-        raise Exception("Unsupported axis. Got {0}".format(axis))
-    OpenMaya.MScriptUtil.createMatrixFromList(data, m)
-    return m
+    data = matrix_kernels.scale_axes(list_from_MMatrix(m), axis, rows=True)
+    return matrix_from_list(matrix_kernels.to_flat_lists(data)[0], m)
 
 def get_name_friend(obj_src_name, separator='_'):
     tokens_side_l = ['l', 'L', 'lf', 'LF', 'left', 'Left']
@@ -137,29 +114,12 @@ def mirror_matrix(m,
     if (mirror_x or mirror_y or mirror_z) and not (flip_rot_x or flip_rot_y or flip_rot_z):
         raise Exception(
             "When mirroring, please at least flip one axis, otherwise you might end of with a right handed matrix!")
-    if mirror_x:
-        m = mirror_matrix_axis(m, Axis.x)
-    if mirror_y:
-        m = mirror_matrix_axis(m, Axis.y)
-    if mirror_z:
-        m = mirror_matrix_axis(m, Axis.z)
-
-    # Flip rotation axises if necessary
-    if flip_rot_x:
-        flip_matrix_axis_rot(m, Axis.x)
-    if flip_rot_y:
-        flip_matrix_axis_rot(m, Axis.y)
-    if flip_rot_z:
-        flip_matrix_axis_rot(m, Axis.z)
-
-    # Flip position if necessary
-    if flip_pos_x:
-        m = flip_matrix_axis_pos(m, Axis.x)
-    if flip_pos_y:
-        m = flip_matrix_axis_pos(m, Axis.y)
-    if flip_pos_z:
-        m = flip_matrix_axis_pos(m, Axis.z)
-    return m
+    # Mirror, flip rotation axises and flip position in a single pass over the matrix data
+    data = matrix_kernels.mirror_matrices(list_from_MMatrix(m),
+                                          mirror=(mirror_x, mirror_y, mirror_z),
+                                          flip_position=(flip_pos_x, flip_pos_y, flip_pos_z),
+                                          flip_rotation=(flip_rot_x, flip_rot_y, flip_rot_z))
+    return matrix_from_list(matrix_kernels.to_flat_lists(data)[0])
 
 def get_obj_mirror_def(obj):
     try:
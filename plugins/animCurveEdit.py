@@ -0,0 +1,79 @@
+"""
+animCurveEdit command, runs the pending anim curve edit of maya_utils.animation_utils.run_curve_edit.
+The edit writes its key changes into the command's MAnimCurveChange and creates its nodes with the command's
+MDGModifier, so the API changes are undone and redone from Maya's undo queue.
+"""
+
+import sys
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaMPx as OpenMayaMPx
+import maya.OpenMayaAnim as OpenMayaAnim
+
+kPluginCmdName = 'animCurveEdit'
+
+
+##########################################################
+# Plug-in
+##########################################################
+class AnimCurveEditCommand(OpenMayaMPx.MPxCommand):
+    def __init__(self):
+        ''' Constructor. '''
+        OpenMayaMPx.MPxCommand.__init__(self)
+        self.m_curve_change = None
+        self.m_dag_mod = None
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, pArguments):
+        ''' Runs the pending edit with this command's change objects. '''
+        from maya_utils import animation_utils
+
+        edit = animation_utils.get_pending_curve_edit()
+        self.m_curve_change = OpenMayaAnim.MAnimCurveChange()
+        self.m_dag_mod = OpenMaya.MDGModifier()
+        try:
+            edit['result'] = edit['function'](*edit['args'], m_curve_change=self.m_curve_change,
+                                              m_dag_mod=self.m_dag_mod, **edit['kwargs'])
+        except Exception:
+            # leave the scene as it was before the failed edit
+            self.undoIt()
+            raise
+
+    def redoIt(self):
+        ''' Creates the nodes again, then replays the key changes. '''
+        self.m_dag_mod.doIt()
+        self.m_curve_change.redoIt()
+
+    def undoIt(self):
+        ''' Reverts the key changes, then removes the created nodes. '''
+        self.m_curve_change.undoIt()
+        self.m_dag_mod.undoIt()
+
+
+##########################################################
+# Plug-in initialization.
+##########################################################
+def cmdCreator():
+    ''' Creates an instance of our command. '''
+    return OpenMayaMPx.asMPxPtr(AnimCurveEditCommand())
+
+
+def initializePlugin(mobject):
+    ''' Initialize the plug-in when Maya loads it. '''
+    mplugin = OpenMayaMPx.MFnPlugin(mobject)
+    try:
+        mplugin.registerCommand(kPluginCmdName, cmdCreator)
+    except:
+        sys.stderr.write('Failed to register command: ' + kPluginCmdName)
+        raise
+
+
+def uninitializePlugin(mobject):
+    ''' Uninitialize the plug-in when Maya un-loads it. '''
+    mplugin = OpenMayaMPx.MFnPlugin(mobject)
+    try:
+        mplugin.deregisterCommand(kPluginCmdName)
+    except:
+        sys.stderr.write('Failed to unregister command: ' + kPluginCmdName)
+        raise
@@ -28,113 +28,218 @@ QPushButton = QtWidgets.QPushButton
 QSizePolicy = QtWidgets.QSizePolicy
 
 
+# define the per-element operations
+kOperationNone = 0
+kOperationRemap = 1
+kOperationScale = 2
+kOperationClamp = 3
+kOperationLookup = 4
+
+
+def remap_values(values, in_min=0.0, in_max=1.0, out_min=0.0, out_max=1.0):
+    """
+    remaps the array of values from the input range into the output range.
+    :param values: <list> float values.
+    :param in_min: <float> input range minimum.
+    :param in_max: <float> input range maximum.
+    :param out_min: <float> output range minimum.
+    :param out_max: <float> output range maximum.
+    :return: <list> remapped values.
+    """
+    in_range = in_max - in_min
+    if not in_range:
+        return [out_min] * len(values)
+    ratio = (out_max - out_min) / in_range
+    return [out_min + (v - in_min) * ratio for v in values]
+
+
+def scale_values(values, scale=1.0, offset=0.0):
+    """
+    scales and offsets the array of values.
+    :param values: <list> float values.
+    :param scale: <float> multiplier.
+    :param offset: <float> value added after scaling.
+    :return: <list> scaled values.
+    """
+    return [v * scale + offset for v in values]
+
+
+def clamp_values(values, min_value=0.0, max_value=1.0):
+    """
+    clamps the array of values between the minimum and maximum.
+    :param values: <list> float values.
+    :param min_value: <float> lower bound.
+    :param max_value: <float> upper bound.
+    :return: <list> clamped values.
+    """
+    return [min_value if v < min_value else max_value if v > max_value else v for v in values]
+
+
+def lookup_values(values, table):
+    """
+    looks up the array of values through a lookup table spanning the 0.0 - 1.0 range,
+    linearly interpolating between the table entries.
+    :param values: <list> float values.
+    :param table: <list> lookup table values.
+    :return: <list> looked up values.
+    """
+    size = len(table)
+    if not size:
+        return list(values)
+    if size == 1:
+        return [table[0]] * len(values)
+    last = size - 1
+    result = []
+    for v in values:
+        position = v * last
+        if position <= 0.0:
+            result.append(table[0])
+            continue
+        if position >= last:
+            result.append(table[last])
+            continue
+        idx = int(position)
+        blend = position - idx
+        result.append(table[idx] + (table[idx + 1] - table[idx]) * blend)
+    return result
+
+
+def process_values(values, operation, parameters):
+    """
+    runs the per-element operation over the array of values in one pass.
+    :param values: <list> float values.
+    :param operation: <int> the operation index.
+    :param parameters: <dict> operation parameters.
+    :return: <list> processed values.
+    """
+    if operation == kOperationRemap:
+        return remap_values(values, parameters['inMin'], parameters['inMax'],
+                            parameters['outMin'], parameters['outMax'])
+    elif operation == kOperationScale:
+        return scale_values(values, parameters['scale'], parameters['offset'])
+    elif operation == kOperationClamp:
+        return clamp_values(values, parameters['clampMin'], parameters['clampMax'])
+    elif operation == kOperationLookup:
+        return lookup_values(values, parameters['lookupTable'])
+    return list(values)
+
+
 class pynode(ommpx.MPxNode):
 
     inputs = OpenMaya.MObject()
     output = OpenMaya.MObject()
+    operation = OpenMaya.MObject()
+    in_min = OpenMaya.MObject()
+    in_max = OpenMaya.MObject()
+    out_min = OpenMaya.MObject()
+    out_max = OpenMaya.MObject()
+    scale = OpenMaya.MObject()
+    offset = OpenMaya.MObject()
+    clamp_min = OpenMaya.MObject()
+    clamp_max = OpenMaya.MObject()
+    lookup_table = OpenMaya.MObject()
 
     def __init__(self):
         ommpx.MPxNode.__init__(self)
-
-    # def compute(self, plug, datablock):
-    #
-    #     if (plug == pynode.output) and plug.iselement():
-    #
-    #         # version 1.0
-    #         # this is ineffective and buggy because it goes through all the output plugs even if they
-    #         # dont exist yet
-    #         """
-    #         # get the input handle
-    #         datahandle = datablock.inputarrayvalue( pynode.inputs )
-    #
-    #         # get output handle
-    #         outputhandle = datablock.outputarrayvalue( pynode.output )
-    #
-    #         numelements = datahandle.elementcount()
-    #
-    #         # iterate through input array and set the output array
-    #         for i in range(numelements):
-    #
-    #             datahandle.jumptoelement(i)
-    #             handle = datahandle.inputvalue()
-    #             result = handle.asfloat()
-    #
-    #             outputhandle.jumptoelement(i)
-    #             outdatahandle = outputhandle.outputvalue()
-    #             outdatahandle.setfloat( result )
-    #
-    #         datablock.setclean( plug )
-    #         """
-    #
-    #
-    #         # version 2.0
-    #         # this only checks on the plug that has been changed
-    #         # get the input handle
-    #         datahandle = datablock.inputarrayvalue(pynode.inputs)
-    #
-    #         # get output handle
-    #         outputhandle = datablock.outputarrayvalue(pynode.output)
-    #
-    #         # get the element index
-    #         index = plug.logicalindex()
-    #
-    #         # position the arrays at the correct element.
-    #         datahandle.jumptoelement(index)
-    #         outputhandle.jumptoelement(index)
-    #
-    #         # copy the input element value to the output element.
-    #         outputhandle.outputvalue().setfloat(datahandle.inputvalue().asfloat())
-    #
-    #
+        # logical indices of the input elements dirtied since the last compute
+        self.dirty_indices = set()
+        # the whole output array needs rebuilding when the parameters change
+        self.rebuild = True
+
+    def setDependentsDirty(self, plug, plug_array):
+        """
+        records which input elements have changed so that compute only updates those outputs.
+        """
+        if plug == pynode.inputs:
+            if plug.isElement():
+                self.dirty_indices.add(plug.logicalIndex())
+            else:
+                self.rebuild = True
+        elif plug != pynode.output:
+            self.rebuild = True
+        return ommpx.MPxNode.setDependentsDirty(self, plug, plug_array)
+
+    def get_parameters(self, datablock):
+        """
+        reads the operation parameters from the datablock.
+        :return: <dict> parameters.
+        """
+        table_data = OpenMaya.MFnDoubleArrayData(datablock.inputValue(pynode.lookup_table).data())
+        table = table_data.array()
+        return {
+            'inMin': datablock.inputValue(pynode.in_min).asFloat(),
+            'inMax': datablock.inputValue(pynode.in_max).asFloat(),
+            'outMin': datablock.inputValue(pynode.out_min).asFloat(),
+            'outMax': datablock.inputValue(pynode.out_max).asFloat(),
+            'scale': datablock.inputValue(pynode.scale).asFloat(),
+            'offset': datablock.inputValue(pynode.offset).asFloat(),
+            'clampMin': datablock.inputValue(pynode.clamp_min).asFloat(),
+            'clampMax': datablock.inputValue(pynode.clamp_max).asFloat(),
+            'lookupTable': [table[i] for i in range(table.length())],
+        }
+
+    def update_dirty_elements(self, datahandle, outputhandle, operation, parameters):
+        """
+        updates only the output elements whose input elements have been dirtied.
+        :return: <bool> False if the output array does not match the input array and needs rebuilding.
+        """
+        indices = sorted(self.dirty_indices)
+        values = []
+        for index in indices:
+            try:
+                datahandle.jumpToElement(index)
+                outputhandle.jumpToElement(index)
+            except RuntimeError:
+                return False
+            values.append(datahandle.inputValue().asFloat())
+
+        for index, result in zip(indices, process_values(values, operation, parameters)):
+            outputhandle.jumpToElement(index)
+            outputhandle.outputValue().setFloat(result)
+        return True
+
+    def rebuild_elements(self, datahandle, outputhandle, operation, parameters):
+        """
+        builds the entire output array once through the array data builder.
+        """
+        numelements = datahandle.elementCount()
+        indices = []
+        values = []
+        for i in range(numelements):
+            datahandle.jumpToArrayElement(i)
+            indices.append(datahandle.elementIndex())
+            values.append(datahandle.inputValue().asFloat())
+
+        outputbuilder = outputhandle.builder()
+        for index, result in zip(indices, process_values(values, operation, parameters)):
+            outputbuilder.addElement(index).setFloat(result)
+        # set the builder only once, after every element is in place
+        outputhandle.set(outputbuilder)
 
     def compute(self, plug, datablock):
-        if (plug == pynode.inputs) and plug.isElement():
-            # get the input handle
-            datahandle = datablock.inputArrayValue(pynode.inputs)
-            numelements = datahandle.elementCount()
-
-            # get output handle and its array data builder
-            outputhandle = datablock.outputArrayValue(pynode.output)
-            outputbuilder = outputhandle.builder()
-
-            # do some really expensive setup code.
-
-            # iterate through input array and set the output array
-            for i in range(numelements):
-                datahandle.jumpToElement(i)
-                handle = datahandle.inputValue()
-                result = handle.asFloat()
-
-                try:
-                    outputhandle.jumpToElement(i)
-                    outdatahandle = outputhandle.outputValue()
-                except:
-                    outdatahandle = outputbuilder.addElement(i)
-
-                outdatahandle.setfloat(result)
-                outputhandle.set(outputbuilder)
-
-            else:
-                return OpenMaya.kUnknownParameter
+        if plug != pynode.output:
+            return OpenMaya.kUnknownParameter
 
-        if (plug == pynode.output) and plug.isElement():
-            # get the input handle
-            datahandle = datablock.inputArrayValue(pynode.inputs)
+        # get the input handle
+        datahandle = datablock.inputArrayValue(pynode.inputs)
 
-            # get output handle
-            outputhandle = datablock.outputArrayValue(pynode.output)
+        # get output handle
+        outputhandle = datablock.outputArrayValue(pynode.output)
 
-            # get the element index
-            index = plug.logicalIndex()
+        operation = datablock.inputValue(pynode.operation).asShort()
+        parameters = self.get_parameters(datablock)
 
-            # position the arrays at the correct element.
-            datahandle.jumpToElement(index)
-            outputhandle.jumpToElement(index)
+        updated = False
+        if not self.rebuild and self.dirty_indices:
+            if datahandle.elementCount() == outputhandle.elementCount():
+                updated = self.update_dirty_elements(datahandle, outputhandle, operation, parameters)
+        if not updated:
+            self.rebuild_elements(datahandle, outputhandle, operation, parameters)
 
-            # copy the input element value to the output element.
-            outputhandle.outputValue().setFloat(datahandle.inputValue().asFloat())
-        else:
-            return OpenMaya.kUnknownParameter
+        self.dirty_indices.clear()
+        self.rebuild = False
+        outputhandle.setAllClean()
+        datablock.setClean(plug)
 
 
 def nodeCreator():
@@ -153,9 +258,46 @@ def nodeInitializer():
     nattr.setArray(1)
     nattr.setStorable(1)
     nattr.setWritable(1)
+    nattr.setUsesArrayDataBuilder(1)
     pynode.addAttribute(pynode.output)
 
-    pynode.attributeAffects(pynode.inputs, pynode.output)
+    eattr = OpenMaya.MFnEnumAttribute()
+    pynode.operation = eattr.create("operation", "op", kOperationNone)
+    eattr.addField("none", kOperationNone)
+    eattr.addField("remap", kOperationRemap)
+    eattr.addField("scale", kOperationScale)
+    eattr.addField("clamp", kOperationClamp)
+    eattr.addField("lookup", kOperationLookup)
+    eattr.setKeyable(1)
+    pynode.addAttribute(pynode.operation)
+
+    parameters = (
+        ("in_min", "inMin", "imn", 0.0),
+        ("in_max", "inMax", "imx", 1.0),
+        ("out_min", "outMin", "omn", 0.0),
+        ("out_max", "outMax", "omx", 1.0),
+        ("scale", "scale", "sc", 1.0),
+        ("offset", "offset", "of", 0.0),
+        ("clamp_min", "clampMin", "cmn", 0.0),
+        ("clamp_max", "clampMax", "cmx", 1.0),
+    )
+    for member, long_name, short_name, default in parameters:
+        nattr = OpenMaya.MFnNumericAttribute()
+        setattr(pynode, member, nattr.create(long_name, short_name, OpenMaya.MFnNumericData.kFloat, default))
+        nattr.setStorable(1)
+        nattr.setKeyable(1)
+        pynode.addAttribute(getattr(pynode, member))
+
+    tattr = OpenMaya.MFnTypedAttribute()
+    pynode.lookup_table = tattr.create("lookupTable", "lut", OpenMaya.MFnData.kDoubleArray,
+                                       OpenMaya.MFnDoubleArrayData().create())
+    tattr.setStorable(1)
+    pynode.addAttribute(pynode.lookup_table)
+
+    for attr in (pynode.inputs, pynode.operation, pynode.in_min, pynode.in_max, pynode.out_min,
+                 pynode.out_max, pynode.scale, pynode.offset, pynode.clamp_min, pynode.clamp_max,
+                 pynode.lookup_table):
+        pynode.attributeAffects(attr, pynode.output)
 
 
 def AEtemplateString(nodeName):
@@ -165,12 +307,18 @@ def AEtemplateString(nodeName):
     templStr += 'editorTemplate -beginScrollLayout;\n'
 
     templStr += '	editorTemplate -beginLayout "General Attributes" -collapse 0;\n'
-    templStr += '		editorTemplate -addControl "subdivisions";\n'
-    # ....
+    templStr += '		editorTemplate -addControl "operation";\n'
+    templStr += '		editorTemplate -addSeparator;\n'
+    templStr += '		editorTemplate -addControl "inMin";\n'
+    templStr += '		editorTemplate -addControl "inMax";\n'
+    templStr += '		editorTemplate -addControl "outMin";\n'
+    templStr += '		editorTemplate -addControl "outMax";\n'
     templStr += '		editorTemplate -addSeparator;\n'
-    templStr += '		editorTemplate -addControl "flipAngle";\n'
+    templStr += '		editorTemplate -addControl "scale";\n'
+    templStr += '		editorTemplate -addControl "offset";\n'
     templStr += '		editorTemplate -addSeparator;\n'
-    templStr += '		editorTemplate -addControl "twist";\n'
+    templStr += '		editorTemplate -addControl "clampMin";\n'
+    templStr += '		editorTemplate -addControl "clampMax";\n'
     templStr += '	editorTemplate -endLayout;\n'
 
     templStr += 'editorTemplate -addExtraControls; // add any other attributes\n'
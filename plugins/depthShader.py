@@ -26,6 +26,69 @@ defaultFarColor = (0.0, 0.0, 0.0)  # (r,g,b) black
 defaultGamma = 1.0
 minGamma = 0.1
 maxGamma = 5.0
+defaultLookupTableSize = 1024
+minLookupTableSize = 2
+
+
+##########################################################
+# Gamma lookup table
+##########################################################
+class depthGammaLUT(object):
+    '''
+    Precomputed gamma roll-off over the near/far depth range. The table holds
+    pow(depthProportion, gamma) at evenly spaced depth proportions so that shading
+    samples only interpolate between two entries instead of calling math.pow.
+    '''
+    def __init__(self, nearValue, farValue, gammaValue, size=defaultLookupTableSize):
+        self.key = (nearValue, farValue, gammaValue, size)
+        self.nearValue = nearValue
+        self.last = max(size, minLookupTableSize) - 1
+        depthRange = farValue - nearValue
+        # Avoid a division by zero if the near and far values somehow have the same value.
+        self.scale = (self.last / depthRange) if depthRange else 0.0
+        self.table = [math.pow(float(i) / self.last, gammaValue) for i in range(self.last + 1)]
+
+    def matches(self, nearValue, farValue, gammaValue, size):
+        ''' Returns True if the table was built from these parameters. '''
+        return self.key == (nearValue, farValue, gammaValue, size)
+
+    def evaluate(self, depth):
+        ''' Returns the gamma corrected depth proportion of a single depth value. '''
+        position = (depth - self.nearValue) * self.scale
+        if position <= 0.0:
+            return self.table[0]
+        if position >= self.last:
+            return self.table[self.last]
+        index = int(position)
+        lower = self.table[index]
+        return lower + (self.table[index + 1] - lower) * (position - index)
+
+    def evaluateArray(self, depths):
+        ''' Returns the gamma corrected depth proportions of an array of depth values. '''
+        evaluate = self.evaluate
+        return [evaluate(depth) for depth in depths]
+
+
+def evaluateDepthColors(points, nearValue=defaultNearDistance, farValue=defaultFarDistance,
+                        nearColor=defaultNearColor, farColor=defaultFarColor, gammaValue=defaultGamma,
+                        lookupTableSize=defaultLookupTableSize, lut=None):
+    '''
+    Batch evaluation of the depth shader over an array of camera-space points, for
+    baking depth passes offline without going through the render sampler.
+      - points is a sequence of (x, y, z) camera-space positions.
+      - lut is an optional depthGammaLUT to reuse between calls; it is rebuilt if it
+        does not match the near, far and gamma values.
+    Returns a list of (r, g, b) colors.
+    '''
+    if lut is None or not lut.matches(nearValue, farValue, gammaValue, lookupTableSize):
+        lut = depthGammaLUT(nearValue, farValue, gammaValue, lookupTableSize)
+
+    # The camera looks along its negative Z axis, so the depth is the absolute Z value.
+    proportions = lut.evaluateArray([abs(point[2]) for point in points])
+
+    nearR, nearG, nearB = nearColor
+    deltaR, deltaG, deltaB = farColor[0] - nearR, farColor[1] - nearG, farColor[2] - nearB
+    return [(nearR + deltaR * p, nearG + deltaG * p, nearB + deltaB * p) for p in proportions]
 
 
 ##########################################################
@@ -41,11 +104,15 @@ class depthShader(OpenMaya.MPxNode):
     nearColorAttribute = OpenMaya.MObject()
     farColorAttribute = OpenMaya.MObject()
     gammaAttribute = OpenMaya.MObject()
+    useLookupTableAttribute = OpenMaya.MObject()
+    lookupTableSizeAttribute = OpenMaya.MObject()
     outColorAttribute = OpenMaya.MObject()
 
     def __init__(self):
         ''' Constructor. '''
         OpenMaya.MPxNode.__init__(self)
+        # The gamma lookup table is rebuilt only when near, far, gamma or the table size change.
+        self.lut = None
 
     def compute(self, pPlug, pDataBlock):
         '''
@@ -82,12 +149,20 @@ class depthShader(OpenMaya.MPxNode):
             else:
                 depthProportion = (depth - nearValue) / (farValue - nearValue)
 
-            # Clamp the depthProportion value in the interval [0.0, 1.0]
-            depthProportion = max(0, min(depthProportion, 1.0))
-
-            # Modify the depth proportion using the gamma roll-off bias.
             gammaValue = gammaDataHandle.asFloat()
-            depthProportion = math.pow(depthProportion, gammaValue)
+
+            if pDataBlock.inputValue(depthShader.useLookupTableAttribute).asBool():
+                # Sampled mode: interpolate the gamma roll-off from the lookup table.
+                lookupTableSize = pDataBlock.inputValue(depthShader.lookupTableSizeAttribute).asInt()
+                if self.lut is None or not self.lut.matches(nearValue, farValue, gammaValue, lookupTableSize):
+                    self.lut = depthGammaLUT(nearValue, farValue, gammaValue, lookupTableSize)
+                depthProportion = self.lut.evaluate(depth)
+            else:
+                # Clamp the depthProportion value in the interval [0.0, 1.0]
+                depthProportion = max(0, min(depthProportion, 1.0))
+
+                # Modify the depth proportion using the gamma roll-off bias.
+                depthProportion = math.pow(depthProportion, gammaValue)
 
             # Linearly interpolate the output color based on the depth proportion.
             outColor = OpenMaya.MFloatVector(0, 0, 0)
@@ -185,6 +260,22 @@ def nodeInitializer():
     numericAttributeFn.setMax(maxGamma)
     depthShader.addAttribute(depthShader.gammaAttribute)
 
+    # - Sampled mode toggle, interpolates the gamma roll-off from a precomputed lookup table
+    #   instead of computing it for every shading sample.
+    depthShader.useLookupTableAttribute = numericAttributeFn.create('useLookupTable', 'ult',
+                                                                    OpenMaya.MFnNumericData.kBoolean, False)
+    numericAttributeFn.storable = True
+    depthShader.addAttribute(depthShader.useLookupTableAttribute)
+
+    # - The number of entries in the gamma lookup table.
+    global defaultLookupTableSize, minLookupTableSize
+    depthShader.lookupTableSizeAttribute = numericAttributeFn.create('lookupTableSize', 'lts',
+                                                                     OpenMaya.MFnNumericData.kInt,
+                                                                     defaultLookupTableSize)
+    numericAttributeFn.storable = True
+    numericAttributeFn.setMin(minLookupTableSize)
+    depthShader.addAttribute(depthShader.lookupTableSizeAttribute)
+
     # ==================================
     # OUTPUT NODE ATTRIBUTE(S)
     # ==================================
@@ -207,6 +298,8 @@ def nodeInitializer():
     depthShader.attributeAffects(depthShader.nearColorAttribute, depthShader.outColorAttribute)
     depthShader.attributeAffects(depthShader.farColorAttribute, depthShader.outColorAttribute)
     depthShader.attributeAffects(depthShader.gammaAttribute, depthShader.outColorAttribute)
+    depthShader.attributeAffects(depthShader.useLookupTableAttribute, depthShader.outColorAttribute)
+    depthShader.attributeAffects(depthShader.lookupTableSizeAttribute, depthShader.outColorAttribute)
 
 
 def initializePlugin(mobject):
@@ -362,7 +362,25 @@
 
 import maya.OpenMaya as OpenMaya
 import maya.OpenMayaMPx as OpenMayaMPx
+import maya.cmds as cmds
+import array
+import os
+import pickle
 import sys
+import tempfile
+
+# Undo cache modes for the directModifier case
+#
+kUndoCacheFull = 0
+kUndoCacheDelta = 1
+
+# Undo cache flags, added to the syntax of derived commands with
+# polyModifierCmd._addUndoCacheFlags()
+#
+kUndoCacheModeFlag = '-ucm'
+kUndoCacheModeLongFlag = '-undoCacheMode'
+kUndoSpillLimitFlag = '-usl'
+kUndoSpillLimitLongFlag = '-undoSpillLimit'
 
 def statusError(message):
     fullMsg = "Status failed: %s\n" % message
@@ -409,6 +427,11 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
         # Cached Mesh Data (for undo in the 'No History'/'History turned off' case)
         self.__fMeshData = OpenMaya.MObject()
 
+        # Delta undo cache (replaces fMeshData and the tweak arrays when the
+        # undo cache mode is kUndoCacheDelta)
+        self.__fUndoCacheMode = kUndoCacheFull
+        self.__fDeltaCache = None
+
         # DG and DAG Modifier
         #
         #     - We need both DAG and DG modifiers since the MDagModifier::createNode()
@@ -478,6 +501,43 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
         return self.__fModifierNodeName
 
 
+    def _setUndoCacheMode(self, mode):
+        """
+        Undo cache used in the directModifier case. kUndoCacheFull duplicates the
+        mesh, kUndoCacheDelta stores only what the directModifier changed.
+        """
+        self.__fUndoCacheMode = mode
+
+
+    def _getUndoCacheMode(self):
+        return self.__fUndoCacheMode
+
+
+    @staticmethod
+    def _addUndoCacheFlags(syntax):
+        """
+        Adds the undo cache flags to the syntax of a derived command:
+
+            -undoCacheMode (-ucm) 0 duplicates the mesh, 1 stores the delta.
+            -undoSpillLimit (-usl) megabytes held in memory by all the delta
+                                   caches before they spill to disk, negative
+                                   to keep everything in memory.
+        """
+        syntax.addFlag(kUndoCacheModeFlag, kUndoCacheModeLongFlag, OpenMaya.MSyntax.kUnsigned)
+        syntax.addFlag(kUndoSpillLimitFlag, kUndoSpillLimitLongFlag, OpenMaya.MSyntax.kDouble)
+
+
+    def _parseUndoCacheFlags(self, argData):
+        """
+        Applies the undo cache flags parsed from the command arguments.
+        """
+        if argData.isFlagSet(kUndoCacheModeFlag):
+            self._setUndoCacheMode(argData.flagArgumentInt(kUndoCacheModeFlag, 0))
+        if argData.isFlagSet(kUndoSpillLimitFlag):
+            megabytes = argData.flagArgumentDouble(kUndoSpillLimitFlag, 0)
+            polyModifierUndoCache.setSpillLimit(None if megabytes < 0 else int(megabytes * 1024 * 1024))
+
+
     ###############################
     ## polyModifierCmd Execution ##
     ###############################
@@ -511,14 +571,26 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
             if (not self.__fHasHistory) and (not self.__fHasRecordHistory):
                 meshNode = self.__fDagPath.node()
 
-                # Pre-process the mesh - Cache old mesh (including tweaks, if applicable)
-                #
-                self.__cacheMeshData()
-                self.__cacheMeshTweaks()
+                if self.__fUndoCacheMode == kUndoCacheDelta:
+                    # Snapshot the mesh with bulk array reads, modify it, then keep
+                    # only the differences. The surface data is only converted and
+                    # stored when the topology changed.
+                    #
+                    before = self.__getMeshSnapshot(withSurfaceData=True)
+                    self._directModifier(meshNode)
+                    if self.__fDeltaCache is not None:
+                        self.__fDeltaCache.release()
+                    self.__fDeltaCache = polyModifierUndoCache()
+                    self.__fDeltaCache.store(before, self.__getMeshSnapshot())
+                else:
+                    # Pre-process the mesh - Cache old mesh (including tweaks, if applicable)
+                    #
+                    self.__cacheMeshData()
+                    self.__cacheMeshTweaks()
 
-                # Call the directModifier
-                #
-                self._directModifier(meshNode)
+                    # Call the directModifier
+                    #
+                    self._directModifier(meshNode)
             else:
                 modifierNode = self.__createModifierNode()
                 self._initModifierNode(modifierNode)
@@ -542,7 +614,13 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
 
     def _undoModifyPoly(self):
         if (not self.__fHasHistory) and (not self.__fHasRecordHistory):
-            self.__undoDirectModifier()
+            if self.__fDeltaCache is not None:
+                try:
+                    self.__undoDeltaCache()
+                except:
+                    statusError("undoDeltaCache")
+            else:
+                self.__undoDirectModifier()
         else:
             self.__fDGModifier.undoIt()
 
@@ -1348,6 +1426,158 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
                 statusError("Could not set meshData")
 
 
+    def __undoDeltaCache(self):
+        meshNode = self.__fDagPath.node()
+        meshFn = OpenMaya.MFnMesh(meshNode)
+
+        state = self.__fDeltaCache.load()
+        if state.topologyChanged:
+            self.__undoTopologyDelta(meshFn, state)
+        elif len(state.vertexIndices):
+            # Patch only the changed vertices and write the points back once
+            #
+            points = OpenMaya.MPointArray()
+            meshFn.getPoints(points, OpenMaya.MSpace.kObject)
+            positions = state.points
+            for i, vertex in enumerate(state.vertexIndices):
+                points.set(vertex, positions[i * 3], positions[i * 3 + 1], positions[i * 3 + 2])
+            meshFn.setPoints(points, OpenMaya.MSpace.kObject)
+
+        # Restore only the tweak entries that were changed
+        #
+        if len(state.tweakIndices):
+            depNodeFn = OpenMaya.MFnDependencyNode(meshNode)
+            meshTweakPlug = depNodeFn.findPlug("pnts")
+            vectors = state.tweakVectors
+            for i, logicalIndex in enumerate(state.tweakIndices):
+                tweak = meshTweakPlug.elementByLogicalIndex(logicalIndex)
+                tweak.setMObject(self.__getFloat3asMObject(vectors[i * 3:i * 3 + 3]))
+
+
+    def __undoTopologyDelta(self, meshFn, state):
+        """
+        Rebuilds the original topology and positions in place, then assigns the
+        stored UV sets, colour sets and locked normals back onto it.
+        """
+        points = OpenMaya.MFloatPointArray()
+        positions = state.points
+        for i in range(0, len(positions), 3):
+            points.append(OpenMaya.MFloatPoint(positions[i], positions[i + 1], positions[i + 2]))
+        polygonCounts = _toMIntArray(state.polygonCounts)
+        polygonConnects = _toMIntArray(state.polygonConnects)
+        meshFn.createInPlace(points.length(), polygonCounts.length(),
+                             points, polygonCounts, polygonConnects)
+
+        # The face and vertex of each face vertex, for the colour and normal setters
+        #
+        faceList = array.array('i')
+        for face, count in enumerate(state.polygonCounts):
+            faceList.extend([face] * count)
+
+        uvSetNames = OpenMaya.MStringArray()
+        meshFn.getUVSetNames(uvSetNames)
+        uvSetNames = [uvSetNames[i] for i in range(uvSetNames.length())]
+        for name, us, vs, uvCounts, uvIds in state.uvSets:
+            if name not in uvSetNames:
+                meshFn.createUVSetWithName(name)
+            meshFn.setCurrentUVSetName(name)
+            meshFn.clearUVs()
+            meshFn.setUVs(_toMFloatArray(us), _toMFloatArray(vs))
+            meshFn.assignUVs(_toMIntArray(uvCounts), _toMIntArray(uvIds))
+        if state.currentUVSet:
+            meshFn.setCurrentUVSetName(state.currentUVSet)
+
+        colorSetNames = OpenMaya.MStringArray()
+        meshFn.getColorSetNames(colorSetNames)
+        colorSetNames = [colorSetNames[i] for i in range(colorSetNames.length())]
+        for name, faceVertices, colors in state.colorSets:
+            if name not in colorSetNames:
+                meshFn.createColorSetWithName(name)
+            meshFn.setCurrentColorSetName(name)
+            colorArray = OpenMaya.MColorArray()
+            for i in range(0, len(colors), 4):
+                colorArray.append(OpenMaya.MColor(colors[i], colors[i + 1], colors[i + 2], colors[i + 3]))
+            meshFn.setFaceVertexColors(colorArray,
+                                       _toMIntArray(faceList[i] for i in faceVertices),
+                                       _toMIntArray(state.polygonConnects[i] for i in faceVertices))
+        if state.currentColorSet:
+            meshFn.setCurrentColorSetName(state.currentColorSet)
+
+        if len(state.normalFaceVertices):
+            normalArray = OpenMaya.MVectorArray()
+            normals = state.normals
+            for i in range(0, len(normals), 3):
+                normalArray.append(OpenMaya.MVector(normals[i], normals[i + 1], normals[i + 2]))
+            faceVertices = state.normalFaceVertices
+            meshFn.setFaceVertexNormals(normalArray,
+                                        _toMIntArray(faceList[i] for i in faceVertices),
+                                        _toMIntArray(state.polygonConnects[i] for i in faceVertices),
+                                        OpenMaya.MSpace.kObject)
+
+
+    def __getMeshSnapshot(self, withSurfaceData=False):
+        """
+        Reads the vertex positions, topology and tweaks of the mesh with bulk
+        MFnMesh calls. withSurfaceData also reads the UV sets, colour sets and
+        locked normals, which are only converted if the topology changes.
+        """
+        meshNode = self.__fDagPath.node()
+        meshFn = OpenMaya.MFnMesh(meshNode)
+
+        snapshot = polyModifierMeshSnapshot()
+        meshFn.getPoints(snapshot.points, OpenMaya.MSpace.kObject)
+        meshFn.getVertices(snapshot.polygonCounts, snapshot.polygonConnects)
+
+        depNodeFn = OpenMaya.MFnDependencyNode(meshNode)
+        meshTweakPlug = depNodeFn.findPlug("pnts")
+        if not meshTweakPlug.isNull():
+            for i in range(meshTweakPlug.numElements()):
+                tweak = meshTweakPlug.elementByPhysicalIndex(i)
+                if not tweak.isNull():
+                    snapshot.tweakIndices.append(tweak.logicalIndex())
+                    snapshot.tweakVectors.extend((tweak.child(0).asFloat(),
+                                                  tweak.child(1).asFloat(),
+                                                  tweak.child(2).asFloat()))
+        if not withSurfaceData:
+            return snapshot
+
+        uvSetNames = OpenMaya.MStringArray()
+        meshFn.getUVSetNames(uvSetNames)
+        snapshot.currentUVSet = meshFn.currentUVSetName()
+        for i in range(uvSetNames.length()):
+            us = OpenMaya.MFloatArray()
+            vs = OpenMaya.MFloatArray()
+            uvCounts = OpenMaya.MIntArray()
+            uvIds = OpenMaya.MIntArray()
+            meshFn.setCurrentUVSetName(uvSetNames[i])
+            meshFn.getUVs(us, vs)
+            meshFn.getAssignedUVs(uvCounts, uvIds)
+            snapshot.uvSets.append((uvSetNames[i], us, vs, uvCounts, uvIds))
+        if snapshot.currentUVSet:
+            meshFn.setCurrentUVSetName(snapshot.currentUVSet)
+
+        colorSetNames = OpenMaya.MStringArray()
+        meshFn.getColorSetNames(colorSetNames)
+        snapshot.currentColorSet = meshFn.currentColorSetName()
+        for i in range(colorSetNames.length()):
+            colors = OpenMaya.MColorArray()
+            meshFn.setCurrentColorSetName(colorSetNames[i])
+            meshFn.getFaceVertexColors(colors)
+            snapshot.colorSets.append((colorSetNames[i], colors))
+        if snapshot.currentColorSet:
+            meshFn.setCurrentColorSetName(snapshot.currentColorSet)
+
+        # Only the frozen normals are not rebuilt from the topology, query them in one call
+        #
+        frozen = cmds.polyNormalPerVertex(self.__fDagPath.fullPathName() + ".vtx[*]",
+                                          query=True, freezeNormal=True) or []
+        if any(frozen):
+            snapshot.frozenVertices = frozen
+            meshFn.getNormals(snapshot.normals, OpenMaya.MSpace.kObject)
+            meshFn.getNormalIds(snapshot.normalCounts, snapshot.normalIds)
+        return snapshot
+
+
     #####################################
     ## polyModifierCmd Utility Methods ##
     #####################################
@@ -1379,6 +1609,250 @@ class polyModifierCmd(OpenMayaMPx.MPxCommand):
         return numDataFn.object()
 
 
+#####################################################################
+## UNDO CACHE #######################################################
+#####################################################################
+
+# Overview:
+#
+#       In the directModifier case polyModifierCmd caches the entire mesh for undo
+#       by duplicating it, and copies every tweak. On heavy meshes this doubles the
+#       memory used by each command. The delta undo cache (kUndoCacheDelta) instead
+#       compares a snapshot of the mesh before and after the directModifier and keeps
+#       only:
+#
+#           - the original positions of the vertices that moved,
+#           - the original values of the tweak entries that changed,
+#           - when the topology changed, the original points and topology with
+#             the UV sets, colour sets and locked normals that go with it.
+#
+#       The snapshots are read with bulk MFnMesh array calls and kept as Maya
+#       arrays, only the stored differences are converted to typed arrays. Once
+#       the combined size of all the delta caches in memory goes over the spill
+#       limit, new caches are written to disk and read back on undo. Derived
+#       commands expose the mode and the spill limit with the -undoCacheMode and
+#       -undoSpillLimit flags (see polyModifierCmd._addUndoCacheFlags()).
+#
+
+def _toArray(typecode, mArray):
+    return array.array(typecode, (mArray[i] for i in range(mArray.length())))
+
+
+def _toMIntArray(values):
+    mArray = OpenMaya.MIntArray()
+    OpenMaya.MScriptUtil.createIntArrayFromList(list(values), mArray)
+    return mArray
+
+
+def _toMFloatArray(values):
+    mArray = OpenMaya.MFloatArray()
+    OpenMaya.MScriptUtil.createFloatArrayFromList(list(values), mArray)
+    return mArray
+
+
+class polyModifierMeshSnapshot:
+    def __init__(self):
+        self.points = OpenMaya.MPointArray()
+        self.polygonCounts = OpenMaya.MIntArray()
+        self.polygonConnects = OpenMaya.MIntArray()
+        self.tweakIndices = array.array('i')
+        self.tweakVectors = array.array('f')
+        # surface data, read for the snapshot taken before the directModifier
+        self.uvSets = []
+        self.currentUVSet = ""
+        self.colorSets = []
+        self.currentColorSet = ""
+        self.frozenVertices = []
+        self.normals = OpenMaya.MFloatVectorArray()
+        self.normalCounts = OpenMaya.MIntArray()
+        self.normalIds = OpenMaya.MIntArray()
+
+    def hasSameTopology(self, other):
+        # compare the sizes first, the arrays are only read when they all match
+        if (self.points.length() != other.points.length() or
+                self.polygonCounts.length() != other.polygonCounts.length() or
+                self.polygonConnects.length() != other.polygonConnects.length()):
+            return False
+        return (_toArray('i', self.polygonCounts) == _toArray('i', other.polygonCounts) and
+                _toArray('i', self.polygonConnects) == _toArray('i', other.polygonConnects))
+
+
+class polyModifierMeshState:
+    def __init__(self):
+        self.points = array.array('d')
+        self.vertexIndices = array.array('i')
+        self.tweakIndices = array.array('i')
+        self.tweakVectors = array.array('f')
+        # topology delta
+        self.topologyChanged = False
+        self.polygonCounts = array.array('i')
+        self.polygonConnects = array.array('i')
+        self.uvSets = []
+        self.currentUVSet = ""
+        self.colorSets = []
+        self.currentColorSet = ""
+        self.normalFaceVertices = array.array('i')
+        self.normals = array.array('d')
+
+    def arrays(self):
+        arrays = [self.points, self.vertexIndices, self.tweakIndices, self.tweakVectors,
+                  self.polygonCounts, self.polygonConnects, self.normalFaceVertices, self.normals]
+        for uvSet in self.uvSets:
+            arrays.extend(uvSet[1:])
+        for colorSet in self.colorSets:
+            arrays.extend(colorSet[1:])
+        return arrays
+
+    def byteSize(self):
+        return sum(a.itemsize * len(a) for a in self.arrays())
+
+
+class polyModifierUndoCache:
+    # Maximum number of bytes held in memory by all the delta caches before
+    # spilling to disk. None keeps everything in memory. Set with setSpillLimit()
+    # or the -undoSpillLimit flag of the derived commands.
+    #
+    spillLimit = None
+    spillDirectory = None
+    memoryBytes = 0
+
+    def __init__(self):
+        self.__fState = None
+        self.__fSpillPath = None
+        self.__fByteSize = 0
+
+
+    def __del__(self):
+        self.release()
+
+
+    @staticmethod
+    def setSpillLimit(limit, directory=None):
+        """
+        Sets the number of bytes all the delta caches hold in memory before new
+        caches spill to disk, None keeps everything in memory.
+        """
+        polyModifierUndoCache.spillLimit = limit
+        if directory is not None:
+            polyModifierUndoCache.spillDirectory = directory
+
+
+    def store(self, before, after):
+        """
+        Stores the difference between the before and after mesh snapshots.
+        """
+        delta = polyModifierMeshState()
+
+        oldPoints = before.points
+        if before.hasSameTopology(after):
+            newPoints = after.points
+            for vertex in range(oldPoints.length()):
+                if oldPoints[vertex] != newPoints[vertex]:
+                    point = oldPoints[vertex]
+                    delta.vertexIndices.append(vertex)
+                    delta.points.extend((point.x, point.y, point.z))
+        else:
+            self.__storeTopology(delta, before)
+
+        # Tweak entries that were changed or added get their original value back,
+        # new entries are reset to zero
+        #
+        oldTweaks = dict((index, before.tweakVectors[i * 3:i * 3 + 3])
+                         for i, index in enumerate(before.tweakIndices))
+        zero = array.array('f', (0.0, 0.0, 0.0))
+        for i, index in enumerate(after.tweakIndices):
+            oldVector = oldTweaks.pop(index, zero)
+            if oldVector != after.tweakVectors[i * 3:i * 3 + 3]:
+                delta.tweakIndices.append(index)
+                delta.tweakVectors.extend(oldVector)
+        for index, oldVector in oldTweaks.items():
+            delta.tweakIndices.append(index)
+            delta.tweakVectors.extend(oldVector)
+
+        self.__fByteSize = delta.byteSize()
+        limit = polyModifierUndoCache.spillLimit
+        if limit is not None and polyModifierUndoCache.memoryBytes + self.__fByteSize > limit:
+            self.__spill(delta)
+        else:
+            self.__fState = delta
+            polyModifierUndoCache.memoryBytes += self.__fByteSize
+
+
+    def __storeTopology(self, delta, before):
+        """
+        Converts the points, topology and surface data of the snapshot taken
+        before the directModifier into the delta.
+        """
+        delta.topologyChanged = True
+        points = before.points
+        for i in range(points.length()):
+            point = points[i]
+            delta.points.extend((point.x, point.y, point.z))
+        delta.polygonCounts = _toArray('i', before.polygonCounts)
+        delta.polygonConnects = _toArray('i', before.polygonConnects)
+
+        delta.currentUVSet = before.currentUVSet
+        for name, us, vs, uvCounts, uvIds in before.uvSets:
+            delta.uvSets.append((name, _toArray('f', us), _toArray('f', vs),
+                                 _toArray('i', uvCounts), _toArray('i', uvIds)))
+
+        # Face vertex colours, skipping the face vertices without a colour
+        #
+        delta.currentColorSet = before.currentColorSet
+        for name, colors in before.colorSets:
+            faceVertices = array.array('i')
+            values = array.array('f')
+            for i in range(colors.length()):
+                color = colors[i]
+                if color.r < 0.0 and color.g < 0.0 and color.b < 0.0 and color.a < 0.0:
+                    continue
+                faceVertices.append(i)
+                values.extend((color.r, color.g, color.b, color.a))
+            delta.colorSets.append((name, faceVertices, values))
+
+        # Face vertex normals of the frozen vertices
+        #
+        if before.frozenVertices:
+            normals = before.normals
+            normalIds = before.normalIds
+            for i in range(before.polygonConnects.length()):
+                if before.frozenVertices[before.polygonConnects[i]]:
+                    normal = normals[normalIds[i]]
+                    delta.normalFaceVertices.append(i)
+                    delta.normals.extend((normal.x, normal.y, normal.z))
+
+
+    def load(self):
+        """
+        Returns the stored delta state, reading it back from disk if it was spilled.
+        """
+        if self.__fState is not None:
+            return self.__fState
+
+        with open(self.__fSpillPath, 'rb') as f:
+            return pickle.load(f)
+
+
+    def release(self):
+        """
+        Frees the memory and removes the spill file held by the cache.
+        """
+        if self.__fState is not None:
+            polyModifierUndoCache.memoryBytes -= self.__fByteSize
+            self.__fState = None
+        if self.__fSpillPath is not None:
+            if os.path.exists(self.__fSpillPath):
+                os.remove(self.__fSpillPath)
+            self.__fSpillPath = None
+
+
+    def __spill(self, delta):
+        handle, self.__fSpillPath = tempfile.mkstemp(
+            prefix="polyModifierUndo_", suffix=".bin", dir=polyModifierUndoCache.spillDirectory)
+        with os.fdopen(handle, 'wb') as f:
+            pickle.dump(delta, f, pickle.HIGHEST_PROTOCOL)
+
+
 #####################################################################
 ## FACTORY ##########################################################
 #####################################################################
@@ -41,6 +41,10 @@ class ReflectionLocatorNode(OpenMayaUI.MPxLocatorNode):
     reflected_parent_inverse = OpenMaya.MObject()
     input_matrix = OpenMaya.MObject()
     input_point = OpenMaya.MObject()
+    input_points = OpenMaya.MObject()
+    output_points = OpenMaya.MObject()
+    input_matrices = OpenMaya.MObject()
+    output_matrices = OpenMaya.MObject()
     scale = OpenMaya.MObject()
 
     @staticmethod
@@ -134,6 +138,37 @@ class ReflectionLocatorNode(OpenMayaUI.MPxLocatorNode):
         ReflectionLocatorNode.addAttribute(ReflectionLocatorNode.scale)
         ReflectionLocatorNode.attributeAffects(ReflectionLocatorNode.scale, ReflectionLocatorNode.output_point)
 
+        # create the batched point array attributes
+        ReflectionLocatorNode.output_points = nAttr.create('outputPoints', 'ops', OpenMaya.MFnNumericData.k3Double)
+        nAttr.array = True
+        nAttr.usesArrayDataBuilder = True
+        nAttr.storable = False
+        ReflectionLocatorNode.addAttribute(ReflectionLocatorNode.output_points)
+
+        ReflectionLocatorNode.input_points = nAttr.create('inputPoints', 'ips', OpenMaya.MFnNumericData.k3Double)
+        nAttr.array = True
+        nAttr.storable = True
+        ReflectionLocatorNode.addAttribute(ReflectionLocatorNode.input_points)
+
+        # create the batched orientation matrix array attributes
+        ReflectionLocatorNode.output_matrices = mAttr.create("outputMatrices", "oms")
+        mAttr.array = True
+        mAttr.usesArrayDataBuilder = True
+        mAttr.storable = False
+        ReflectionLocatorNode.addAttribute(ReflectionLocatorNode.output_matrices)
+
+        ReflectionLocatorNode.input_matrices = mAttr.create("inputMatrices", "ims")
+        mAttr.array = True
+        mAttr.storable = True
+        ReflectionLocatorNode.addAttribute(ReflectionLocatorNode.input_matrices)
+
+        for attr in (ReflectionLocatorNode.input_points, ReflectionLocatorNode.plane_matrix,
+                     ReflectionLocatorNode.scale):
+            ReflectionLocatorNode.attributeAffects(attr, ReflectionLocatorNode.output_points)
+        for attr in (ReflectionLocatorNode.input_matrices, ReflectionLocatorNode.plane_matrix,
+                     ReflectionLocatorNode.scale):
+            ReflectionLocatorNode.attributeAffects(attr, ReflectionLocatorNode.output_matrices)
+
     def __init__(self):
         OpenMayaUI.MPxLocatorNode.__init__(self)
 
@@ -158,6 +193,47 @@ class ReflectionLocatorNode(OpenMayaUI.MPxLocatorNode):
             h_output.setMVector(reflection_point)
             h_output.setClean()
             data.setClean(plug)
+
+        elif is_array_plug(plug, ReflectionLocatorNode.output_points):
+            plane_matrix = data.inputValue(ReflectionLocatorNode.plane_matrix).asMatrix()
+            scale = data.inputValue(ReflectionLocatorNode.scale).asDouble()
+
+            # gather every input point first, then reflect them in one call
+            h_input = data.inputArrayValue(ReflectionLocatorNode.input_points)
+            indices, points = [], []
+            for i in range(len(h_input)):
+                h_input.jumpToPhysicalElement(i)
+                indices.append(h_input.elementLogicalIndex())
+                points.append(h_input.inputValue().asDouble3())
+            reflected = calculate_reflection_points(plane_matrix, points, scale)
+
+            h_output = data.outputArrayValue(ReflectionLocatorNode.output_points)
+            builder = h_output.builder()
+            for index, point in zip(indices, reflected):
+                builder.addElement(index).set3Double(*point)
+            h_output.set(builder)
+            h_output.setAllClean()
+            data.setClean(plug)
+
+        elif is_array_plug(plug, ReflectionLocatorNode.output_matrices):
+            plane_matrix = data.inputValue(ReflectionLocatorNode.plane_matrix).asMatrix()
+            scale = data.inputValue(ReflectionLocatorNode.scale).asDouble()
+
+            h_input = data.inputArrayValue(ReflectionLocatorNode.input_matrices)
+            indices, matrices = [], []
+            for i in range(len(h_input)):
+                h_input.jumpToPhysicalElement(i)
+                indices.append(h_input.elementLogicalIndex())
+                matrices.append(h_input.inputValue().asMatrix())
+            reflected = calculate_reflection_matrices(plane_matrix, matrices, scale)
+
+            h_output = data.outputArrayValue(ReflectionLocatorNode.output_matrices)
+            builder = h_output.builder()
+            for index, matrix in zip(indices, reflected):
+                builder.addElement(index).setMMatrix(OpenMaya.MMatrix(matrix))
+            h_output.set(builder)
+            h_output.setAllClean()
+            data.setClean(plug)
         return None
 
     def draw(self, view, path, style, status):
@@ -380,6 +456,79 @@ def calculate_reflection_point(plane_matrix, plane_pos, input_point, scale, as_v
     return vector.x, vector.y, vector.z
 
 
+def is_array_plug(plug, attribute):
+    """
+    checks if the plug is the array attribute or one of its elements.
+    :param plug: <OpenMaya.MPlug>
+    :param attribute: <OpenMaya.MObject> array attribute.
+    :return: <bool>
+    """
+    if plug.isElement:
+        return plug.array() == attribute
+    return plug == attribute
+
+
+def get_plane_data(plane_matrix):
+    """
+    gets the normalized plane normal and the plane position from the plane matrix.
+    :param plane_matrix: <OpenMaya.MMatrix>, <list> 16 matrix values.
+    :return: <tuple> normal XYZ, position XYZ.
+    """
+    # the normal is the matrix Y-axis, the same as (0, 1, 0) * plane_matrix
+    nx, ny, nz = plane_matrix[4], plane_matrix[5], plane_matrix[6]
+    length = (nx * nx + ny * ny + nz * nz) ** 0.5
+    if length:
+        nx, ny, nz = nx / length, ny / length, nz / length
+    return (nx, ny, nz), (plane_matrix[12], plane_matrix[13], plane_matrix[14])
+
+
+def calculate_reflection_points(plane_matrix, points, scale=1.0):
+    """
+    calculates the reflection points of an array of points in one pass, using the same formula
+    as calculate_reflection_point
+        R = 2(N * L) * N - L
+    :param plane_matrix: <OpenMaya.MMatrix>, <list> 16 matrix values.
+    :param points: <list> (N, 3) XYZ points.
+    :param scale: <float>
+    :return: <list> (N, 3) reflected XYZ points.
+    """
+    (nx, ny, nz), (px, py, pz) = get_plane_data(plane_matrix)
+    reflected = []
+    for x, y, z in points:
+        # calculate the original vector
+        lx, ly, lz = x - px, y - py, z - pz
+        dot = 2.0 * (nx * lx + ny * ly + nz * lz)
+        reflected.append((px + (nx * dot - lx) * scale,
+                          py + (ny * dot - ly) * scale,
+                          pz + (nz * dot - lz) * scale))
+    return reflected
+
+
+def calculate_reflection_matrices(plane_matrix, matrices, scale=1.0):
+    """
+    calculates the reflected orientation matrices of an array of matrices in one pass.
+    the axis rows are reflected around the plane normal, keeping the rotation right-handed,
+    and the translation row is reflected as a point.
+    :param plane_matrix: <OpenMaya.MMatrix>, <list> 16 matrix values.
+    :param matrices: <list> (N, 16) matrix values.
+    :param scale: <float>
+    :return: <list> (N, 16) reflected matrix values.
+    """
+    (nx, ny, nz), _ = get_plane_data(plane_matrix)
+    positions = calculate_reflection_points(plane_matrix, [
+        (matrix[12], matrix[13], matrix[14]) for matrix in matrices], scale)
+    reflected = []
+    for matrix, position in zip(matrices, positions):
+        values = []
+        for row in (0, 4, 8):
+            x, y, z = matrix[row], matrix[row + 1], matrix[row + 2]
+            dot = 2.0 * (nx * x + ny * y + nz * z)
+            values.extend((nx * dot - x, ny * dot - y, nz * dot - z, matrix[row + 3]))
+        values.extend((position[0], position[1], position[2], matrix[15]))
+        reflected.append(values)
+    return reflected
+
+
 def initializePlugin(obj):
     plugin = OpenMaya.MFnPlugin(obj, "Alex Gaidachev", "1.0", "Any")
 
@@ -2,63 +2,150 @@ import json
 import random
 
 from maya import cmds as mc
-from pymel import core as pm
+
+from maya_utils import animation_utils
 
 """
-controls = [str(x) for x in pm.selected()]
+controls = mc.ls(sl=True)
 with open(mc.workspace(q=True, rd=True)+"data/controls.json", "w") as fp:
 	json.dump(controls, fp, indent=2)
 """
 
 
-skips    = {"bool", "enum"}
+skips    = {"bool", "enum", "message"}
 numerics = {"short", "float", "double"}
+angles   = {"doubleAngle", "floatAngle"}
 
 
 def has_scale_token(attr):
 	scale_tokens = ["Mult", "Thickness", "Scale"]
-	result = filter(lambda x: x in attr.longName(), scale_tokens)
-	return bool(len(result))
-
-
-def randomize_keys_on_control(control, start=None, end=None, spacing=10):
-	start = start or mc.playbackOptions(q=True, ast=True)
-	end   = end   or mc.playbackOptions(q=True, aet=True)
-
-	key_frames = range(int(start), int(end+1), 10)
-
-	## using node.attr("name") syntax here because some nodes
-	## have function names that match
-	translates = control.attr("translate").children()
-	rotates    = control.attr("rotate").children()
-	scales     = control.attr("scale").children()
-
-	keyables = filter(lambda x: not x.type() in skips, control.listAttr(k=True))
-
-	for attr in keyables:
+	return any(x in attr for x in scale_tokens)
+
+
+def get_key_frames(start=None, end=None, spacing=10):
+	start = start if start is not None else mc.playbackOptions(q=True, ast=True)
+	end   = end   if end   is not None else mc.playbackOptions(q=True, aet=True)
+	return list(range(int(start), int(end+1), max(int(spacing), 1)))
+
+
+def is_keyable_plug(plug):
+	"""
+	the plug can take new keys, it is not locked and it is either free to set or driven by a time anim curve.
+	:param plug: <str> node.attribute name.
+	:return: <bool> True when the plug can be keyed.
+	"""
+	if mc.getAttr(plug, lock=True):
+		return False
+	sources = mc.listConnections(plug, source=True, destination=False) or []
+	if sources:
+		return mc.nodeType(sources[0]).startswith("animCurveT")
+	return bool(mc.getAttr(plug, settable=True))
+
+
+def get_attribute_ranges(control):
+	"""
+	the random value range of every keyable attribute on the control,
+	skipping the attributes that are locked, not settable or driven by anything but a time anim curve.
+	:param control: <str> control name.
+	:return: <dict> attribute long name: (start, end)
+	"""
+	## query the compound children by name here because some nodes
+	## have attributes that match the compound names
+	rotates = set(mc.attributeQuery("rotate", node=control, listChildren=True) or [])
+	scales  = set(mc.attributeQuery("scale",  node=control, listChildren=True) or [])
+
+	ranges = {}
+	for attr in mc.listAttr(control, k=True) or []:
+		if "." in attr or not mc.attributeQuery(attr, node=control, exists=True):
+			continue
+		attr_type = mc.attributeQuery(attr, node=control, attributeType=True)
+		if attr_type in skips or not is_keyable_plug(control + "." + attr):
+			continue
 		if attr in scales or has_scale_token(attr):
 			r_start, r_end = 1.0, 1.2
-		elif attr in rotates or "Angle" in attr.type():
+		elif attr in rotates or attr_type in angles:
 			r_start, r_end = -10, 10
 		else:
 			r_start, r_end = -1, 1
-		
-		r_start, r_end = map(float, [r_start, r_end])
-		
-		for frame in key_frames:
-			value = random.uniform(r_start, r_end)
-			pm.mel.eval("setKeyframe -attribute {} -time {} -value {} {}"
-						.format(attr.longName(), frame, value, control))
-
-
-def randomize_keys(controls_list):
-	controls = pm.ls(controls_list)
-	for control in controls:
-		randomize_keys_on_control(control)
-
-
-## operate just on selection
-randomize_keys(pm.selected())
+		ranges[attr] = (float(r_start), float(r_end))
+	return ranges
+
+
+def get_random_key_values(control, attr_ranges, num_frames, seed=None):
+	"""
+	computes every random value of the control up front.
+	each control draws from its own generator seeded by the seed and its name,
+	so the values do not depend on the order or number of controls.
+	:param control: <str> control name.
+	:param attr_ranges: <dict> attribute: (start, end) from get_attribute_ranges.
+	:param num_frames: <int> number of keys per attribute.
+	:param seed: the random seed, None for an unseeded run.
+	:return: <dict> attribute: list of values.
+	"""
+	if seed is None:
+		rng = random.Random()
+	else:
+		rng = random.Random("{}:{}".format(seed, control))
+	values = {}
+	for attr in sorted(attr_ranges):
+		r_start, r_end = attr_ranges[attr]
+		values[attr] = [rng.uniform(r_start, r_end) for _ in range(num_frames)]
+	return values
+
+
+def key_control_values(control_values, key_frames, m_curve_change=None, m_dag_mod=None):
+	"""
+	writes the values of every control attribute, each curve in one addKeys call.
+	run it through animation_utils.run_curve_edit, so the keys are undone with a single undo.
+	:param control_values: <dict> control: {attribute: list of values}.
+	:param key_frames: <list> the key frames of the values.
+	:return: <bool> True for success.
+	"""
+	global_type = animation_utils.OpenMayaAnim.MFnAnimCurve.kTangentGlobal
+	for control, values in control_values.items():
+		for attr, attr_values in values.items():
+			anim_fn = animation_utils.get_or_create_anim_curve(control, attr, m_dag_mod=m_dag_mod)
+			curve_type = anim_fn.animCurveType()
+			animation_utils.add_keys_bulk(anim_fn, key_frames,
+										  [animation_utils.to_internal_value(curve_type, v) for v in attr_values],
+										  [global_type] * len(key_frames),
+										  [global_type] * len(key_frames),
+										  m_curve_change=m_curve_change)
+	return True
+
+
+def randomize_keys_on_control(control, start=None, end=None, spacing=10, seed=None):
+	"""
+	keys random values on every keyable attribute of the control, each curve written in one addKeys call.
+	:return: <dict> attribute: list of values.
+	"""
+	return randomize_keys([control], start=start, end=end, spacing=spacing, seed=seed).get(str(control), {})
+
+
+def randomize_keys(controls_list, start=None, end=None, spacing=10, seed=None):
+	"""
+	keys random values on the controls, reproducible when a seed is given.
+	every key is written from one animCurveEdit command, undone with a single undo.
+	:return: <dict> control: {attribute: list of values}.
+	"""
+	key_frames = get_key_frames(start, end, spacing)
+	control_values = {}
+	for control in mc.ls(controls_list):
+		control = str(control)
+		control_values[control] = get_random_key_values(control, get_attribute_ranges(control), len(key_frames),
+														seed=seed)
+	if control_values:
+		animation_utils.run_curve_edit(key_control_values, control_values, key_frames)
+	return control_values
+
+
+def randomize_selected(start=None, end=None, spacing=10, seed=None):
+	## operate just on selection
+	return randomize_keys(mc.ls(sl=True), start=start, end=end, spacing=spacing, seed=seed)
+
+
+if __name__ == "__main__":
+	randomize_selected()
 
 
 
@@ -78,6 +165,6 @@ import random_keyer
 with open(mc.workspace(q=True, rd=True)+"data/controls.json", "r") as fp:
 	controls = json.load(fp)
 
-random_keyer.randomize_keys(controls)
+random_keyer.randomize_keys(controls, seed=1)
 
 """
@@ -5,9 +5,17 @@ try:
 except ImportError:
     raise ImportError("Please install PyMel.")
 from maya import OpenMaya
+# import third party modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
 # import custom modules
 from ui_tools import organizer_tool
 from maya_utils import math_utils
+from maya_utils import matrix_kernels
+from maya_utils import anim_eval_utils
+from maya_utils import transform_utils
 # import standard modules
 import copy
 import re
@@ -60,7 +68,7 @@ def create_targets(control_name, name='', num=4, shape_scale=0.2):
 
 def interpolate_matrices(matrix_a, matrix_b, envelope):
     """Interpolates between two MMatrix objects based on the given envelope
-    (1 - t) * A + t * B
+    the translation and scale are blended linearly and the rotation is slerped
     :param matrix_a: (OpenMaya.MMatrix,) the first matrix
     :param matrix_b: (OpenMaya.MMatrix,) the second matrix
     :param envelope: (float,) the interpolation envelope (0.0 to 1.0)
@@ -68,12 +76,19 @@ def interpolate_matrices(matrix_a, matrix_b, envelope):
     """
     if not (0.0 <= envelope <= 1.0):
         raise ValueError("Envelope must be between 0.0 and 1.0")
-    result_matrix = OpenMaya.MMatrix()
-    for i in range(4):
-        for j in range(4):
-            result_matrix[i][j] = (1 - envelope) * \
-                matrix_a[i][j] + envelope * matrix_b[i][j]
-    return result_matrix
+    result_matrix = interpolate_matrix_lists(
+        math_utils.list_from_MMatrix(matrix_a), math_utils.list_from_MMatrix(matrix_b), envelope)[0]
+    return math_utils.mmatrix_from_list(result_matrix)
+
+
+def interpolate_matrix_lists(matrix_a, matrix_b, envelopes):
+    """Interpolates between two flat matrix lists for every envelope in one vectorised call
+    :param matrix_a: (list,) the first matrix, or a list of matrices
+    :param matrix_b: (list,) the second matrix, or a list of matrices
+    :param envelopes: (float, list,) the interpolation envelopes (0.0 to 1.0)
+    :return: (list,) flat interpolated matrix lists, one per envelope
+    """
+    return matrix_kernels.to_flat_lists(matrix_kernels.interpolate_matrices(matrix_a, matrix_b, envelopes))
 
 
 def zero_transform_values(node_name, translate=True, scale=True, rotate=True, skip_tx=False):
@@ -1602,6 +1617,138 @@ def create_spline_interpolate(start_transform, end_transform, driven_transforms=
     return locator_trs
 
 
+def get_interpolate_percentages(start_transform, end_transform, driven_transforms=[]):
+    """the percentage distances of the driven transforms along the start to end vector, read in one pass
+    :param start_transform: (str) the starting transform object
+    :param end_transform: (str) the final transform object
+    :param driven_transforms: (tuple, list) the driven transforms to calculate the percentage values
+    :return: (numpy.ndarray,) percentages clamped to 1.0
+    """
+    matrices = transform_utils.get_world_matrices([start_transform, end_transform] + list(driven_transforms))
+    positions = matrices[:, 3, :3]
+    lengths = numpy.linalg.norm(positions[2:] - positions[0], axis=1)
+    return numpy.minimum(lengths / numpy.linalg.norm(positions[1] - positions[0]), 1.0)
+
+
+def preview_linear_interpolate(start_transform, end_transform, driven_transforms=[], envelopes=None, apply=False):
+    """previews the create_linear_interpolate result without building the node network
+    :param start_transform: (str) the starting transform object
+    :param end_transform: (str) the final transform object
+    :param driven_transforms: (tuple, list) the driven transforms
+    :param envelopes: (tuple, list) the interpolation envelopes, the distance percentages when not given
+    :param apply: (bool) set the driven transforms to the previewed world matrices
+    :return: (dict,) driven transforms with their flat world matrices
+    """
+    if envelopes is None:
+        envelopes = get_interpolate_percentages(start_transform, end_transform, driven_transforms)
+    matrices = transform_utils.get_world_matrices([start_transform, end_transform])
+    results = matrix_kernels.interpolate_matrices(matrices[0], matrices[1], envelopes)
+    if apply:
+        transform_utils.set_world_matrices(list(driven_transforms), results)
+    return dict(zip(driven_transforms, matrix_kernels.to_flat_lists(results)))
+
+
+def get_default_tangent_types():
+    """the scene default in and out tangent types, the ones setDrivenKeyframe gives its keys
+    :return: (tuple,) in tangent type, out tangent type names
+    """
+    return (cmds.keyTangent(query=True, g=True, inTangentType=True)[0],
+            cmds.keyTangent(query=True, g=True, outTangentType=True)[0])
+
+
+def evaluate_driven_keys(inputs, values, driver_values, tangent_types=None):
+    """evaluates driven key curves offline, with the tangents Maya builds for the tangent types
+    the slopes come from anim_eval_utils.compute_tangent_slope, the spline, linear, flat, clamped and plateau
+    types match Maya, auto and the other types are approximated by the spline slopes
+    :param inputs: (tuple, list) the driver values of the keys, shared by every curve
+    :param values: (tuple, list) the key values of each curve
+    :param driver_values: (float, list) the driver values to evaluate at
+    :param tangent_types: (tuple) in and out tangent type names, the scene defaults when not given
+    :return: (numpy.ndarray,) (curves, driver values) driven values
+    """
+    if tangent_types is None:
+        tangent_types = get_default_tangent_types()
+    in_type, out_type = tangent_types
+    curves = {}
+    for idx, curve_values in enumerate(values):
+        curves[idx] = {
+            'inputs': list(inputs),
+            'values': list(curve_values),
+            'inTangentTypes': [in_type] * len(inputs),
+            'outTangentTypes': [out_type] * len(inputs),
+        }
+    driver_values = numpy.atleast_1d(numpy.asarray(driver_values, dtype=float))
+    results = anim_eval_utils.evaluate_curves(curves, driver_values)
+    return numpy.array([results[idx] for idx in range(len(curves))], dtype=float).reshape(-1, len(driver_values))
+
+
+def get_spline_interpolate_envelopes(percentages, value=0.0, tangent_types=None):
+    """the envelopes of the create_spline_interpolate driven keys at the control value
+    the keys are at -1.0: 0.0, 0.0: percentage and 1.0: 1.0, evaluated with the tangent types the keys are given,
+    see evaluate_driven_keys for the tangent types that are approximated
+    :param percentages: (tuple, list) the resting percentages of the driven transforms
+    :param value: (float) the interpolate attribute value (-1.0 to 1.0)
+    :param tangent_types: (tuple) in and out tangent type names, the scene defaults when not given
+    :return: (numpy.ndarray,) envelopes
+    """
+    value = min(max(value, -1.0), 1.0)
+    values = [(0.0, percentage, 1.0) for percentage in percentages]
+    if not values:
+        return numpy.zeros(0)
+    return evaluate_driven_keys((-1.0, 0.0, 1.0), values, value, tangent_types)[:, 0]
+
+
+def get_spline_interpolate_blend(envelopes, tangent_types=None):
+    """the share of the lower locators in the parent constraint of each middle locator
+    the constraint weights are driven keys from the interpolate attribute, 1.0 to 0.0 for the upper locator
+    and 0.0 to 1.0 for the lower locator, normalized the way the parent constraint normalizes its weights
+    :param envelopes: (tuple, list) the middle locator interpolate values
+    :param tangent_types: (tuple) in and out tangent type names, the scene defaults when not given
+    :return: (numpy.ndarray,) lower locator blend weights
+    """
+    envelopes = numpy.clip(numpy.asarray(envelopes, dtype=float), 0.0, 1.0)
+    if not len(envelopes):
+        return envelopes
+    weights = evaluate_driven_keys((0.0, 1.0), ((1.0, 0.0), (0.0, 1.0)), envelopes, tangent_types)
+    total = weights.sum(axis=0)
+    return numpy.where(total > 0.0, weights[1] / numpy.where(total > 0.0, total, 1.0), envelopes)
+
+
+def preview_spline_interpolate(start_transform, end_transform, driven_transforms=[], value=0.0, apply=False,
+                               upper_value=None, lower_value=None, tangent_types=None):
+    """previews the create_spline_interpolate result at the interpolate attribute values
+    without building the locators and node networks
+    the upper and lower locators are interpolated between the start and end transforms by their driven keys, then
+    each middle locator blends them by its parent constraint weights. The current start and end transforms are
+    taken as the rest pose, and the aim of the aim_at_end option is not previewed
+    :param start_transform: (str) the starting transform object
+    :param end_transform: (str) the final transform object
+    :param driven_transforms: (tuple, list) the driven transforms
+    :param value: (float) the middle interpolate attribute value (-1.0 to 1.0)
+    :param apply: (bool) set the driven transforms to the previewed world matrices
+    :param upper_value: (float) the upper interpolate attribute value, the middle value when not given
+    :param lower_value: (float) the lower interpolate attribute value, the middle value when not given
+    :param tangent_types: (tuple) in and out tangent type names, the scene defaults when not given
+    :return: (dict,) driven transforms with their flat world matrices
+    """
+    if tangent_types is None:
+        tangent_types = get_default_tangent_types()
+    upper_value = value if upper_value is None else upper_value
+    lower_value = value if lower_value is None else lower_value
+    percentages = get_interpolate_percentages(start_transform, end_transform, driven_transforms)
+    matrices = transform_utils.get_world_matrices([start_transform, end_transform])
+    upper_matrices = matrix_kernels.interpolate_matrices(
+        matrices[0], matrices[1], get_spline_interpolate_envelopes(percentages, upper_value, tangent_types))
+    lower_matrices = matrix_kernels.interpolate_matrices(
+        matrices[0], matrices[1], get_spline_interpolate_envelopes(percentages, lower_value, tangent_types))
+    blend = get_spline_interpolate_blend(
+        get_spline_interpolate_envelopes(percentages, value, tangent_types), tangent_types)
+    results = matrix_kernels.interpolate_matrices(upper_matrices, lower_matrices, blend)
+    if apply:
+        transform_utils.set_world_matrices(list(driven_transforms), results)
+    return dict(zip(driven_transforms, matrix_kernels.to_flat_lists(results)))
+
+
 def add_float_smooth_interpolation_at_value(driver_attr_name, driven_attr_name, driver_value=0.0, value=1.0):
     """
     """
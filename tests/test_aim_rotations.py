@@ -0,0 +1,54 @@
+"""
+Tests for the batched aim solvers, on chains where each joint aims at the next one.
+"""
+# import third party modules
+import numpy
+import pytest
+
+# import local modules
+from maya_utils import aim_kernels
+from maya_utils import matrix_kernels
+
+CHAIN = [(0.0, 0.0, 0.0), (2.0, 1.0, 0.0), (3.0, 3.0, 1.0), (3.5, 6.0, 1.0), (5.0, 7.0, -1.0)]
+
+
+def _aim_directions(sources, targets):
+    directions = numpy.subtract(targets, sources)
+    return directions / numpy.linalg.norm(directions, axis=1)[:, None]
+
+
+def test_chain_aims_at_next_joint():
+    sources, targets = CHAIN[:-1], CHAIN[1:]
+    rotations = aim_kernels.look_at_rotations(sources, targets, (0.0, 0.0, 1.0))
+    aim_axes = matrix_kernels.euler_to_rotation(rotations)[:, 0, :]
+    numpy.testing.assert_allclose(aim_axes, _aim_directions(sources, targets), atol=1e-9)
+
+
+def test_get_aim_rotations_on_shared_chain_joints():
+    standalone = pytest.importorskip('maya.standalone')
+    standalone.initialize()
+    from maya import cmds
+    from maya_utils import math_utils
+
+    cmds.file(new=True, force=True)
+    joints = []
+    for position in CHAIN:
+        # unparented, so setting one rotation does not move the next joint
+        cmds.select(clear=True)
+        joints.append(cmds.joint(position=position))
+    sources, targets = joints[:-1], joints[1:]
+    rotations = math_utils.get_aim_rotations(sources, targets, up_vector=(0, 0, 1))
+    assert len(rotations) == len(sources)
+    for joint, rotation in zip(sources, rotations):
+        cmds.setAttr(joint + '.rotate', *rotation)
+    aim_axes = [cmds.xform(joint, query=True, worldSpace=True, matrix=True)[:3] for joint in sources]
+    aim_axes = numpy.array(aim_axes) / numpy.linalg.norm(aim_axes, axis=1)[:, None]
+    numpy.testing.assert_allclose(aim_axes, _aim_directions(CHAIN[:-1], CHAIN[1:]), atol=1e-6)
+
+
+def test_solvers_need_numpy(monkeypatch):
+    monkeypatch.setattr(aim_kernels, 'numpy', None)
+    with pytest.raises(ImportError):
+        aim_kernels.pole_vector_positions([(0.0, 0.0, 0.0)], [(1.0, 1.0, 0.0)], [(2.0, 0.0, 0.0)])
+    with pytest.raises(ImportError):
+        aim_kernels.look_at_rotations([(0.0, 0.0, 0.0)], [(1.0, 0.0, 0.0)])
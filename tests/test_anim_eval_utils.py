@@ -0,0 +1,69 @@
+"""
+Tests for the offline anim curve evaluator.
+"""
+# import standard modules
+import math
+import random
+
+# import third party modules
+import numpy
+
+# import local modules
+from maya_utils import anim_eval_utils
+
+
+def _curve(weighted=False):
+    """
+    a spline curve with fixed tangent angles, weighted with the weights Maya stores for the same handles.
+    """
+    inputs = [1.0, 5.0, 12.0, 20.0]
+    values = [0.0, 5.0, 2.0, 8.0]
+    in_angles = [10.0, 35.0, -20.0, 15.0]
+    out_angles = [25.0, 35.0, -20.0, 40.0]
+    curve = {
+        'inputs': inputs,
+        'values': values,
+        'inTangentTypes': ['fixed'] * 4,
+        'outTangentTypes': ['fixed'] * 4,
+        'inAngles': in_angles,
+        'outAngles': out_angles,
+        'isWeighted': weighted,
+    }
+    if weighted:
+        # animation_utils stores weight = dx / (3 * cos(angle))
+        spans = [b - a for a, b in zip(inputs, inputs[1:])]
+        curve['outWeights'] = [dx / (3.0 * math.cos(math.radians(a))) for dx, a in zip(spans, out_angles)] + [1.0]
+        curve['inWeights'] = [1.0] + [dx / (3.0 * math.cos(math.radians(a))) for dx, a in zip(spans, in_angles[1:])]
+    return curve
+
+
+def test_weighted_matches_non_weighted():
+    frames = numpy.linspace(1.0, 20.0, 58)
+    weighted = anim_eval_utils.evaluate_curve(_curve(weighted=True), frames)
+    non_weighted = anim_eval_utils.evaluate_curve(_curve(weighted=False), frames)
+    numpy.testing.assert_allclose(weighted, non_weighted, atol=1e-6)
+
+
+def test_evaluate_curves_matches_evaluate_curve():
+    random.seed(3)
+    infinity_types = ('constant', 'linear', 'cycle', 'cyclerelative', 'oscillate')
+    curves = {'weighted': _curve(weighted=True), 'single': {'inputs': [4.0], 'values': [2.5]}}
+    for i in range(12):
+        count = random.randint(2, 9)
+        inputs = sorted(random.sample(range(-20, 60), count))
+        curves['curve{}'.format(i)] = {
+            'inputs': inputs,
+            'values': [random.uniform(-5.0, 5.0) for _ in inputs],
+            'inTangentTypes': [random.choice(('spline', 'linear', 'flat', 'clamped')) for _ in inputs],
+            'outTangentTypes': [random.choice(('spline', 'linear', 'step', 'stepnext')) for _ in inputs],
+            'preInfinityType': random.choice(infinity_types),
+            'postInfinityType': random.choice(infinity_types),
+        }
+    frames = numpy.arange(-60.0, 100.0, 0.5)
+    results = anim_eval_utils.evaluate_curves(curves, frames)
+    stack = anim_eval_utils.stack_curves(curves)
+    stacked_results = anim_eval_utils.evaluate_curves(stack, frames)
+    for name, curve in curves.items():
+        expected = anim_eval_utils.evaluate_curve(curve, frames)
+        numpy.testing.assert_allclose(results[name], expected, atol=1e-9, err_msg=name)
+        numpy.testing.assert_allclose(stacked_results[name], expected, atol=1e-9, err_msg=name)
@@ -0,0 +1,22 @@
+"""
+Tests for the pure-data NURBS core.
+"""
+# import third party modules
+import numpy
+import pytest
+
+# import local modules
+from maya_utils import nurbs_kernels
+
+
+@pytest.mark.parametrize("equal_distance", (False, True))
+def test_two_points_get_a_single_midpoint(equal_distance):
+    cvs = nurbs_kernels.insert_end_midpoints([(0.0, 0.0, 0.0), (4.0, 2.0, 0.0)], equal_distance=equal_distance)
+    numpy.testing.assert_allclose(cvs, [(0.0, 0.0, 0.0), (2.0, 1.0, 0.0), (4.0, 2.0, 0.0)])
+
+
+def test_end_midpoints_are_added():
+    points = [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (4.0, 2.0, 0.0), (4.0, 6.0, 0.0)]
+    cvs = nurbs_kernels.insert_end_midpoints(points)
+    numpy.testing.assert_allclose(cvs, [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0), (4.0, 2.0, 0.0),
+                                        (4.0, 4.0, 0.0), (4.0, 6.0, 0.0)])
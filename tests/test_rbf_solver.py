@@ -0,0 +1,77 @@
+"""
+Tests for the offline RBF solver of captured weightDriver data.
+"""
+# import third party modules
+import numpy
+import pytest
+
+# import local modules
+from maya_utils import rbf_solver
+
+POSE_INPUTS = {0: (0.0, 0.0, 0.0), 1: (45.0, 0.0, 0.0), 2: (0.0, 60.0, 0.0), 3: (0.0, 0.0, -30.0)}
+POSE_VALUES = {0: (0.0, 0.0), 1: (1.0, 0.0), 2: (0.0, 1.0), 3: (0.5, 0.5)}
+
+
+def _driver_data(settings=None):
+    return {"type": rbf_solver.RBF_TYPE, "settings": settings or {},
+            "pose_inputs": dict(POSE_INPUTS), "pose_values": dict(POSE_VALUES)}
+
+
+def test_driver_settings_become_solver_options():
+    options = rbf_solver.get_driver_options(_driver_data({"kernel": 0, "radius": 25.0, "distanceType": 1}))
+    assert options == {"kernel": "linear", "radius": 25.0, "distance_type": "angle"}
+    assert rbf_solver.get_driver_options(_driver_data({"kernel": 1, "radius": 0.0})) == {"kernel": "gaussian"}
+
+
+def test_solver_uses_per_driver_settings():
+    rbf_solver.clear_cache()
+    driver_data = {"linear_driver": _driver_data({"kernel": 0}), "gaussian_driver": _driver_data({"kernel": 1})}
+    assert rbf_solver.get_solver("linear_driver", driver_data["linear_driver"]).kernel == "linear"
+    assert rbf_solver.get_solver("gaussian_driver", driver_data["gaussian_driver"]).kernel == "gaussian"
+    # keyword options override the captured settings
+    assert rbf_solver.get_solver("linear_driver", driver_data["linear_driver"], kernel="thin_plate").kernel == \
+        "thin_plate"
+
+    samples = numpy.array([[20.0, 10.0, 0.0], [0.0, 30.0, -10.0]])
+    results = rbf_solver.evaluate_drivers(driver_data, {name: samples for name in driver_data})
+    inputs, values, _ = rbf_solver.get_pose_arrays(driver_data["linear_driver"])
+    expected = rbf_solver.RBFSolver(inputs, values, kernel="linear").evaluate(samples)
+    numpy.testing.assert_allclose(results["linear_driver"], expected)
+    assert not numpy.allclose(results["linear_driver"], results["gaussian_driver"])
+
+
+@pytest.mark.parametrize("distance_type", rbf_solver.DISTANCE_TYPES)
+def test_solver_reproduces_poses(distance_type):
+    inputs, values, _ = rbf_solver.get_pose_arrays(_driver_data())
+    # the angle between the rest pose and any other pose is undefined, leave it out
+    solver = rbf_solver.RBFSolver(inputs[1:], values[1:], distance_type=distance_type)
+    assert solver.validate() < 1e-6
+
+
+def test_weight_driver_matches_scene_output():
+    standalone = pytest.importorskip('maya.standalone')
+    standalone.initialize()
+    from maya import cmds
+    from maya_utils import rbf_utils
+
+    try:
+        rbf_utils.load_plugins()
+    except (RuntimeError, ValueError):
+        pytest.skip("the weightDriver plugin is not available.")
+    cmds.file(new=True, force=True)
+    driver = cmds.createNode('transform', name='driver')
+    driven = cmds.createNode('transform', name='driven')
+    driver_data = {"test": {
+        "type": rbf_solver.RBF_TYPE,
+        "settings": {"kernel": 1, "distanceType": 0},
+        "driver_attrs": tuple(driver + '.rotate' + axis for axis in 'XYZ'),
+        "driven_attrs": (driven + '.translateX', driven + '.translateY'),
+        "num_poses": sorted(POSE_INPUTS),
+        "pose_inputs": dict(POSE_INPUTS),
+        "pose_values": dict(POSE_VALUES),
+    }}
+    weight_driver = rbf_utils.setup_weight_drivers(driver_data)[0]
+    cmds.setAttr(driver + '.rotate', 20.0, 30.0, -10.0)
+    weight_driver = cmds.listRelatives(weight_driver, shapes=True)[0]
+    solver_values, scene_values, difference = rbf_utils.compare_weight_driver(weight_driver)
+    assert difference < 1e-3, (solver_values, scene_values)
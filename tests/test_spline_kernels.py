@@ -0,0 +1,30 @@
+"""
+Tests for the batched spline evaluation.
+"""
+# import third party modules
+import numpy
+import pytest
+
+# import local modules
+from maya_utils import spline_kernels
+
+
+@pytest.mark.parametrize("clamped", (True, False))
+def test_bspline_needs_more_points_than_the_degree(clamped):
+    with pytest.raises(ValueError):
+        spline_kernels.uniform_knots(3, degree=3, clamped=clamped)
+    with pytest.raises(ValueError):
+        spline_kernels.evaluate_bspline([(0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (2.0, 0.0, 0.0)], [0.0, 0.5, 1.0])
+
+
+def test_clamped_bspline_passes_through_the_end_points():
+    points = [(0.0, 0.0, 0.0), (1.0, 2.0, 0.0), (3.0, 2.0, 0.0), (4.0, 0.0, 0.0)]
+    positions = spline_kernels.evaluate_bspline(points, [0.0, 1.0])
+    numpy.testing.assert_allclose(positions, [points[0], points[-1]])
+
+
+def test_bezier_parameters_are_not_clamped():
+    points = [(0.0, 0.0, 0.0), (1.0, 2.0, 0.0), (2.0, 0.0, 0.0)]
+    positions = spline_kernels.evaluate_bezier(points, [-0.5, 1.5])
+    # the quadratic Bernstein polynomials extrapolate past the end points
+    numpy.testing.assert_allclose(positions, [(-1.0, -3.0, 0.0), (3.0, -3.0, 0.0)])
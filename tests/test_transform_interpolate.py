@@ -0,0 +1,39 @@
+"""
+Tests for the offline preview of the spline interpolation rig.
+"""
+# import third party modules
+import numpy
+import pytest
+
+
+@pytest.mark.parametrize("tangent_type", ("spline", "linear", "flat"))
+def test_envelopes_match_the_driven_keys(tangent_type):
+    standalone = pytest.importorskip('maya.standalone')
+    standalone.initialize()
+    pytest.importorskip('pymel.core')
+    from maya import cmds
+    from rig_utils import transform_interpolate
+
+    cmds.file(new=True, force=True)
+    in_type, out_type = transform_interpolate.get_default_tangent_types()
+    cmds.keyTangent(g=True, inTangentType=tangent_type, outTangentType=tangent_type)
+    try:
+        control = cmds.createNode('transform', name='control')
+        cmds.addAttr(control, ln='interpolate', at='float', min=-1.0, max=1.0, keyable=True)
+        percentages = (0.2, 0.5, 0.8)
+        driven_attrs = []
+        for idx, percentage in enumerate(percentages):
+            driven = cmds.createNode('transform', name='driven{}'.format(idx))
+            cmds.addAttr(driven, ln='envelope', at='float', keyable=True)
+            for driver_value, value in ((-1.0, 0.0), (0.0, percentage), (1.0, 1.0)):
+                transform_interpolate.add_float_smooth_interpolation_at_value(
+                    control + '.interpolate', driven + '.envelope', driver_value=driver_value, value=value)
+            driven_attrs.append(driven + '.envelope')
+
+        for value in (-1.0, -0.6, -0.25, 0.0, 0.3, 0.75, 1.0):
+            cmds.setAttr(control + '.interpolate', value)
+            keyed = [cmds.getAttr(attr) for attr in driven_attrs]
+            envelopes = transform_interpolate.get_spline_interpolate_envelopes(percentages, value)
+            numpy.testing.assert_allclose(envelopes, keyed, atol=1e-4)
+    finally:
+        cmds.keyTangent(g=True, inTangentType=in_type, outTangentType=out_type)
@@ -9,10 +9,13 @@ Versions:
 """
 # import standard modules
 from pprint import pprint
+import json
 import re
 
 # import maya modules
 from maya import cmds
+from maya import OpenMaya
+from maya import OpenMayaAnim
 
 # import local modules
 import read_sides
@@ -50,6 +53,9 @@ SIDES = read_sides.Sides()
 MIRROR_SIDES = read_sides.MirrorSides()
 AXES = read_sides.Axes()
 
+# the driven attributes whose values flip sign when mirrored across X
+MIRROR_SIGN_ATTRIBUTES = ('translateX', 'rotateY', 'rotateZ')
+
 attr_connect = object_utils.attr_connect
 attr_add_float = object_utils.attr_add_float
 attr_name = object_utils.attr_name
@@ -332,6 +338,7 @@ def remove_single_key_nodes():
 def copy_keys_left_to_right(interface_ctrl="", mirror_interface=True):
     """
     copy the keys from left to right. Please specify which interface driver controller the copy neecs to go to.
+    all the driven key curves of the selected controllers are captured at once, then written in one batch.
     :param interface_ctrl: <bool> the driver interface.
     :param mirror_interface: <bool> mirror the interface controller as well.
     :return: <bool> True for success. <bool> False for failure.
@@ -341,32 +348,210 @@ def copy_keys_left_to_right(interface_ctrl="", mirror_interface=True):
     else:
         mirror_interface_ctrl = interface_ctrl
 
+    # map the driven groups to their opposing side driven groups
+    driven_nodes = {}
     for sel_obj in object_utils.get_selected_objects_gen():
-        # get the opposing side string
         mirror_sel_obj = MIRROR_SIDES.replace_side_string(sel_obj)
-
-        # trim anim data
         driven_object = _get_interface_grp_name([sel_obj, interface_ctrl])
-        anim_data = get_anim_data(sel_obj)
-        if driven_object not in anim_data:
-            continue
+        driven_nodes[driven_object] = _get_interface_grp_name([mirror_sel_obj, mirror_interface_ctrl])
+    if not driven_nodes:
+        return False
 
-        # copy the animation data
-        copy_keys_on_selected(
-            selected_object=sel_obj,
-            copy_to_object=mirror_sel_obj,
-            copy_to_interface_ctrl=mirror_interface_ctrl,
-            anim_data=anim_data[driven_object],
-            mirror=True)
-    print('[MirrorKeys] :: Done.')
+    mirror_system_control = find_face_system_controller(mirror_interface_ctrl)[0]
+    curves = get_driven_key_curves(driven_nodes.keys())
+    mirrored_curves = mirror_driven_key_curves(curves, driven_nodes, mirror_system_control)
+    apply_driven_key_curves(mirrored_curves)
+    print('[MirrorKeys] :: {} curves mirrored. Done.'.format(len(mirrored_curves)))
     return True
 
 
-def find_non_zero_on_face_controllers():
+def get_driven_key_curves(driven_nodes=()):
+    """
+    captures every driven key curve driving the nodes, including the curves blended through blendWeighted nodes.
+    :param driven_nodes: <list> the driven node names.
+    :return: <list> dictionaries of curve, driver plug, driven plug and the curve data arrays.
+    """
+    curves = []
+    for driven_node in driven_nodes:
+        if not cmds.objExists(driven_node):
+            continue
+        connections = cmds.listConnections(driven_node, source=True, destination=False, connections=True,
+                                           plugs=True, skipConversionNodes=True) or []
+        for driven_plug, source_plug in zip(connections[::2], connections[1::2]):
+            source_node = source_plug.split('.')[0]
+            if cmds.nodeType(source_node) == 'blendWeighted':
+                curve_nodes = cmds.listConnections(source_node + '.input', source=True, destination=False,
+                                                   type='animCurve', skipConversionNodes=True) or []
+            elif cmds.objectType(source_node, isAType='animCurve'):
+                curve_nodes = [source_node]
+            else:
+                continue
+            for curve_node in curve_nodes:
+                driver_plugs = cmds.listConnections(curve_node + '.input', source=True, destination=False,
+                                                    plugs=True, skipConversionNodes=True)
+                # time driven curves are not driven keys
+                if not driver_plugs:
+                    continue
+                curves.append({
+                    'curve': curve_node,
+                    'driver': driver_plugs[0],
+                    'driven': driven_plug,
+                    'data': animation_utils.get_anim_curve_arrays(animation_utils.get_mfn_anim_node(curve_node)),
+                })
+    return curves
+
+
+def mirror_driven_key_curves(curves=(), driven_nodes=None, mirror_driver_node=""):
+    """
+    computes the mirrored driven key curves, flipping the values of the MIRROR_SIGN_ATTRIBUTES.
+    :param curves: <list> captured curves from get_driven_key_curves.
+    :param driven_nodes: <dict> driven node to mirrored driven node names.
+    :param mirror_driver_node: <str> the mirrored driver node, the driver attributes are kept.
+    :return: <list> mirrored curve dictionaries.
+    """
+    mirrored_curves = []
+    for curve in curves:
+        driven_node, driven_attr = curve['driven'].split('.', 1)
+        driver_attr = curve['driver'].split('.', 1)[-1]
+        data = dict(curve['data'])
+        if driven_attr in MIRROR_SIGN_ATTRIBUTES:
+            for key in ('values', 'inAngles', 'outAngles'):
+                data[key] = [-v for v in data[key]]
+        mirrored_curves.append({
+            'curve': curve['curve'],
+            'driver': '{}.{}'.format(mirror_driver_node, driver_attr),
+            'driven': '{}.{}'.format(driven_nodes.get(driven_node, driven_node), driven_attr),
+            'data': data,
+        })
+    return mirrored_curves
+
+
+def get_driven_key_curve_map(driver_plug=""):
+    """
+    maps every plug driven by the driver plug to its driven key curve, directly or through a blendWeighted node.
+    :param driver_plug: <str> driver node.attribute.
+    :return: <dict> driven node.attribute to anim curve node.
+    """
+    curve_map = {}
+    curve_nodes = cmds.listConnections(driver_plug, source=False, destination=True,
+                                       type='animCurve', skipConversionNodes=True) or []
+    for curve_node in curve_nodes:
+        destinations = cmds.listConnections(curve_node + '.output', source=False, destination=True,
+                                            plugs=True, skipConversionNodes=True) or []
+        for destination in destinations:
+            curve_map.setdefault(destination, curve_node)
+            destination_node = destination.split('.')[0]
+            if cmds.nodeType(destination_node) == 'blendWeighted':
+                blend_destinations = cmds.listConnections(destination_node + '.output', source=False,
+                                                          destination=True, plugs=True,
+                                                          skipConversionNodes=True) or []
+                for blend_destination in blend_destinations:
+                    curve_map.setdefault(blend_destination, curve_node)
+    return curve_map
+
+
+def find_driven_key_curve(driver_plug="", driven_plug=""):
+    """
+    finds the driven key curve between the driver and the driven plug.
+    :param driver_plug: <str> driver node.attribute.
+    :param driven_plug: <str> driven node.attribute.
+    :return: <str> anim curve node. <None> if not found.
+    """
+    return get_driven_key_curve_map(driver_plug).get(driven_plug)
+
+
+def apply_driven_key_curves(curves=()):
+    """
+    writes the driven key curves in one batch, undone with a single undo.
+    the driven key curves of each driver are looked up once, then the missing curves are created and every curve
+    has its keys replaced in bulk from the animCurveEdit command, so the whole edit is a single undo.
+    :param curves: <list> curve dictionaries from get_driven_key_curves or mirror_driven_key_curves.
+    :return: <list> the driven key curve names written.
+    """
+    curve_maps = {}
+    targets = []
+    for curve in curves:
+        if not curve['data']['inputs']:
+            continue
+        if curve['driver'] not in curve_maps:
+            curve_maps[curve['driver']] = get_driven_key_curve_map(curve['driver'])
+        targets.append((curve_maps[curve['driver']].get(curve['driven']), curve['driver'], curve['driven'],
+                        curve['data']))
+    if not targets:
+        return []
+    return animation_utils.run_curve_edit(_write_driven_key_curves, targets)
+
+
+def _write_driven_key_curves(targets=(), m_curve_change=None, m_dag_mod=None):
+    """
+    the apply_driven_key_curves edit, run from the animCurveEdit command.
+    :param targets: <list> curve node, or None when missing, driver plug, driven plug and curve data.
+    :return: <list> the driven key curve names written.
+    """
+    curve_nodes = []
+    for curve_node, driver_plug, driven_plug, data in targets:
+        if curve_node:
+            anim_fn = animation_utils.get_mfn_anim_node(curve_node)
+        else:
+            anim_fn = _create_driven_key_curve(driver_plug, driven_plug, data['curveType'], m_dag_mod)
+        animation_utils.apply_anim_curve_arrays_to_curve(anim_fn, data, m_curve_change=m_curve_change)
+        curve_nodes.append(anim_fn.name())
+    return curve_nodes
+
+
+def _create_driven_key_curve(driver_plug="", driven_plug="", curve_type=None, m_dag_mod=None):
+    """
+    creates the driven key curve with the modifier, driven by the driver plug's output.
+    the curve drives the plug directly, or is blended in with a blendWeighted node when the plug already has an
+    input, as setDrivenKeyframe does with insertBlend.
+    :param driver_plug: <str> driver node.attribute.
+    :param driven_plug: <str> driven node.attribute.
+    :param curve_type: <int> MFnAnimCurve.AnimCurveType to create.
+    :param m_dag_mod: <OpenMaya.MDGModifier> modifier used for creating and connecting the nodes.
+    :return: <OpenMayaAnim.MFnAnimCurve> anim curve function set.
+    """
+    driver = object_utils.get_plug(*driver_plug.split('.', 1))
+    driven = object_utils.get_plug(*driven_plug.split('.', 1))
+    anim_fn = OpenMayaAnim.MFnAnimCurve()
+    curve_obj = anim_fn.create(curve_type, m_dag_mod)
+    m_dag_mod.renameNode(curve_obj, driven_plug.split('|')[-1].replace('.', '_'))
+    m_dag_mod.doIt()
+
+    curve_fn = OpenMaya.MFnDependencyNode(curve_obj)
+    curve_output = curve_fn.findPlug('output', False)
+    m_dag_mod.connect(driver, curve_fn.findPlug('input', False))
+
+    sources = OpenMaya.MPlugArray()
+    driven.connectedTo(sources, True, False)
+    if not sources.length():
+        m_dag_mod.connect(curve_output, driven)
+    elif OpenMaya.MFnDependencyNode(sources[0].node()).typeName() == 'blendWeighted':
+        blend_input = OpenMaya.MFnDependencyNode(sources[0].node()).findPlug('input', False)
+        indices = OpenMaya.MIntArray()
+        blend_input.getExistingArrayAttributeIndices(indices)
+        next_index = max(indices[i] for i in range(indices.length())) + 1 if indices.length() else 0
+        m_dag_mod.connect(curve_output, blend_input.elementByLogicalIndex(next_index))
+    else:
+        blend_obj = m_dag_mod.createNode('blendWeighted')
+        m_dag_mod.doIt()
+        blend_fn = OpenMaya.MFnDependencyNode(blend_obj)
+        blend_input = blend_fn.findPlug('input', False)
+        m_dag_mod.disconnect(sources[0], driven)
+        m_dag_mod.connect(sources[0], blend_input.elementByLogicalIndex(0))
+        m_dag_mod.connect(curve_output, blend_input.elementByLogicalIndex(1))
+        m_dag_mod.connect(blend_fn.findPlug('output', False), driven)
+    m_dag_mod.doIt()
+    return anim_fn
+
+
+def find_non_zero_on_face_controllers(snapshot=None):
     """
     return a tuple list of all available controllers.
+    :param snapshot: <FaceNetworkSnapshot> answer from the attribute values captured in this snapshot.
     :return: <tuple> list of all available controllers
     """
+    if snapshot is not None:
+        return tuple(snapshot.non_zero_nodes(find_face_controls(on_face=True)))
     ctrl_names = []
     controllers = find_face_controls(on_face=True)
     for ctrl_name in controllers:
@@ -403,25 +588,31 @@ def get_list_index(ls_object=[], find_str=""):
         return -1
 
 
-def get_blend_weighted_items(driven_object, driven_attr):
+def get_blend_weighted_items(driven_object, driven_attr, snapshot=None):
     """
     get blend weighteed objects.
     :param driven_object:
     :param driven_attr:
+    :param snapshot: <FaceNetworkSnapshot> answer from this snapshot instead of querying the scene.
     :return:
     """
+    if snapshot is not None:
+        return [round(x, 4) for x in snapshot.blend_weighted_values(driven_object, driven_attr)]
     return map(lambda x: round(x, 4), animation_utils.get_blend_weighted_values(
         node_name=driven_object, target_attr=driven_attr)[0])
 
 
-def get_weighted_values_length(driven_object, driven_attr):
+def get_weighted_values_length(driven_object, driven_attr, snapshot=None):
     """
     Get the length of all non-zero weighted values.
     :param driven_object: <str> the driven object to get connections frOpenMaya.
     :param driven_attr: <str> the driven attribute to get the weighted values frOpenMaya.
+    :param snapshot: <FaceNetworkSnapshot> answer from this snapshot instead of querying the scene.
     :return: <int> length.
     """
     rounder = lambda x: round(x, 4)
+    if snapshot is not None:
+        return len([x for x in snapshot.blend_weighted_values(driven_object, driven_attr) if rounder(x)])
     weighted_values = animation_utils.get_blend_weighted_values(
         node_name=driven_object, target_attr=driven_attr)
     if weighted_values:
@@ -431,15 +622,18 @@ def get_weighted_values_length(driven_object, driven_attr):
         return 0
 
 
-def get_original_weight_value(driven_object, driven_attr, interface_node, face_attr):
+def get_original_weight_value(driven_object, driven_attr, interface_node, face_attr, snapshot=None):
     """
     get the weight value from the blend weighted node. If no blendWeighted node is found, return default 0.0
     :param driven_object: <str> the driven object to get connections frOpenMaya.
     :param driven_attr: <str> the driven attribute to get the weighted values frOpenMaya.
     :param interface_node: <str> the driver interface controller.
     :param face_attr: <str> the face driver attribute.
+    :param snapshot: <FaceNetworkSnapshot> answer from this snapshot instead of querying the scene.
     :return: <float> the weighted float value.
     """
+    if snapshot is not None:
+        return snapshot.driver_input_value(driven_object, driven_attr, '{}.{}'.format(interface_node, face_attr))
     weighted_values = animation_utils.get_blend_weighted_values(
         node_name=driven_object, target_attr=driven_attr)
     if not weighted_values:
@@ -512,9 +706,10 @@ def interface_controllers_gen():
     return iter(find_face_controls(interface=True))
 
 
-def inspect_interface_attributes():
+def inspect_interface_attributes(snapshot=None):
     """
     prints the selected controller attributes.
+    :param snapshot: <FaceNetworkSnapshot> print the attribute values captured in this snapshot.
     :return: <bool> True for success.
     """
     s_ctrls = object_utils.get_selected_node(single=False)
@@ -522,6 +717,9 @@ def inspect_interface_attributes():
         # face_loc = find_face_system_controller(f_ctrl)
         # if not face_loc:
         face_loc = find_system_locator(f_ctrl)
+        if snapshot is not None:
+            print(f_ctrl, face_loc, ">>", snapshot.keyable_attributes(face_loc[0]))
+            continue
         attr = attribute_utils.Attributes(face_loc[0], custom=1, keyable=True)
         print(f_ctrl, face_loc, ">>", attr.__dict__())
         # print(get_specified_key_time(face_loc))
@@ -1050,6 +1248,360 @@ def get_anim_data(nodes=()):
     return return_dict
 
 
+def _plug_name(plug):
+    """
+    the node.attribute name of the plug with long attribute names.
+    :param plug: <OpenMaya.MPlug> the plug.
+    :return: <str> plug name.
+    """
+    return plug.partialName(True, False, False, False, False, True)
+
+
+def _get_source_plug(plug):
+    """
+    the plug connected into the plug, skipping unitConversion nodes.
+    :param plug: <OpenMaya.MPlug> the destination plug.
+    :return: <OpenMaya.MPlug> source plug. <None> if not connected.
+    """
+    plugs = OpenMaya.MPlugArray()
+    plug.connectedTo(plugs, True, False)
+    while plugs.length():
+        source_plug = plugs[0]
+        if not source_plug.node().hasFn(OpenMaya.MFn.kUnitConversion):
+            return source_plug
+        OpenMaya.MFnDependencyNode(source_plug.node()).findPlug('input').connectedTo(plugs, True, False)
+    return None
+
+
+def _get_destination_plugs(plug):
+    """
+    the plugs the plug is connected to, skipping unitConversion nodes.
+    :param plug: <OpenMaya.MPlug> the source plug.
+    :return: <list> destination plugs.
+    """
+    found_plugs = []
+    plugs = OpenMaya.MPlugArray()
+    plug.connectedTo(plugs, False, True)
+    for i in range(plugs.length()):
+        if plugs[i].node().hasFn(OpenMaya.MFn.kUnitConversion):
+            conversion_fn = OpenMaya.MFnDependencyNode(plugs[i].node())
+            found_plugs.extend(_get_destination_plugs(conversion_fn.findPlug('output')))
+        else:
+            found_plugs.append(plugs[i])
+    return found_plugs
+
+
+class FaceNetworkSnapshot(object):
+    """
+    In-memory snapshot of the face set driven key network: the driver plugs, the driven key curves,
+    the blendWeighted inputs and the driven plugs, captured with one traversal of the dependency graph,
+    with the keyable attribute values of the face controllers and their system locators.
+    Queries are answered from the snapshot and snapshots can be saved and compared.
+    Usage:
+        snapshot = FaceNetworkSnapshot()
+        snapshot.capture()
+        get_weighted_values_length(driven_object, driven_attr, snapshot=snapshot)
+        FaceNetworkSnapshot().read(file_name).diff(snapshot)
+    """
+    def __init__(self, data=None):
+        self.curves = {}
+        self.blend_weighted = {}
+        self.drivers = {}
+        self.driven = {}
+        self.attributes = {}
+        self.keyable = {}
+        if data:
+            self.from_dict(data)
+
+    def capture(self):
+        """
+        traverses the animation curves and blendWeighted nodes in the scene once.
+        :return: <FaceNetworkSnapshot> self.
+        """
+        self.__init__()
+        filter_list = OpenMaya.MIntArray()
+        filter_list.append(OpenMaya.MFn.kAnimCurve)
+        filter_list.append(OpenMaya.MFn.kBlendWeighted)
+        type_filter = OpenMaya.MIteratorType()
+        type_filter.setFilterList(filter_list)
+        node_iter = OpenMaya.MItDependencyNodes(type_filter)
+        plug_values = {}
+        while not node_iter.isDone():
+            node = node_iter.thisNode()
+            node_fn = OpenMaya.MFnDependencyNode(node)
+            if node.hasFn(OpenMaya.MFn.kAnimCurve):
+                driver_plug = _get_source_plug(node_fn.findPlug('input'))
+                # time driven curves are not driven keys
+                if driver_plug is not None:
+                    driver_name = _plug_name(driver_plug)
+                    plug_values[driver_name] = driver_plug.asDouble()
+                    output_plugs = _get_destination_plugs(node_fn.findPlug('output'))
+                    for output_plug in output_plugs:
+                        if not output_plug.node().hasFn(OpenMaya.MFn.kBlendWeighted):
+                            plug_values[_plug_name(output_plug)] = output_plug.asDouble()
+                    self.curves[node_fn.name()] = {
+                        'driver': driver_name,
+                        'outputs': [_plug_name(p) for p in output_plugs],
+                        'data': animation_utils.get_anim_curve_arrays(OpenMayaAnim.MFnAnimCurve(node)),
+                    }
+            else:
+                inputs = {}
+                input_plug = node_fn.findPlug('input')
+                for i in range(input_plug.numElements()):
+                    element = input_plug.elementByPhysicalIndex(i)
+                    source_plug = _get_source_plug(element)
+                    inputs[str(element.logicalIndex())] = {
+                        'source': _plug_name(source_plug) if source_plug is not None else '',
+                        'value': element.asDouble(),
+                    }
+                weights = {}
+                weight_plug = node_fn.findPlug('weight')
+                for i in range(weight_plug.numElements()):
+                    element = weight_plug.elementByPhysicalIndex(i)
+                    weights[str(element.logicalIndex())] = element.asDouble()
+                driven_plugs = _get_destination_plugs(node_fn.findPlug('output'))
+                for driven_plug in driven_plugs:
+                    plug_values[_plug_name(driven_plug)] = driven_plug.asDouble()
+                self.blend_weighted[node_fn.name()] = {
+                    'inputs': inputs,
+                    'weights': weights,
+                    'value': node_fn.findPlug('output').asDouble(),
+                    'driven': [_plug_name(p) for p in driven_plugs],
+                }
+            node_iter.next()
+        self._capture_keyable_values()
+        self._build_lookups(plug_values)
+        return self
+
+    def _capture_keyable_values(self):
+        """
+        reads the keyable attribute values of the face controllers and the custom keyable attribute values
+        of their system locators, the same values the Attributes class reads in the scene.
+        """
+        controllers = []
+        for find_kwargs in ({'on_face': True}, {'interface': True}):
+            found = find_face_controls(**find_kwargs)
+            if not isinstance(found, Exception) and found:
+                controllers.extend(found)
+        for ctrl_name in controllers:
+            if ctrl_name not in self.keyable:
+                self.keyable[ctrl_name] = dict(attribute_utils.Attributes(ctrl_name, keyable=True).items())
+            locator_names = find_system_locator(ctrl_name) or ()
+            if isinstance(locator_names, str):
+                locator_names = (locator_names,)
+            for locator_name in locator_names:
+                if locator_name not in self.keyable:
+                    self.keyable[locator_name] = dict(
+                        attribute_utils.Attributes(locator_name, custom=1, keyable=True).items())
+
+    def _build_lookups(self, plug_values=None):
+        """
+        resolves every curve to its final driven plugs and fills the driver, driven and attribute lookups.
+        :param plug_values: <dict> driver and driven plug values captured from the scene.
+        """
+        for curve_name, curve in self.curves.items():
+            driven_plugs = []
+            for output in curve['outputs']:
+                output_node = output.split('.')[0]
+                if output_node in self.blend_weighted:
+                    driven_plugs.extend(self.blend_weighted[output_node]['driven'])
+                else:
+                    driven_plugs.append(output)
+            curve['driven'] = driven_plugs
+            self.drivers.setdefault(curve['driver'], []).append(curve_name)
+            for driven_plug in driven_plugs:
+                self.driven.setdefault(driven_plug, {'curves': [], 'blendWeighted': ''})
+                self.driven[driven_plug]['curves'].append(curve_name)
+        for blend_name, blend in self.blend_weighted.items():
+            for driven_plug in blend['driven']:
+                self.driven.setdefault(driven_plug, {'curves': [], 'blendWeighted': ''})
+                self.driven[driven_plug]['blendWeighted'] = blend_name
+        for plug, value in (plug_values or {}).items():
+            node_name, attr = plug.split('.', 1)
+            self.attributes.setdefault(node_name, {})[attr] = value
+        for node_name, values in self.keyable.items():
+            self.attributes.setdefault(node_name, {}).update(values)
+
+    def blend_weighted_values(self, driven_object="", driven_attr=""):
+        """
+        the blendWeighted input values blended into the driven attribute.
+        :param driven_object: <str> the driven object.
+        :param driven_attr: <str> the driven attribute.
+        :return: <list> input values in logical index order.
+        """
+        driven = self.driven.get('{}.{}'.format(driven_object, driven_attr))
+        if not driven or not driven['blendWeighted']:
+            return []
+        inputs = self.blend_weighted[driven['blendWeighted']]['inputs']
+        return [inputs[k]['value'] for k in sorted(inputs, key=int)]
+
+    def blend_weighted_sum(self, driven_object="", driven_attr=""):
+        """
+        the sum of the blendWeighted input values blended into the driven attribute.
+        :param driven_object: <str> the driven object.
+        :param driven_attr: <str> the driven attribute.
+        :return: <float> sum of values.
+        """
+        return sum(self.blend_weighted_values(driven_object, driven_attr))
+
+    def driver_input_value(self, driven_object="", driven_attr="", driver_plug=""):
+        """
+        the blendWeighted input value coming from the driver.
+        :param driven_object: <str> the driven object.
+        :param driven_attr: <str> the driven attribute.
+        :param driver_plug: <str> the driver node.attribute.
+        :return: <float> input value, 0.0 if the driver does not drive the attribute.
+        """
+        driven = self.driven.get('{}.{}'.format(driven_object, driven_attr))
+        if not driven or not driven['blendWeighted']:
+            return 0.0
+        driver_curves = set(self.drivers.get(driver_plug, ()))
+        for blend_input in self.blend_weighted[driven['blendWeighted']]['inputs'].values():
+            if blend_input['source'].split('.')[0] in driver_curves:
+                return blend_input['value']
+        return 0.0
+
+    def curves_for_driver(self, driver_node=""):
+        """
+        the driven key curves driven by the node.
+        :param driver_node: <str> driver node or node.attribute.
+        :return: <list> anim curve names.
+        """
+        if '.' in driver_node:
+            return list(self.drivers.get(driver_node, ()))
+        return [c for plug, curves in self.drivers.items() if plug.split('.')[0] == driver_node for c in curves]
+
+    def curves_for_driven(self, driven_node=""):
+        """
+        the driven key curves driving the node.
+        :param driven_node: <str> driven node or node.attribute.
+        :return: <list> anim curve names.
+        """
+        if '.' in driven_node:
+            return list(self.driven.get(driven_node, {}).get('curves', ()))
+        return [c for plug, driven in self.driven.items() if plug.split('.')[0] == driven_node
+                for c in driven['curves']]
+
+    def node_attributes(self, node_name="", prefix=""):
+        """
+        the captured driver or driven attribute values of the node.
+        :param node_name: <str> node name.
+        :param prefix: <str> only the attributes starting with this prefix.
+        :return: <dict> attribute values.
+        """
+        return dict((a, v) for a, v in self.attributes.get(node_name, {}).items() if a.startswith(prefix))
+
+    def keyable_attributes(self, node_name=""):
+        """
+        the captured keyable attribute values of the face controller or system locator.
+        :param node_name: <str> node name.
+        :return: <dict> attribute values.
+        """
+        return dict(self.keyable.get(node_name, {}))
+
+    def non_zero_nodes(self, node_names=None):
+        """
+        the nodes with captured non-default keyable attribute values, the same test as
+        Attributes.non_zero_attributes. Nodes without keyable values fall back to their driver and driven values.
+        :param node_names: <list> only check these nodes.
+        :return: <list> node names.
+        """
+        if node_names is None:
+            node_names = self.attributes.keys()
+        non_zero_nodes = []
+        for node_name in node_names:
+            if node_name in self.keyable:
+                if attribute_utils.get_non_zero_values(self.keyable[node_name]):
+                    non_zero_nodes.append(node_name)
+            elif any(round(v, 4) for v in self.attributes.get(node_name, {}).values()):
+                non_zero_nodes.append(node_name)
+        return non_zero_nodes
+
+    def connections(self):
+        """
+        the driven key connections keyed by driver and driven plugs, which stay the same across scenes.
+        :return: <dict> {driver >> driven: curve name}
+        """
+        connections = {}
+        for curve_name, curve in self.curves.items():
+            for driven_plug in curve['driven']:
+                connections['{} >> {}'.format(curve['driver'], driven_plug)] = curve_name
+        return connections
+
+    def diff(self, other, tolerance=0.0001):
+        """
+        compares this snapshot against another snapshot.
+        :param other: <FaceNetworkSnapshot> the snapshot to compare against.
+        :param tolerance: <float> value difference tolerance.
+        :return: <dict> added, removed: connections only in the other or this snapshot,
+                        changed: {connection: differing curve fields}.
+        """
+        connections = self.connections()
+        other_connections = other.connections()
+        changed = {}
+        for connection in set(connections) & set(other_connections):
+            data = self.curves[connections[connection]]['data']
+            other_data = other.curves[other_connections[connection]]['data']
+            fields = []
+            for field in ('inputs', 'values', 'inAngles', 'outAngles', 'inWeights', 'outWeights'):
+                values = data.get(field, ())
+                other_values = other_data.get(field, ())
+                if len(values) != len(other_values) or any(
+                        abs(a - b) > tolerance for a, b in zip(values, other_values)):
+                    fields.append(field)
+            for field in ('inTangentTypes', 'outTangentTypes', 'preInfinityType', 'postInfinityType'):
+                if data.get(field) != other_data.get(field):
+                    fields.append(field)
+            if fields:
+                changed[connection] = fields
+        return {
+            'added': sorted(set(other_connections) - set(connections)),
+            'removed': sorted(set(connections) - set(other_connections)),
+            'changed': changed,
+        }
+
+    def to_dict(self):
+        """
+        the snapshot as plain data.
+        :return: <dict> snapshot data.
+        """
+        return {'curves': self.curves, 'blendWeighted': self.blend_weighted, 'attributes': self.attributes,
+                'keyable': self.keyable}
+
+    def from_dict(self, data):
+        """
+        loads the snapshot from plain data.
+        :param data: <dict> snapshot data from to_dict.
+        :return: <FaceNetworkSnapshot> self.
+        """
+        self.__init__()
+        self.curves = data.get('curves', {})
+        self.blend_weighted = data.get('blendWeighted', {})
+        self._build_lookups()
+        self.attributes = data.get('attributes', {})
+        self.keyable = data.get('keyable', {})
+        return self
+
+    def write(self, file_name=""):
+        """
+        saves the snapshot as json.
+        :param file_name: <str> file name.
+        :return: <str> file name.
+        """
+        with open(file_name, 'w') as json_file:
+            json.dump(self.to_dict(), json_file, sort_keys=True)
+        return file_name
+
+    def read(self, file_name=""):
+        """
+        loads the snapshot from json.
+        :param file_name: <str> file name.
+        :return: <FaceNetworkSnapshot> self.
+        """
+        with open(file_name, 'r') as json_file:
+            return self.from_dict(json.load(json_file))
+
+
 class MirrorList(object):
     Mirror_Sides = read_sides.MirrorSides()
     """
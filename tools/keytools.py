@@ -190,7 +190,7 @@ def prune_keyframes_from_object_str(node, angle_tolerance=0.001, value_tolerance
                              with_undo=with_undo)
 
 
-def prune_keyframes_from_obj(node, angle_tolerance=0.001, value_tolerance=0.001, with_undo=True):
+def prune_keyframes_from_obj(node, angle_tolerance=0.001, value_tolerance=0.001, with_undo=True, dry_run=False):
     """Prunes all keyframe objects from the selected objects.
 
     Args:
@@ -198,127 +198,253 @@ def prune_keyframes_from_obj(node, angle_tolerance=0.001, value_tolerance=0.001,
         angle_tolerance (float): Tangents with angles below this value will be considered flat.
         value_tolerance (float): Neighboring values that fall within this tolerance will be considered matching.
         with_undo (bool): performs the operation with undo capability, otherwise proceed with OpenMaya cutting of keys.
+        dry_run (bool): only report the keys that would be removed.
 
     Returns:
+        (dict): prune report, see prune_keyframes_from_curves.
 
     """
-    total_keys_deleted = 0
     transform_name = OpenMaya.MFnDependencyNode(node).name()
     anim_node_iter = get_connected_upstream_node_type_iter(node, OpenMaya.MFn.kAnimCurve, full_name=False)
-    obj_key_length = 0
-    data_collection_time = 0.0
-    deletion_time = 0.0
+    report = prune_keyframes_from_curves(anim_node_iter, angle_tolerance=angle_tolerance,
+                                         value_tolerance=value_tolerance, with_undo=with_undo, dry_run=dry_run)
+    print_prune_report(report, label=transform_name)
+    return report
+
+
+def prune_scene_keyframes(angle_tolerance=0.001, value_tolerance=0.001, with_undo=True, dry_run=False):
+    """Prunes the redundant keys of every animation curve in the scene.
+
+    Args:
+        angle_tolerance (float): Tangents with angles below this value will be considered flat.
+        value_tolerance (float): Neighboring values that fall within this tolerance will be considered matching.
+        with_undo (bool): performs the operation with undo capability, otherwise proceed with OpenMaya cutting of keys.
+        dry_run (bool): only report the keys that would be removed.
+
+    Returns:
+        (dict): prune report, see prune_keyframes_from_curves.
+
+    """
+    report = prune_keyframes_from_curves(get_scene_anim_node_iter(), angle_tolerance=angle_tolerance,
+                                         value_tolerance=value_tolerance, with_undo=with_undo, dry_run=dry_run)
+    print_prune_report(report, label="scene")
+    return report
+
+
+def prune_keyframes_from_curves(anim_curve_objects, angle_tolerance=0.001, value_tolerance=0.001,
+                                with_undo=True, dry_run=False):
+    """Prunes redundant keys from the animation curves.
+    All curves are loaded into flat arrays first, the prune mask is computed for every key at once,
+    then the keys are cut in batches.
+
+    Args:
+        anim_curve_objects (iterable): OpenMaya.MObject animation curve nodes.
+        angle_tolerance (float): Tangents with angles below this value will be considered flat.
+        value_tolerance (float): Neighboring values that fall within this tolerance will be considered matching.
+        with_undo (bool): performs the operation with undo capability, otherwise proceed with OpenMaya cutting of keys.
+        dry_run (bool): only report the keys that would be removed.
+
+    Returns:
+        (dict): curves: {curve name: removed key indices}, keys_total, keys_removed, collection_time,
+                mask_time, deletion_time, total_time, dry_run.
+
+    """
     start_time = time.time()
-    deletion = {}
-    for anim_curve_obj in anim_node_iter:
-        anim_curve_node = OpenMaya.MFnDependencyNode(anim_curve_obj).name()
-        anim_fn = OpenMayaAnim.MFnAnimCurve(anim_curve_obj)
-        number_of_keys = anim_fn.numKeys()
+    curve_arrays = get_prune_curve_arrays(anim_curve_objects)
+    collection_time = time.time() - start_time
 
-        # get the data of this curve node
-        # key_values = cmds.keyframe(anim_curve_node, query=True, valueChange=True)
-        # in_angles = cmds.keyTangent(anim_curve_node, query=True, inAngle=True)
-        # out_angles = cmds.keyTangent(anim_curve_node, query=True, outAngle=True)
-        # out_tangent_names = cmds.keyTangent(anim_curve_node, query=True, outTangentType=True)
+    start_time = time.time()
+    prune_mask = get_prune_mask(curve_arrays, angle_tolerance=angle_tolerance, value_tolerance=value_tolerance)
+    delete_indices = get_prune_indices(curve_arrays, prune_mask)
+    mask_time = time.time() - start_time
 
-        in_angles = get_anim_curve_in_angles_from_obj(anim_curve_obj)
-        out_angles = get_anim_curve_out_angles_from_obj(anim_curve_obj)
-        out_tangent_names = get_anim_curve_out_tangent_names_from_obj(anim_curve_obj)
-        key_values = get_anim_curve_values_from_obj(anim_curve_obj)
-        key_times = get_anim_curve_times_from_obj(anim_curve_obj)
-        deletion[anim_curve_node] = {}
+    start_time = time.time()
+    if not dry_run:
+        cut_keys_batch(delete_indices, curve_arrays['objects'], with_undo=with_undo)
+    deletion_time = time.time() - start_time
+
+    return {
+        'curves': delete_indices,
+        'keys_total': len(curve_arrays['values']),
+        'keys_removed': sum(map(len, delete_indices.values())),
+        'collection_time': collection_time,
+        'mask_time': mask_time,
+        'deletion_time': deletion_time,
+        'total_time': collection_time + mask_time + deletion_time,
+        'dry_run': dry_run,
+    }
+
+
+def get_prune_curve_arrays(anim_curve_objects):
+    """Loads the keys of every animation curve into flat arrays, in a single pass per curve.
+    Curve key ranges are stored as [start, end) offsets into the flat arrays.
 
-        # make absolute values of in angle and out angle
-        in_angles = tuple(map(abs, in_angles))
-        out_angles = tuple(map(abs, out_angles))
+    Args:
+        anim_curve_objects (iterable): OpenMaya.MObject animation curve nodes.
 
-        if number_of_keys == 1:
-            continue
+    Returns:
+        (dict): names, objects, starts, ends, values, in_angles, out_angles, stepped.
+
+    """
+    curve_arrays = {'names': [], 'objects': {}, 'starts': [], 'ends': [],
+                    'values': [], 'in_angles': [], 'out_angles': [], 'stepped': []}
+    values = curve_arrays['values']
+    in_angles = curve_arrays['in_angles']
+    out_angles = curve_arrays['out_angles']
+    stepped = curve_arrays['stepped']
+
+    weight_ptr = pointerUtils.create_double_ptr()
+    m_angle = OpenMaya.MAngle()
+    step_type = OpenMayaAnim.MFnAnimCurve.kTangentStep
+    for anim_curve_obj in anim_curve_objects:
+        anim_fn = OpenMayaAnim.MFnAnimCurve(anim_curve_obj)
+        anim_curve_node = anim_fn.name()
+        is_angle = ANIMATION_CURVE_STR_DICT.get(anim_fn.typeName()) == 'angle'
+        number_of_keys = anim_fn.numKeys()
 
-        delete_indices = ()
+        curve_arrays['names'].append(anim_curve_node)
+        curve_arrays['objects'][anim_curve_node] = anim_curve_obj
+        curve_arrays['starts'].append(len(values))
         for idx in range(number_of_keys):
-            # as long as the current keyframe is between 0, and less than the total number of keyframes, continue
-            if idx == 0 or idx == (number_of_keys - 1):
-                continue
-
-            # if the index exceeds the length of keys, the next keyframe will be the current key.
-            next_index = idx + 1
-            prev_index = idx - 1
-
-            # get the outTangentType of the previous frame, the current frame, and the next frame.
-            # check the out tangents for type OpenMayaAnim.MItKeyframe.kTangentStep
-            prev_out_tangent = out_tangent_names[prev_index]
-            curr_out_tangent = out_tangent_names[idx]
-            next_out_tangent = out_tangent_names[next_index]
-
-            prev_out_angle = out_angles[prev_index]
-            curr_in_angle = in_angles[idx]
-            curr_out_angle = out_angles[idx]
-            next_in_angle = in_angles[next_index]
-
-            stepped = (prev_out_tangent == "step" and
-                       curr_out_tangent == "step" and
-                       next_out_tangent == "step")
-
-            # check for one of the following conditions (1 or 2) is true:
-            # 1)  $stepped is true (1)
-            # 2)  outAngle of the previous frame is less than angleTol
-            # &   inAngle of the current frame is less than angleTol
-            # &   outAngle of the current frame is less than angleTol
-            # &   inAngle of the next frame is less than angleTol
-            if (stepped or
-                    prev_out_angle < angle_tolerance and
-                    curr_in_angle < angle_tolerance and
-                    curr_out_angle < angle_tolerance and
-                    next_in_angle < angle_tolerance):
-                # get the difference of the current value against the previous value
-                prev_value_diff = abs(key_values[prev_index] - key_values[idx])
-                # get the difference of the next value against the previous value
-                next_value_diff = abs(key_values[next_index] - key_values[idx])
-
-                # If one of the following (1 or 2) conditions is true, set $deleteIndex:
-                # 1)  $stepped is true (1)
-                # &   $prevValDif is less than valueTol
-                # 2)  $stepped is false (0)
-                # &   $prevValDif is larger than valueTol
-                # &   $nextValDif is larger than $valueTol
-                if (stepped and
-                        prev_value_diff < value_tolerance or
-                    not stepped and
-                        prev_value_diff < value_tolerance and
-                        next_value_diff < value_tolerance):
-                    delete_indices += idx,
-                    deletion[anim_curve_node][key_times] = idx
-
-        end_time = time.time()
-        data_collection_time += end_time - start_time
-
-        # remove the keyframes
-        start_time = time.time()
-        delete_key_length = len(delete_indices)
-        obj_key_length += delete_key_length
-        total_keys_deleted += delete_key_length
-        if delete_key_length:
-            # keys are automatically sorted at removal so we need to reverse our sorted delete_indices for deletion
-            if with_undo:
-                anim_curve_name = OpenMaya.MFnDependencyNode(anim_curve_obj).name()
-                # it's faster to remove keys on a massive scale using MEL
-                mel_str = """cutKey -clear"""
-                for idx in reversed(delete_indices):
-                    # cmds.cutKey(anim_curve_name, index=(idx, idx), clear=True)
-                    mel_str += " -index {} ".format(idx)
-                mel_str += anim_curve_name
-                mel.eval(mel_str)
+            # apply radians to degrees conversion
+            if is_angle:
+                values.append(RADIANS_2_DEGREES * anim_fn.value(idx))
             else:
-                for idx in reversed(delete_indices):
-                    anim_fn.remove(idx)
-        end_time = time.time()
-        deletion_time += end_time - start_time
-    print(deletion)
-    print("[PruneDataCollection] :: Took {} seconds.".format(data_collection_time))
-    print("[KeyDeletion] :: Took {} seconds.".format(deletion_time))
-    print("[PruneKeyframes] :: Total time elapsed: {}.".format(data_collection_time + deletion_time))
-    print("[PruneKeyframes] :: {} Keyframes deleted from: {}.".format(obj_key_length, transform_name))
+                values.append(anim_fn.value(idx))
+            # True: InTangent, False: OutTangent
+            anim_fn.getTangent(idx, m_angle, weight_ptr, True)
+            in_angles.append(abs(m_angle.asDegrees()))
+            anim_fn.getTangent(idx, m_angle, weight_ptr, False)
+            out_angles.append(abs(m_angle.asDegrees()))
+            stepped.append(anim_fn.outTangentType(idx) == step_type)
+        curve_arrays['ends'].append(len(values))
+    return curve_arrays
+
+
+def get_prune_mask(curve_arrays, angle_tolerance=0.001, value_tolerance=0.001):
+    """Computes which keys are redundant, for all the keys of all the curves at once.
+    A key is redundant when it and its neighbors are stepped with the previous value matching,
+    or when the surrounding tangents are flat with both neighboring values matching.
+    The first and last keys of each curve are always kept.
+
+    Args:
+        curve_arrays (dict): flat curve arrays from get_prune_curve_arrays.
+        angle_tolerance (float): Tangents with angles below this value will be considered flat.
+        value_tolerance (float): Neighboring values that fall within this tolerance will be considered matching.
+
+    Returns:
+        (list): one bool per key, True when the key can be removed.
+
+    """
+    values = curve_arrays['values']
+    in_angles = curve_arrays['in_angles']
+    out_angles = curve_arrays['out_angles']
+    step = curve_arrays['stepped']
+    number_of_keys = len(values)
+    if number_of_keys < 3:
+        return [False] * number_of_keys
+
+    # the previous, current and next key of every interior key, as shifted views of the flat arrays
+    stepped = [p and c and n for p, c, n in zip(step, step[1:], step[2:])]
+    flat = [p < angle_tolerance and ci < angle_tolerance and co < angle_tolerance and n < angle_tolerance
+            for p, ci, co, n in zip(out_angles, in_angles[1:], out_angles[1:], in_angles[2:])]
+    prev_match = [abs(p - c) < value_tolerance for p, c in zip(values, values[1:])]
+    next_match = prev_match[1:]
+
+    prune_mask = [False]
+    prune_mask.extend((s and pm) or (f and not s and pm and nm)
+                      for s, f, pm, nm in zip(stepped, flat, prev_match, next_match))
+    prune_mask.append(False)
+
+    # keep the curve end keys, the shifted views cross curve boundaries there
+    for start, end in zip(curve_arrays['starts'], curve_arrays['ends']):
+        if end > start:
+            prune_mask[start] = False
+            prune_mask[end - 1] = False
+    return prune_mask
+
+
+def get_prune_indices(curve_arrays, prune_mask):
+    """Splits the flat prune mask back into key indices per curve.
+
+    Args:
+        curve_arrays (dict): flat curve arrays from get_prune_curve_arrays.
+        prune_mask (list): one bool per key from get_prune_mask.
+
+    Returns:
+        (dict): {curve name: tuple of key indices to remove}, only curves with removals.
+
+    """
+    delete_indices = {}
+    for anim_curve_node, start, end in zip(curve_arrays['names'], curve_arrays['starts'], curve_arrays['ends']):
+        indices = tuple(idx - start for idx in range(start, end) if prune_mask[idx])
+        if indices:
+            delete_indices[anim_curve_node] = indices
+    return delete_indices
+
+
+def cut_keys_batch(delete_indices, anim_curve_objects=None, with_undo=True):
+    """Removes the keys by index from the curves.
+    With undo, curves sharing the same key indices are cut together in one cutKey command.
+
+    Args:
+        delete_indices (dict): {curve name: key indices to remove}.
+        anim_curve_objects (dict): {curve name: OpenMaya.MObject}, used when not cutting with undo.
+        with_undo (bool): performs the operation with undo capability, otherwise proceed with OpenMaya cutting of keys.
+
+    Returns:
+        (int): number of commands or curves processed.
+
+    """
+    if with_undo:
+        # group the curves by their index set so one command can clear all of them
+        index_groups = {}
+        for anim_curve_node, indices in delete_indices.items():
+            index_groups.setdefault(tuple(sorted(indices)), []).append(anim_curve_node)
+        for indices, anim_curve_nodes in index_groups.items():
+            # it's faster to remove keys on a massive scale using MEL
+            mel_str = "cutKey -clear"
+            for idx in indices:
+                mel_str += " -index {}".format(idx)
+            mel_str += " " + " ".join(anim_curve_nodes)
+            mel.eval(mel_str)
+        return len(index_groups)
+
+    for anim_curve_node, indices in delete_indices.items():
+        if anim_curve_objects and anim_curve_node in anim_curve_objects:
+            anim_curve_obj = anim_curve_objects[anim_curve_node]
+        else:
+            anim_curve_obj = get_m_object(anim_curve_node)
+        anim_fn = OpenMayaAnim.MFnAnimCurve(anim_curve_obj)
+        # keys are automatically sorted at removal so we need to reverse our sorted indices for deletion
+        for idx in sorted(indices, reverse=True):
+            anim_fn.remove(idx)
+    return len(delete_indices)
+
+
+def print_prune_report(report, label="", verbose=False):
+    """Prints the prune report summary.
+
+    Args:
+        report (dict): prune report from prune_keyframes_from_curves.
+        label (str): name printed with the totals.
+        verbose (bool): print the removed key count of every curve.
+
+    Returns:
+
+    """
+    if verbose or report['dry_run']:
+        for anim_curve_node in sorted(report['curves']):
+            print("[PruneKeyframes] :: {}: {} keys.".format(anim_curve_node, len(report['curves'][anim_curve_node])))
+    print("[PruneDataCollection] :: Took {} seconds.".format(report['collection_time']))
+    print("[PruneMask] :: Took {} seconds.".format(report['mask_time']))
+    print("[KeyDeletion] :: Took {} seconds.".format(report['deletion_time']))
+    print("[PruneKeyframes] :: Total time elapsed: {}.".format(report['total_time']))
+    if report['dry_run']:
+        print("[PruneKeyframes] :: Dry run, {} of {} Keyframes would be deleted from: {}.".format(
+            report['keys_removed'], report['keys_total'], label))
+    else:
+        print("[PruneKeyframes] :: {} Keyframes deleted from: {}.".format(report['keys_removed'], label))
 
 
 def get_anim_curve_out_angles_from_obj(anim_curve_obj, as_degrees=True):